@@ -4,28 +4,37 @@ from __future__ import annotations
 
 from . import group
 
+import asyncio
+from datetime import timedelta
+import importlib
 import logging
+import os
+import time
+from types import ModuleType
 
 import voluptuous as vol
 
-from homeassistant.components import websocket_api
-from homeassistant.components.utility_meter.const import (
-    DATA_TARIFF_SENSORS,
-    DATA_UTILITY,
-)
 from homeassistant.config_entries import SOURCE_IMPORT, ConfigEntry
 from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    EVENT_CORE_CONFIG_UPDATE,
     Platform,
     ATTR_ENTITY_PICTURE,
     ATTR_ICON,
     ATTR_NAME,
     ATTR_UNIT_OF_MEASUREMENT,
-    STATE_OK,
-    STATE_PROBLEM,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
 )
-from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.core import (
+    Event,
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import (
     config_validation as cv,
     device_registry as dr,
@@ -33,44 +42,77 @@ from homeassistant.helpers import (
 )
 from homeassistant.helpers.entity import Entity, async_generate_entity_id
 from homeassistant.helpers.entity_component import EntityComponent
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.start import async_at_started
+from homeassistant.util import dt as dt_util
 
 from .const import (
     ATTR_CONDUCTIVITY,
     ATTR_CURRENT,
+    ATTR_DAYS_UNTIL_WATERING,
     ATTR_DLI,
+    ATTR_FILE,
     ATTR_HUMIDITY,
     ATTR_ILLUMINANCE,
+    ATTR_LAST_WATERED,
     ATTR_LIMITS,
     ATTR_MAX,
     ATTR_METERS,
     ATTR_MIN,
     ATTR_MOISTURE,
     ATTR_PLANT,
+    ATTR_PROFILE,
     ATTR_SENSOR,
     ATTR_SENSORS,
     ATTR_SPECIES,
     ATTR_TEMPERATURE,
     ATTR_THRESHOLDS,
+    DATA_COMPONENT,
+    DATA_ENGINE,
+    DATA_GROUPS,
+    DATA_INSTRUMENTATION,
+    DATA_LOAD_GENERATOR,
+    DATA_PROFILES,
+    DATA_STATISTICS,
+    DATA_THRESHOLDS,
+    EVENT_STATUS_CHANGED,
+    DATA_TIMERS,
+    DEFAULT_STALE_TIMEOUT,
     DATA_SOURCE,
     DOMAIN,
     DOMAIN_PLANTBOOK,
+    EVALUATION_INTERVAL,
+    FLOW_AIR_TEMPERATURE_TRIGGER,
+    FLOW_CACHE_IMAGE,
     FLOW_CONDUCTIVITY_TRIGGER,
     FLOW_DLI_TRIGGER,
     FLOW_HUMIDITY_TRIGGER,
     FLOW_ILLUMINANCE_TRIGGER,
     FLOW_MOISTURE_TRIGGER,
     FLOW_PLANT_INFO,
+    FLOW_PROBLEM_DELAY,
+    FLOW_RECOVERY_DELAY,
+    FLOW_STALE_TIMEOUT,
     FLOW_TEMPERATURE_TRIGGER,
     OPB_DISPLAY_PID,
+    PLANT_LIMITS,
     READING_CONDUCTIVITY,
     READING_DLI,
     READING_HUMIDITY,
     READING_ILLUMINANCE,
     READING_MOISTURE,
     READING_TEMPERATURE,
+    SERVICE_DELETE_PROFILE,
+    SERVICE_DETECT_SLOW_CALLS,
+    SERVICE_DUMP_PROFILE,
+    SERVICE_IMPORT_PLANTS,
+    SERVICE_LINK_PROFILE,
     SERVICE_REPLACE_SENSOR,
-    STATE_HIGH,
-    STATE_LOW,
+    SERVICE_SET_INSTRUMENTATION,
+    SERVICE_SET_PROFILE,
+    SERVICE_SET_THRESHOLDS,
+    SERVICE_START_LOAD_GENERATOR,
+    SERVICE_STOP_LOAD_GENERATOR,
     ATTR_AIR_TEMPERATURE,
     ICON_AIR_TEMPERATURE,
     READING_AIR_TEMPERATURE,
@@ -79,42 +121,365 @@ from .const import (
     DEFAULT_MIN_AIR_TEMPERATURE,
     DEFAULT_MAX_AIR_TEMPERATURE,
 )
+from .number import async_convert_temperature_thresholds, async_set_thresholds
+from .plant_forecast import DryDownModel
+from .plant_groups import PlantGroups
 from .plant_helpers import PlantHelper
+from .plant_instrumentation import (
+    METRIC_EVALUATION,
+    PlantInstrumentation,
+    instrumented,
+)
+from .plant_profiles import PlantProfiles
+from .plant_storage import PlantThresholdStore
+from .plant_timers import PlantTimers
+from .plant_websocket import async_setup_websocket
+from .plant_state import METRIC_COUNT, PlantStatusEngine, snapshot_status
+from .plant_statistics import PlantStatistics
 
 _LOGGER = logging.getLogger(__name__)
 PLATFORMS = [Platform.NUMBER, Platform.SENSOR]
 
+# The metrics with a status attribute on the plant, in this order
+STATUS_METRICS = (
+    ATTR_MOISTURE,
+    ATTR_TEMPERATURE,
+    ATTR_CONDUCTIVITY,
+    ATTR_ILLUMINANCE,
+    ATTR_HUMIDITY,
+    ATTR_DLI,
+    ATTR_AIR_TEMPERATURE,
+)
+
 # Use this during testing to generate some dummy-sensors
 # to provide random readings for temperature, moisture etc.
 #
 SETUP_DUMMY_SENSORS = False
 USE_DUMMY_SENSORS = False
 
-# Removed.
-# Have not been used for a long time
-#
-# async def async_setup(hass: HomeAssistant, config: dict):
-#     """
-#     Set up the plant component
-#
-#     Configuration.yaml is no longer used.
-#     This function only tries to migrate the legacy config.
-#     """
-#     if config.get(DOMAIN):
-#         # Only import if we haven't before.
-#         config_entry = _async_find_matching_config_entry(hass)
-#         if not config_entry:
-#             _LOGGER.debug("Old setup - with config: %s", config[DOMAIN])
-#             for plant in config[DOMAIN]:
-#                 if plant != DOMAIN_PLANTBOOK:
-#                     _LOGGER.info("Migrating plant: %s", plant)
-#                     await async_migrate_plant(hass, plant, config[DOMAIN][plant])
-#         else:
-#             _LOGGER.warning(
-#                 "Config already imported. Please delete all your %s related config from configuration.yaml",
-#                 DOMAIN,
-#             )
-#     return True
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+IMPORT_PLANTS_SCHEMA = vol.Schema({vol.Required(ATTR_FILE): cv.string})
+START_LOAD_GENERATOR_SCHEMA = vol.Schema(
+    {
+        vol.Required("plants"): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional("rate", default=1): vol.All(
+            vol.Coerce(float), vol.Range(min=0.001)
+        ),
+        vol.Optional("jitter", default=0): vol.All(
+            vol.Coerce(float), vol.Range(min=0, max=1)
+        ),
+        vol.Optional("dropout", default=0): vol.All(
+            vol.Coerce(float), vol.Range(min=0, max=1)
+        ),
+        vol.Optional("time_scale", default=1): vol.All(
+            vol.Coerce(float), vol.Range(min=1)
+        ),
+        vol.Optional("create_plants", default=True): cv.boolean,
+    }
+)
+STOP_LOAD_GENERATOR_SCHEMA = vol.Schema(
+    {vol.Optional("remove_plants", default=False): cv.boolean}
+)
+SET_INSTRUMENTATION_SCHEMA = vol.Schema(
+    {
+        vol.Required("enabled"): cv.boolean,
+        vol.Optional("reset", default=False): cv.boolean,
+    }
+)
+DETECT_SLOW_CALLS_SCHEMA = vol.Schema(
+    {
+        vol.Required("threshold"): vol.All(vol.Coerce(float), vol.Range(min=0)),
+        vol.Optional("reset", default=False): cv.boolean,
+    }
+)
+DUMP_PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional("seconds", default=60): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=3600)
+        ),
+        vol.Optional(ATTR_FILE): cv.string,
+    }
+)
+
+LIMITS_SCHEMA = vol.Schema({vol.In(PLANT_LIMITS): vol.Coerce(float)})
+SET_PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_PROFILE): cv.string,
+        vol.Optional(ATTR_LIMITS, default={}): LIMITS_SCHEMA,
+        vol.Optional("from_plant"): cv.entity_id,
+        vol.Optional("replace", default=False): cv.boolean,
+    }
+)
+DELETE_PROFILE_SCHEMA = vol.Schema({vol.Required(ATTR_PROFILE): cv.string})
+LINK_PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_ENTITY_ID): cv.entity_ids,
+        vol.Optional(ATTR_PROFILE): vol.Any(None, cv.string),
+        vol.Optional("keep_overrides", default=False): cv.boolean,
+    }
+)
+SET_THRESHOLDS_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional(ATTR_ENTITY_ID): cv.entity_ids,
+            vol.Optional(ATTR_LIMITS, default={}): LIMITS_SCHEMA,
+            vol.Optional("plants"): {cv.entity_id: LIMITS_SCHEMA},
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_ENTITY_ID, "plants"),
+)
+
+
+@callback
+def async_get_plants(hass: HomeAssistant, entity_ids: list[str]) -> list[PlantDevice]:
+    """The plants with the given entity_ids"""
+    plants = {
+        data[ATTR_PLANT].entity_id: data[ATTR_PLANT]
+        for data in hass.data.get(DOMAIN, {}).values()
+        if ATTR_PLANT in data
+    }
+    missing = [entity_id for entity_id in entity_ids if entity_id not in plants]
+    if missing:
+        raise HomeAssistantError(f"Plants not found: {', '.join(missing)}")
+    return [plants[entity_id] for entity_id in entity_ids]
+
+
+async def async_setup(hass: HomeAssistant, config: dict) -> bool:
+    """
+    Set up the plant component
+
+    Configuration.yaml is no longer used.
+    This only sets up the services that are not tied to a plant.
+    """
+
+    # One component for all plant devices.  Plants are added to it
+    # in async_setup_entry and removed in async_unload_entry.
+    hass.data[DATA_COMPONENT] = EntityComponent(_LOGGER, DOMAIN, hass)
+
+    # The plants are not polled one by one, but evaluated all at once
+    engine = PlantStatusEngine(hass)
+    hass.data[DATA_ENGINE] = engine
+    async_track_time_interval(
+        hass, engine.async_evaluate_all, timedelta(seconds=EVALUATION_INTERVAL)
+    )
+
+    # One timer for the delayed work of all plants
+    hass.data[DATA_TIMERS] = PlantTimers(hass)
+
+    # Aggregate status of the plants per area and label
+    groups = PlantGroups(hass)
+    hass.data[DATA_GROUPS] = groups
+    groups.async_setup()
+
+    # Hourly long-term statistics of all plants
+    statistics = PlantStatistics(hass)
+    hass.data[DATA_STATISTICS] = statistics
+    statistics.async_start()
+
+    # Loaded before any plant is set up, as the plants take their thresholds
+    # from these
+    profiles = PlantProfiles(hass)
+    thresholds = PlantThresholdStore(hass)
+    await asyncio.gather(profiles.async_load(), thresholds.async_load())
+    hass.data[DATA_PROFILES] = profiles
+    hass.data[DATA_THRESHOLDS] = thresholds
+
+    @callback
+    def _async_core_config_updated(_: Event) -> None:
+        """Convert all temperature thresholds at once if the unit changed"""
+        started = time.perf_counter()
+        unit = hass.config.units.temperature_unit
+        profiles.async_convert_temperature(unit)
+        converted = async_convert_temperature_thresholds(hass, unit)
+        if not converted:
+            return
+        engine.async_evaluate_all()
+        _LOGGER.info(
+            "Converted %s temperature thresholds to %s in %.3fs",
+            converted,
+            unit,
+            time.perf_counter() - started,
+        )
+
+    hass.bus.async_listen(EVENT_CORE_CONFIG_UPDATE, _async_core_config_updated)
+
+    async def set_profile(call: ServiceCall) -> ServiceResponse:
+        """Create or change a threshold profile"""
+        plant = None
+        if "from_plant" in call.data:
+            plant = async_get_plants(hass, [call.data["from_plant"]])[0]
+        return profiles.async_set_profile(
+            call.data[ATTR_PROFILE],
+            call.data[ATTR_LIMITS],
+            replace=call.data["replace"],
+            plant=plant,
+        )
+
+    async def delete_profile(call: ServiceCall) -> None:
+        """Remove a threshold profile"""
+        profiles.async_delete_profile(call.data[ATTR_PROFILE])
+
+    async def link_profile(call: ServiceCall) -> None:
+        """Link plants to a threshold profile"""
+        plants = async_get_plants(hass, call.data[ATTR_ENTITY_ID])
+        profiles.async_link(
+            plants, call.data.get(ATTR_PROFILE), call.data["keep_overrides"]
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_PROFILE,
+        set_profile,
+        schema=SET_PROFILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_DELETE_PROFILE,
+        delete_profile,
+        schema=DELETE_PROFILE_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_LINK_PROFILE,
+        link_profile,
+        schema=LINK_PROFILE_SCHEMA,
+    )
+
+    async def set_thresholds(call: ServiceCall) -> ServiceResponse:
+        """Set many thresholds of many plants at once"""
+        changes = {
+            plant: dict(call.data[ATTR_LIMITS])
+            for plant in async_get_plants(hass, call.data.get(ATTR_ENTITY_ID, []))
+        }
+        plants = call.data.get("plants", {})
+        for plant in async_get_plants(hass, list(plants)):
+            changes.setdefault(plant, {}).update(plants[plant.entity_id])
+        return async_set_thresholds(hass, changes)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_THRESHOLDS,
+        set_thresholds,
+        schema=SET_THRESHOLDS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def import_plants(call: ServiceCall) -> ServiceResponse:
+        """Import plants from a YAML or CSV file"""
+        plant_import = await _async_import_module(hass, "plant_import")
+        return await plant_import.async_import_plants_from_file(
+            hass, call.data[ATTR_FILE]
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_IMPORT_PLANTS,
+        import_plants,
+        schema=IMPORT_PLANTS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def start_load_generator(call: ServiceCall) -> ServiceResponse:
+        """Start feeding virtual plants with synthetic readings"""
+        if hass.data.get(DATA_LOAD_GENERATOR) is not None:
+            hass.data[DATA_LOAD_GENERATOR].async_stop()
+        plant_loadgen = await _async_import_module(hass, "plant_loadgen")
+        generator = plant_loadgen.PlantLoadGenerator(
+            hass,
+            plants=call.data["plants"],
+            rate=call.data["rate"],
+            jitter=call.data["jitter"],
+            dropout=call.data["dropout"],
+            time_scale=call.data["time_scale"],
+        )
+        hass.data[DATA_LOAD_GENERATOR] = generator
+        generator.async_start()
+        if call.data["create_plants"]:
+            return await generator.async_create_plants()
+        return None
+
+    async def stop_load_generator(call: ServiceCall) -> ServiceResponse:
+        """Stop the load generator and report what it did"""
+        generator = hass.data.pop(DATA_LOAD_GENERATOR, None)
+        if generator is None:
+            return None
+        statistics = generator.async_stop()
+        _LOGGER.info("Load generator stopped: %s", statistics)
+        if call.data["remove_plants"]:
+            await generator.async_remove()
+        return statistics
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_START_LOAD_GENERATOR,
+        start_load_generator,
+        schema=START_LOAD_GENERATOR_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_STOP_LOAD_GENERATOR,
+        stop_load_generator,
+        schema=STOP_LOAD_GENERATOR_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    instrumentation = PlantInstrumentation(hass)
+    hass.data[DATA_INSTRUMENTATION] = instrumentation
+
+    async def set_instrumentation(call: ServiceCall) -> None:
+        """Turn the instrumentation on or off"""
+        instrumentation.async_enable(call.data["enabled"], call.data["reset"])
+
+    async def dump_profile(call: ServiceCall) -> ServiceResponse:
+        """Profile Home Assistant for a while and write the stats to a file"""
+        path = call.data.get(ATTR_FILE)
+        if path is None:
+            path = f"{DOMAIN}_profile_{int(time.time())}.prof"
+        if not os.path.isabs(path):
+            path = hass.config.path(path)
+        if not hass.config.is_allowed_path(path):
+            raise HomeAssistantError(f"Access to {path} is not allowed")
+        await instrumentation.async_profile(call.data["seconds"], path)
+        return {ATTR_FILE: path}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_INSTRUMENTATION,
+        set_instrumentation,
+        schema=SET_INSTRUMENTATION_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_DUMP_PROFILE,
+        dump_profile,
+        schema=DUMP_PROFILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def detect_slow_calls(call: ServiceCall) -> None:
+        """Log the callbacks that take longer than the threshold"""
+        instrumentation.async_detect_slow_calls(
+            call.data["threshold"] / 1000, call.data["reset"]
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_DETECT_SLOW_CALLS,
+        detect_slow_calls,
+        schema=DETECT_SLOW_CALLS_SCHEMA,
+    )
+    async_setup_websocket(hass)
+    return True
+
+
+async def _async_import_module(hass: HomeAssistant, name: str) -> ModuleType:
+    """Import a module that is only needed by a few services, when it is used"""
+    return await hass.async_add_import_executor_job(
+        importlib.import_module, f"{__name__}.{name}"
+    )
 
 
 @callback
@@ -128,15 +493,8 @@ def _async_find_matching_config_entry(hass: HomeAssistant) -> ConfigEntry | None
 async def async_migrate_plant(hass: HomeAssistant, plant_id: str, config: dict) -> None:
     """Try to migrate the config from yaml"""
 
-    if ATTR_NAME not in config:
-        config[ATTR_NAME] = plant_id.replace("_", " ").capitalize()
-    plant_helper = PlantHelper(hass)
-    plant_config = await plant_helper.generate_configentry(config=config)
-    hass.async_create_task(
-        hass.config_entries.flow.async_init(
-            DOMAIN, context={"source": SOURCE_IMPORT}, data=plant_config
-        )
-    )
+    plant_import = await _async_import_module(hass, "plant_import")
+    await plant_import.async_import_plants(hass, {plant_id: config})
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
@@ -147,34 +505,30 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
 
     hass.data[DOMAIN].setdefault(entry.entry_id, {})
     _LOGGER.debug("Setting up config entry %s: %s", entry.entry_id, entry)
+    setup_started = time.monotonic()
 
     plant = PlantDevice(hass, entry)
     hass.data[DOMAIN][entry.entry_id][ATTR_PLANT] = plant
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    platforms_done = time.monotonic()
 
     plant_entities = [
         plant,
     ]
 
     # Add all the entities to Hass
-    component = EntityComponent(_LOGGER, DOMAIN, hass)
-    await component.async_add_entities(plant_entities)
+    await hass.data[DATA_COMPONENT].async_add_entities(plant_entities)
+    plant_done = time.monotonic()
 
     # Add the rest of the entities to device registry together with plant
     device_id = plant.device_id
-    await _plant_add_to_device_registry(hass, plant_entities, device_id)
+    _plant_add_to_device_registry(hass, plant_entities, device_id)
+    registry_done = time.monotonic()
     # await _plant_add_to_device_registry(hass, plant.integral_entities, device_id)
     # await _plant_add_to_device_registry(hass, plant.threshold_entities, device_id)
     # await _plant_add_to_device_registry(hass, plant.meter_entities, device_id)
 
-    #
-    # Set up utility sensor
-    hass.data.setdefault(DATA_UTILITY, {})
-    hass.data[DATA_UTILITY].setdefault(entry.entry_id, {})
-    hass.data[DATA_UTILITY][entry.entry_id].setdefault(DATA_TARIFF_SENSORS, [])
-    hass.data[DATA_UTILITY][entry.entry_id][DATA_TARIFF_SENSORS].append(plant.dli)
-
     #
     # Service call to replace sensors
     async def replace_sensor(call: ServiceCall) -> None:
@@ -232,48 +586,48 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
         return
 
     hass.services.async_register(DOMAIN, SERVICE_REPLACE_SENSOR, replace_sensor)
-    websocket_api.async_register_command(hass, ws_get_info)
-    plant.async_schedule_update_ha_state(True)
-
-    # Lets add the dummy sensors automatically if we are testing stuff
-    if USE_DUMMY_SENSORS is True:
-        for sensor in plant.meter_entities:
-            if sensor.external_sensor is None:
-                await hass.services.async_call(
-                    domain=DOMAIN,
-                    service=SERVICE_REPLACE_SENSOR,
-                    service_data={
-                        "meter_entity": sensor.entity_id,
-                        "new_sensor": sensor.entity_id.replace(
-                            "sensor.", "sensor.dummy_"
-                        ),
-                    },
-                    blocking=False,
-                    limit=30,
-                )
 
+    # The first evaluation of the plant, the image cache and the dummy sensors
+    # are not needed to get HA up and running, so wait until HA has started
+    entry.async_on_unload(async_at_started(hass, plant.async_started))
+
+    _LOGGER.debug(
+        "Setup of %s took %.3fs (platforms: %.3fs, plant: %.3fs, registry: %.3fs)",
+        entry.title,
+        registry_done - setup_started,
+        platforms_done - setup_started,
+        plant_done - platforms_done,
+        registry_done - plant_done,
+    )
     return True
 
 
-async def _plant_add_to_device_registry(
+@callback
+def _plant_add_to_device_registry(
     hass: HomeAssistant, plant_entities: list[Entity], device_id: str
 ) -> None:
     """Add all related entities to the correct device_id"""
 
     # There must be a better way to do this, but I just can't find a way to set the
     # device_id when adding the entities.
+    # Only touch the entities that are not already linked to the device, so the
+    # registry is not rewritten on every restart.
     erreg = er.async_get(hass)
     for entity in plant_entities:
+        if entity.registry_entry.device_id == device_id:
+            continue
         erreg.async_update_entity(entity.registry_entry.entity_id, device_id=device_id)
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    unload_ok = await hass.config_entries.async_forward_entry_unload(entry, PLATFORMS)
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
+        plant = hass.data[DOMAIN].get(entry.entry_id, {}).get(ATTR_PLANT)
+        if plant is not None:
+            await hass.data[DATA_COMPONENT].async_remove_entity(plant.entity_id)
         hass.data[DOMAIN].pop(entry.entry_id)
-        hass.data[DATA_UTILITY].pop(entry.entry_id)
         _LOGGER.info(hass.data[DOMAIN])
         for entry_id in list(hass.data[DOMAIN].keys()):
             if len(hass.data[DOMAIN][entry_id]) == 0:
@@ -286,47 +640,27 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
-@websocket_api.websocket_command(
-    {
-        vol.Required("type"): "plant/get_info",
-        vol.Required("entity_id"): str,
-    }
-)
-@callback
-def ws_get_info(
-    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
-) -> None:
-    """Handle the websocket command."""
-    # _LOGGER.debug("Got websocket request: %s", msg)
-
-    if DOMAIN not in hass.data:
-        connection.send_error(
-            msg["id"], "domain_not_found", f"Domain {DOMAIN} not found"
-        )
-        return
-
-    for key in hass.data[DOMAIN]:
-        if not ATTR_PLANT in hass.data[DOMAIN][key]:
-            continue
-        plant_entity = hass.data[DOMAIN][key][ATTR_PLANT]
-        if plant_entity.entity_id == msg["entity_id"]:
-            # _LOGGER.debug("Sending websocket response: %s", plant_entity.websocket_info)
-            try:
-                connection.send_result(
-                    msg["id"], {"result": plant_entity.websocket_info}
-                )
-            except ValueError as e:
-                _LOGGER.warning(e)
-            return
-    connection.send_error(
-        msg["id"], "entity_not_found", f"Entity {msg['entity_id']} not found"
-    )
-    return
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Forget the profile and thresholds of a plant that is removed"""
+    hass.data[DATA_PROFILES].async_remove_plant(entry.entry_id)
+    hass.data[DATA_THRESHOLDS].async_remove_plant(entry.entry_id)
 
 
 class PlantDevice(Entity):
     """Base device for plants"""
 
+    # All plants are evaluated together by the status engine
+    _attr_should_poll = False
+    # Attributes that are not worth keeping in the history
+    _unrecorded_attributes = frozenset(
+        {
+            ATTR_SPECIES,
+            f"{ATTR_SPECIES}_original",
+            ATTR_PROFILE,
+            ATTR_DAYS_UNTIL_WATERING,
+        }
+    )
+
     def __init__(self, hass: HomeAssistant, config: ConfigEntry) -> None:
         """Initialize the Plant component."""
         self._config = config
@@ -359,6 +693,7 @@ class PlantDevice(Entity):
 
         self.plant_complete = False
         self._device_id = None
+        self._registry_info = None
 
         self._check_days = None
 
@@ -385,18 +720,27 @@ class PlantDevice(Entity):
         self.sensor_air_temperature = None
 
         self.dli = None
-        self.micro_dli = None
-        self.ppfd = None
-        self.total_integral = None
 
-        self.conductivity_status = None
-        self.illuminance_status = None
-        self.moisture_status = None
-        self.temperature_status = None
-        self.humidity_status = None
-        self.dli_status = None
-        self.air_temperature_status = None
+        # Current values, thresholds and status of each metric, kept
+        # together with those of all the other plants
+        self._engine = hass.data[DATA_ENGINE]
+        self._row, self.metrics = self._engine.allocate(self)
+        self.update_triggers()
+        self.update_delays()
+
+        # Thresholds shared with other plants of the same species
+        self._profiles = hass.data[DATA_PROFILES]
+        self._statistics = hass.data[DATA_STATISTICS]
+        self._groups = hass.data[DATA_GROUPS]
+        # The status of the plant and its metrics at the last transition
+        self._snapshot = None
 
+        # Forecast of when the plant needs water
+        self._drydown = DryDownModel()
+        self._days_until_watering = None
+
+        self._attributes_key = None
+        self._attributes = {}
 
     @property
     def entity_category(self) -> None:
@@ -456,7 +800,82 @@ class PlantDevice(Entity):
     @property
     def air_temperature_trigger(self) -> bool:
         """Whether we will generate alarms based on air temperature"""
-        return self._config.options.get("FLOW_AIR_TEMPERATURE_TRIGGER ", True)
+        return self._config.options.get(FLOW_AIR_TEMPERATURE_TRIGGER, True)
+
+    @property
+    def stale_timeout(self) -> float:
+        """Seconds without a report before a sensor is stale, 0 if disabled"""
+        hours = self._config.options.get(FLOW_STALE_TIMEOUT, DEFAULT_STALE_TIMEOUT)
+        return hours * 3600
+
+    @callback
+    def update_stale_timers(self) -> None:
+        """Start or stop watching the sensors after the timeout changed"""
+        for meter in self.meter_entities:
+            if meter is not None and meter.hass is not None:
+                meter.async_arm_stale_timer()
+
+    @property
+    def problem_delay(self) -> float:
+        """Minutes a metric must be out of range before it is a problem"""
+        return self._config.options.get(FLOW_PROBLEM_DELAY, 0)
+
+    @property
+    def recovery_delay(self) -> float:
+        """Minutes a metric must be back in range before it is ok again"""
+        return self._config.options.get(FLOW_RECOVERY_DELAY, 0)
+
+    def update_delays(self) -> None:
+        """Let the status engine know how long to wait before a status change"""
+        self._engine.set_delays(
+            self._row, self.problem_delay * 60, self.recovery_delay * 60
+        )
+
+    def update_triggers(self) -> None:
+        """Let the status engine know which metrics can make this a problem"""
+        for metric, trigger in self.triggers.items():
+            self.metrics[metric].trigger = trigger
+
+    @property
+    def triggers(self) -> dict[str, bool]:
+        """Whether we will generate alarms, for each metric"""
+        return {
+            ATTR_MOISTURE: self.moisture_trigger,
+            ATTR_CONDUCTIVITY: self.conductivity_trigger,
+            ATTR_TEMPERATURE: self.temperature_trigger,
+            ATTR_HUMIDITY: self.humidity_trigger,
+            ATTR_AIR_TEMPERATURE: self.air_temperature_trigger,
+            ATTR_ILLUMINANCE: self.illuminance_trigger,
+            ATTR_DLI: self.dli_trigger,
+        }
+
+    @property
+    def profile(self) -> str | None:
+        """The threshold profile this plant is linked to"""
+        return self._profiles.plant_profile(self._config.entry_id)
+
+    def profile_limit(self, limit: str) -> float | None:
+        """The value of a threshold according to the profile, if it has one"""
+        return self._profiles.limit(self._config.entry_id, limit)
+
+    @callback
+    def async_override_limit(self, limit: str) -> None:
+        """Stop following the profile for a threshold that was set on the plant"""
+        self._profiles.async_override(self._config.entry_id, limit)
+
+    @callback
+    def async_apply_profile(self) -> int:
+        """Update the thresholds from the profile.  Returns the number changed."""
+        return sum(
+            threshold.async_apply_profile()
+            for threshold in self.threshold_entities
+            if threshold is not None
+        )
+
+    @property
+    def cache_image(self) -> bool:
+        """Whether we will store a local thumbnail of remote images"""
+        return self._config.options.get(FLOW_CACHE_IMAGE, False)
 
     @property
     def extra_state_attributes(self) -> dict:
@@ -464,17 +883,34 @@ class PlantDevice(Entity):
         if not self.plant_complete:
             # We are not fully set up, so we just return an empty dict for now
             return {}
-        attributes = {
-            ATTR_SPECIES: self.display_species,
-            f"{ATTR_MOISTURE}_status": self.moisture_status,
-            f"{ATTR_TEMPERATURE}_status": self.temperature_status,
-            f"{ATTR_CONDUCTIVITY}_status": self.conductivity_status,
-            f"{ATTR_ILLUMINANCE}_status": self.illuminance_status,
-            f"{ATTR_HUMIDITY}_status": self.humidity_status,
-            f"{ATTR_DLI}_status": self.dli_status,
-            f"{ATTR_AIR_TEMPERATURE}_status": self.air_temperature_status, #Air Temp
-            f"{ATTR_SPECIES}_original": self.species,
-        }
+        # Only build the attributes again if something has changed
+        start = self._row * METRIC_COUNT
+        key = (
+            self._engine.codes[start : start + METRIC_COUNT].tobytes(),
+            self.display_species,
+            self.species,
+            self.profile,
+            self._days_until_watering,
+            self._drydown.watered,
+        )
+        if key == self._attributes_key:
+            return self._attributes
+        attributes = {ATTR_SPECIES: self.display_species}
+        for metric in STATUS_METRICS:
+            status = self.metrics[metric].status
+            # Metrics without a sensor do not have a status
+            if status is not None:
+                attributes[f"{metric}_status"] = status
+        attributes[f"{ATTR_SPECIES}_original"] = self.species
+        attributes[ATTR_PROFILE] = self.profile
+        attributes[ATTR_DAYS_UNTIL_WATERING] = self._days_until_watering
+        attributes[ATTR_LAST_WATERED] = (
+            dt_util.utc_from_timestamp(self._drydown.watered).isoformat()
+            if self._drydown.watered is not None
+            else None
+        )
+        self._attributes_key = key
+        self._attributes = attributes
         return attributes
 
     @property
@@ -547,6 +983,17 @@ class PlantDevice(Entity):
 
         return response
 
+    @property
+    def history(self) -> dict[str, dict]:
+        """Rolling min/max/mean of the readings of each meter"""
+        if not self.plant_complete:
+            return {}
+        return {
+            meter._metric: meter.history
+            for meter in self.meter_entities
+            if meter is not None and meter.external_sensor
+        }
+
     @property
     def threshold_entities(self) -> list[Entity]:
         """List all threshold entities"""
@@ -584,8 +1031,6 @@ class PlantDevice(Entity):
         """List all integral entities"""
         return [
             self.dli,
-            self.ppfd,
-            self.total_integral,
         ]
 
     def add_image(self, image_url: str | None) -> None:
@@ -595,6 +1040,20 @@ class PlantDevice(Entity):
         options[ATTR_ENTITY_PICTURE] = image_url
         self._hass.config_entries.async_update_entry(self._config, options=options)
 
+    async def async_cache_image(self) -> None:
+        """Replace a remote entity_picture with a locally cached thumbnail"""
+        if not self.cache_image:
+            return
+        if not self.entity_picture or not self.entity_picture.startswith("http"):
+            return
+        plant_helper = PlantHelper(self._hass)
+        local_url = await plant_helper.cache_image(self.entity_picture, self.species)
+        if local_url is None:
+            return
+        _LOGGER.debug("Using cached image %s for %s", local_url, self.entity_id)
+        self.add_image(local_url)
+        self.async_write_ha_state()
+
     def add_species(self, species: Entity | None) -> None:
         """Set new species"""
         self.species = species
@@ -653,173 +1112,86 @@ class PlantDevice(Entity):
         self,
         dli: Entity | None,
     ) -> None:
-        """Add the DLI-utility sensors"""
+        """Add the DLI sensor"""
         self.dli = dli
         self.plant_complete = True
 
-    def add_calculations(self, ppfd: Entity, total_integral: Entity) -> None:
-        """Add the intermediate calculation entities"""
-        self.ppfd = ppfd
-        self.total_integral = total_integral
-
-    def update(self) -> None:
-        """Run on every update of the entities"""
-
-        new_state = STATE_OK
-        known_state = False
-
-        if self.sensor_moisture is not None:
-            moisture = getattr(
-                self._hass.states.get(self.sensor_moisture.entity_id), "state", None
-            )
-            if (
-                moisture is not None
-                and moisture != STATE_UNKNOWN
-                and moisture != STATE_UNAVAILABLE
-            ):
-                known_state = True
-                if float(moisture) < float(self.min_moisture.state):
-                    self.moisture_status = STATE_LOW
-                    if self.moisture_trigger:
-                        new_state = STATE_PROBLEM
-                elif float(moisture) > float(self.max_moisture.state):
-                    self.moisture_status = STATE_HIGH
-                    if self.moisture_trigger:
-                        new_state = STATE_PROBLEM
-                else:
-                    self.moisture_status = STATE_OK
-
-        if self.sensor_conductivity is not None:
-            conductivity = getattr(
-                self._hass.states.get(self.sensor_conductivity.entity_id), "state", None
-            )
-            if (
-                conductivity is not None
-                and conductivity != STATE_UNKNOWN
-                and conductivity != STATE_UNAVAILABLE
-            ):
-                known_state = True
-                if float(conductivity) < float(self.min_conductivity.state):
-                    self.conductivity_status = STATE_LOW
-                    if self.conductivity_trigger:
-                        new_state = STATE_PROBLEM
-                elif float(conductivity) > float(self.max_conductivity.state):
-                    self.conductivity_status = STATE_HIGH
-                    if self.conductivity_trigger:
-                        new_state = STATE_PROBLEM
-                else:
-                    self.conductivity_status = STATE_OK
-
-        if self.sensor_temperature is not None:
-            temperature = getattr(
-                self._hass.states.get(self.sensor_temperature.entity_id), "state", None
-            )
-            if (
-                temperature is not None
-                and temperature != STATE_UNKNOWN
-                and temperature != STATE_UNAVAILABLE
-            ):
-                known_state = True
-                if float(temperature) < float(self.min_temperature.state):
-                    self.temperature_status = STATE_LOW
-                    if self.temperature_trigger:
-                        new_state = STATE_PROBLEM
-                elif float(temperature) > float(self.max_temperature.state):
-                    self.temperature_status = STATE_HIGH
-                    if self.temperature_trigger:
-                        new_state = STATE_PROBLEM
-                else:
-                    self.temperature_status = STATE_OK
-
-        if self.sensor_humidity is not None:
-            humidity = getattr(
-                self._hass.states.get(self.sensor_humidity.entity_id), "state", None
-            )
-            if (
-                humidity is not None
-                and humidity != STATE_UNKNOWN
-                and humidity != STATE_UNAVAILABLE
-            ):
-                known_state = True
-                if float(humidity) < float(self.min_humidity.state):
-                    self.humidity_status = STATE_LOW
-                    if self.humidity_trigger:
-                        new_state = STATE_PROBLEM
-                elif float(humidity) > float(self.max_humidity.state):
-                    self.humidity_status = STATE_HIGH
-                    if self.humidity_trigger:
-                        new_state = STATE_PROBLEM
-                else:
-                    self.humidity_status = STATE_OK
-                    
-        if self.sensor_air_temperature is not None:
-            air_temperature = getattr(
-                self._hass.states.get(self.sensor_air_temperature.entity_id), "state", None
-            )
-            if (
-                air_temperature is not None
-                and air_temperature != STATE_UNKNOWN
-                and air_temperature != STATE_UNAVAILABLE
-            ):
-                known_state = True
-                if float(air_temperature) < float(self.min_air_temperature.state):
-                    self.air_temperature_status = STATE_LOW
-                    new_state = STATE_PROBLEM
-                elif float(air_temperature) > float(self.max_air_temperature.state):
-                    self.air_temperature_status = STATE_HIGH
-                    new_state = STATE_PROBLEM
-                else:
-                    self.air_temperature_status = STATE_OK
-
-        # Check the instant values for illuminance against "max"
-        # Ignoring "min" value for illuminance as it would probably trigger every night
-        if self.sensor_illuminance is not None:
-            illuminance = getattr(
-                self._hass.states.get(self.sensor_illuminance.entity_id), "state", None
-            )
-            if (
-                illuminance is not None
-                and illuminance != STATE_UNKNOWN
-                and illuminance != STATE_UNAVAILABLE
-            ):
-                known_state = True
-                if float(illuminance) > float(self.max_illuminance.state):
-                    self.illuminance_status = STATE_HIGH
-                    if self.illuminance_trigger:
-                        new_state = STATE_PROBLEM
-                else:
-                    self.illuminance_status = STATE_OK
-
-        # - Checking Low values would create "problem" every night...
-        # Check DLI from the previous day against max/min DLI
-        if (
-            self.dli is not None
-            and self.dli.native_value != STATE_UNKNOWN
-            and self.dli.native_value != STATE_UNAVAILABLE
-            and self.dli.state is not None
-        ):
-            known_state = True
-            if float(self.dli.extra_state_attributes["last_period"]) > 0 and float(
-                self.dli.extra_state_attributes["last_period"]
-            ) < float(self.min_dli.state):
-                self.dli_status = STATE_LOW
-                if self.dli_trigger:
-                    new_state = STATE_PROBLEM
-            elif float(self.dli.extra_state_attributes["last_period"]) > 0 and float(
-                self.dli.extra_state_attributes["last_period"]
-            ) > float(self.max_dli.state):
-                self.dli_status = STATE_HIGH
-                if self.dli_trigger:
-                    new_state = STATE_PROBLEM
-            else:
-                self.dli_status = STATE_OK
-
-        if not known_state:
-            new_state = STATE_UNKNOWN
-
-        self._attr_state = new_state
+    @callback
+    @instrumented(METRIC_EVALUATION)
+    def async_evaluate(self) -> bool:
+        """Evaluate the plant against the thresholds.  Returns if anything changed."""
+        changed = self._engine.evaluate_row(self._row)
+        self._attr_state = self._engine.plant_state(self._row)
+        if changed:
+            self._async_status_transition()
+        return changed
+
+    async def async_update(self) -> None:
+        """Run when an update of the plant is requested"""
+        self.async_evaluate()
         self.update_registry()
 
+    @callback
+    def async_reading(self, metric: str, value: float) -> None:
+        """Handle a new reading from one of the meters"""
+        self._statistics.async_add(self.unique_id, metric, value)
+        if metric == ATTR_ILLUMINANCE:
+            if self.dli is not None:
+                self.dli.async_add_illuminance(value)
+            return
+        if metric != ATTR_MOISTURE:
+            return
+        watered = self._drydown.add(value)
+        if watered:
+            _LOGGER.debug("%s was watered", self.entity_id)
+        days = self._drydown.days_until(self.metrics[ATTR_MOISTURE].min)
+        if days is not None:
+            days = round(days, 1)
+        if days == self._days_until_watering and not watered:
+            return
+        self._days_until_watering = days
+        if self.hass is not None and self.plant_complete:
+            self.async_write_ha_state()
+
+    @callback
+    def async_status_changed(self, state: str) -> None:
+        """Write the new state after all plants were evaluated"""
+        self._attr_state = state
+        self._async_status_transition()
+        if self.hass is not None:
+            self.async_write_ha_state()
+
+    @callback
+    def _async_status_transition(self) -> None:
+        """Tell the groups and automations that the status has changed"""
+        snapshot = self._engine.snapshot(self._row)
+        self._groups.async_update(self.unique_id, snapshot)
+        old = self._snapshot
+        if snapshot == old:
+            return
+        self._snapshot = snapshot
+        # The first evaluation after a start or reload only sets the baseline
+        if old is None or self.hass is None:
+            return
+        old_state, old_status = snapshot_status(old)
+        new_state, new_status = snapshot_status(snapshot)
+        self._hass.bus.async_fire(
+            EVENT_STATUS_CHANGED,
+            {
+                ATTR_ENTITY_ID: self.entity_id,
+                ATTR_NAME: self.name,
+                "old_state": old_state,
+                "new_state": new_state,
+                "changed": [
+                    metric
+                    for metric, status in new_status.items()
+                    if status != old_status[metric]
+                ],
+                "old_status": old_status,
+                "new_status": new_status,
+            },
+        )
+
     @property
     def data_source(self) -> str | None:
         """Currently unused. For future use"""
@@ -829,6 +1201,12 @@ class PlantDevice(Entity):
         """Update registry with correct data"""
         # Is there a better way to add an entity to the device registry?
 
+        # This runs on every update, so skip it if nothing has changed
+        registry_info = (self.name, self.display_species, self.data_source)
+        if self._device_id is not None and registry_info == self._registry_info:
+            return
+        self._registry_info = registry_info
+
         device_registry = dr.async_get(self._hass)
         device_registry.async_get_or_create(
             config_entry_id=self._config.entry_id,
@@ -845,3 +1223,38 @@ class PlantDevice(Entity):
 
     async def async_added_to_hass(self) -> None:
         self.update_registry()
+        self._groups.async_add_plant(self, self._engine.snapshot(self._row))
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Give our row in the status engine to the next plant"""
+        self._groups.async_remove_plant(self.unique_id)
+        self._engine.release(self._row)
+
+    async def async_started(self, hass: HomeAssistant) -> None:
+        """Run the work that can wait until Home Assistant has started"""
+        started = time.monotonic()
+        # Evaluate all the plants that are started together in one pass
+        self._engine.async_schedule_evaluation()
+
+        # Lets add the dummy sensors automatically if we are testing stuff
+        if USE_DUMMY_SENSORS is True:
+            for sensor in self.meter_entities:
+                if sensor.external_sensor is None:
+                    await hass.services.async_call(
+                        domain=DOMAIN,
+                        service=SERVICE_REPLACE_SENSOR,
+                        service_data={
+                            "meter_entity": sensor.entity_id,
+                            "new_sensor": sensor.entity_id.replace(
+                                "sensor.", "sensor.dummy_"
+                            ),
+                        },
+                        blocking=False,
+                    )
+
+        await self.async_cache_image()
+        _LOGGER.debug(
+            "Deferred setup of %s took %.3fs",
+            self.entity_id,
+            time.monotonic() - started,
+        )
@@ -47,6 +47,7 @@ from .const import (
     DOMAIN,
     DOMAIN_PLANTBOOK,
     DOMAIN_SENSOR,
+    FLOW_CACHE_IMAGE,
     FLOW_CONDUCTIVITY_TRIGGER,
     FLOW_DLI_TRIGGER,
     FLOW_ERROR_NOTFOUND,
@@ -56,7 +57,10 @@ from .const import (
     FLOW_MOISTURE_TRIGGER,
     FLOW_PLANT_INFO,
     FLOW_PLANT_LIMITS,
+    FLOW_PROBLEM_DELAY,
+    FLOW_RECOVERY_DELAY,
     FLOW_RIGHT_PLANT,
+    FLOW_STALE_TIMEOUT,
     FLOW_SENSOR_CONDUCTIVITY,
     FLOW_SENSOR_HUMIDITY,
     FLOW_SENSOR_ILLUMINANCE,
@@ -518,6 +522,9 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 ATTR_ENTITY_PICTURE, description={"suggested_value": entity_picture}
             )
         ] = str
+        data_schema[vol.Optional(FLOW_CACHE_IMAGE, default=self.plant.cache_image)] = (
+            cv.boolean
+        )
 
         data_schema[
             vol.Optional(
@@ -538,7 +545,8 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         ] = cv.boolean
         data_schema[
             vol.Optional(
-                FLOW_AIR_TEMPERATURE_TRIGGER, default=self.plant.temperature_trigger
+                FLOW_AIR_TEMPERATURE_TRIGGER,
+                default=self.plant.air_temperature_trigger,
             )
         ] = cv.boolean
         data_schema[
@@ -550,6 +558,16 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             )
         ] = cv.boolean
 
+        data_schema[
+            vol.Optional(FLOW_PROBLEM_DELAY, default=self.plant.problem_delay)
+        ] = vol.All(vol.Coerce(float), vol.Range(min=0))
+        data_schema[
+            vol.Optional(FLOW_RECOVERY_DELAY, default=self.plant.recovery_delay)
+        ] = vol.All(vol.Coerce(float), vol.Range(min=0))
+        data_schema[
+            vol.Optional(FLOW_STALE_TIMEOUT, default=self.plant.stale_timeout / 3600)
+        ] = vol.All(vol.Coerce(float), vol.Range(min=0))
+
         # data_schema[vol.Optional(CONF_CHECK_DAYS, default=self.plant.check_days)] = int
 
         return self.async_show_form(step_id="init", data_schema=vol.Schema(data_schema))
@@ -653,5 +671,10 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             )
 
             hass.config_entries.async_update_entry(entry, data=data, options=options)
+        await self.plant.async_cache_image()
         _LOGGER.debug("Update plant options done for %s", entry.entry_id)
+        self.plant.update_triggers()
+        self.plant.update_delays()
+        self.plant.update_stale_timers()
         self.plant.update_registry()
+        self.plant.async_schedule_update_ha_state(True)
@@ -33,6 +33,16 @@ ATTR_SPECIES = "species"
 ATTR_IMAGE = "image"
 ATTR_SEARCH_FOR = "search_for"
 ATTR_AIR_TEMPERATURE = "air_temperature"  # Added for air temperature
+ATTR_FILE = "file"
+ATTR_PROFILE = "profile"
+ATTR_OVERRIDES = "overrides"
+ATTR_DAYS_UNTIL_WATERING = "days_until_watering"
+ATTR_LAST_WATERED = "last_watered"
+ATTR_HISTORY_MIN = "history_min"
+ATTR_HISTORY_MAX = "history_max"
+ATTR_HISTORY_MEAN = "history_mean"
+ATTR_LAST_PERIOD = "last_period"
+ATTR_LAST_RESET = "last_reset"
 
 # Readings are used by humans
 READING_BATTERY = "battery"
@@ -46,6 +56,7 @@ READING_MMOL = "mmol"
 READING_MOL = "mol"
 READING_DLI = "dli"
 READING_AIR_TEMPERATURE = "air temperature"  # Added for air temperature
+READING_INSTRUMENTATION = "instrumentation"
 
 
 ATTR_MAX_ILLUMINANCE_HISTORY = "max_illuminance"
@@ -77,13 +88,30 @@ DEFAULT_MAX_AIR_TEMPERATURE = 37.8  # Customize as needed
 
 DEFAULT_IMAGE_PATH = "/config/www/images/plants/"
 DEFAULT_IMAGE_LOCAL_URL = "/local/images/plants/"
+DEFAULT_IMAGE_CACHE_DIR = "cache/"
+DEFAULT_THUMBNAIL_SIZE = 300
 
 
+# Fired when the status of a plant or one of its metrics changes
+EVENT_STATUS_CHANGED = f"{DOMAIN}_status_changed"
+
 DATA_SOURCE = "data_source"
 DATA_SOURCE_PLANTBOOK = "OpenPlantbook"
 DATA_SOURCE_MANUAL = "Manual"
 DATA_SOURCE_DEFAULT = "Default values"
 DATA_UPDATED = "plant_data_updated"
+DATA_COMPONENT = "plant_component"
+DATA_LOAD_GENERATOR = "plant_load_generator"
+DATA_INSTRUMENTATION = "plant_instrumentation"
+DATA_ENGINE = "plant_engine"
+DATA_PROFILES = "plant_profiles"
+DATA_THRESHOLDS = "plant_thresholds"
+DATA_TIMERS = "plant_timers"
+DATA_STATISTICS = "plant_statistics"
+DATA_GROUPS = "plant_groups"
+
+# Seconds between the evaluations of all plants
+EVALUATION_INTERVAL = 15
 
 
 UNIT_PPFD = "mol/s⋅m²"
@@ -121,6 +149,10 @@ FLOW_AIR_TEMPERATURE_TRIGGER = "air_temperature_trigger"  # Added for air temper
 #FLOW_AIR_TEMPERATURE_UNIT = "air_temperature_unit" # Not used
 
 FLOW_FORCE_SPECIES_UPDATE = "force_update"
+FLOW_CACHE_IMAGE = "cache_image"
+FLOW_STALE_TIMEOUT = "stale_timeout"
+FLOW_PROBLEM_DELAY = "problem_delay"
+FLOW_RECOVERY_DELAY = "recovery_delay"
 
 ICON_CONDUCTIVITY = "mdi:spa-outline"
 ICON_DLI = "mdi:counter"
@@ -130,6 +162,8 @@ ICON_MOISTURE = "mdi:water"
 ICON_PPFD = "mdi:white-balance-sunny"
 ICON_TEMPERATURE = "mdi:thermometer"
 ICON_AIR_TEMPERATURE = "mdi:sun-thermometer-outline"  # Use an appropriate Material Design Icon
+ICON_INSTRUMENTATION = "mdi:speedometer"
+ICON_GROUP = "mdi:flower"
 
 OPB_GET = "get"
 OPB_SEARCH = "search"
@@ -145,6 +179,45 @@ DEFAULT_LUX_TO_PPFD = 0.0185
 
 
 SERVICE_REPLACE_SENSOR = "replace_sensor"
+SERVICE_IMPORT_PLANTS = "import_plants"
+SERVICE_START_LOAD_GENERATOR = "start_load_generator"
+SERVICE_STOP_LOAD_GENERATOR = "stop_load_generator"
+SERVICE_SET_INSTRUMENTATION = "set_instrumentation"
+SERVICE_DUMP_PROFILE = "dump_profile"
+SERVICE_DETECT_SLOW_CALLS = "detect_slow_calls"
+SERVICE_SET_PROFILE = "set_profile"
+SERVICE_DELETE_PROFILE = "delete_profile"
+SERVICE_LINK_PROFILE = "link_profile"
+SERVICE_SET_THRESHOLDS = "set_thresholds"
+
+# Number of config entries created concurrently by the bulk import
+IMPORT_BATCH_SIZE = 25
+# Number of concurrent OpenPlantbook lookups during the bulk import
+IMPORT_CONCURRENCY = 10
+
+STORAGE_VERSION = 1
+STORAGE_PROFILES = f"{DOMAIN}.profiles"
+STORAGE_THRESHOLDS = f"{DOMAIN}.thresholds"
+# Seconds to wait before writing changes to the storage
+STORAGE_SAVE_DELAY = 10
+
+# Rolling min/max/mean of the meters: window and bucket size in seconds
+HISTORY_WINDOW = 24 * 60 * 60
+HISTORY_BUCKET = 5 * 60
+
+# Seconds between writes of the DLI state while it is being integrated
+DLI_WRITE_INTERVAL = 5 * 60
+
+# A rise of the soil moisture of at least this many percent is a watering
+WATERING_STEP = 5
+# Readings and hours since the last watering needed to forecast the next one
+DRYDOWN_MIN_SAMPLES = 6
+DRYDOWN_MIN_HOURS = 6
+
+# Hours without a report before a sensor is considered stale
+DEFAULT_STALE_TIMEOUT = 24
+# Seconds between the checks if a stale sensor is back
+STALE_RECHECK = 60
 
 STATE_LOW = "Low"
 STATE_HIGH = "High"
@@ -174,6 +247,24 @@ CONF_MAX_BRIGHTNESS = "max_brightness"  # DEPRECATED. Only used for config migra
 CONF_MIN_AIR_TEMPERATURE = f"min_{ATTR_AIR_TEMPERATURE}"  # Minimum air temperature
 CONF_MAX_AIR_TEMPERATURE = f"max_{ATTR_AIR_TEMPERATURE}"  # Maximum air temperature
 
+# The thresholds of a plant, also the keys of a threshold profile
+PLANT_LIMITS = (
+    CONF_MIN_MOISTURE,
+    CONF_MAX_MOISTURE,
+    CONF_MIN_CONDUCTIVITY,
+    CONF_MAX_CONDUCTIVITY,
+    CONF_MIN_TEMPERATURE,
+    CONF_MAX_TEMPERATURE,
+    CONF_MIN_HUMIDITY,
+    CONF_MAX_HUMIDITY,
+    CONF_MIN_AIR_TEMPERATURE,
+    CONF_MAX_AIR_TEMPERATURE,
+    CONF_MIN_ILLUMINANCE,
+    CONF_MAX_ILLUMINANCE,
+    CONF_MIN_DLI,
+    CONF_MAX_DLI,
+)
+
 
 
 CONF_CHECK_DAYS = "check_days"
@@ -0,0 +1,40 @@
+"""Diagnostics support for the plant integration"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import ATTR_PLANT, DATA_INSTRUMENTATION, DOMAIN
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a plant"""
+    plant = hass.data.get(DOMAIN, {}).get(entry.entry_id, {}).get(ATTR_PLANT)
+    instrumentation = hass.data[DATA_INSTRUMENTATION]
+    return {
+        "entry": {
+            "title": entry.title,
+            "data": dict(entry.data),
+            "options": dict(entry.options),
+        },
+        "plant": (
+            {
+                "entity_id": plant.entity_id,
+                "state": plant.state,
+                "attributes": plant.extra_state_attributes,
+                "info": plant.websocket_info,
+                "metrics": {
+                    metric: record.as_dict() for metric, record in plant.metrics.items()
+                },
+            }
+            if plant is not None and plant.plant_complete
+            else None
+        ),
+        "instrumentation": instrumentation.as_dict(),
+        "plant_instrumentation": instrumentation.entry_as_dict(entry.entry_id),
+    }
@@ -4,19 +4,17 @@ from __future__ import annotations
 
 import logging
 
-from homeassistant.components.number import NumberDeviceClass, NumberMode, RestoreNumber
+from homeassistant.components.number import NumberDeviceClass, NumberEntity, NumberMode
 from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     ATTR_NAME,
-    ATTR_UNIT_OF_MEASUREMENT,
     LIGHT_LUX,
     PERCENTAGE,
     STATE_UNKNOWN,
-    UnitOfTemperature,
 )
 from homeassistant.core import Event, HomeAssistant, callback
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import (
     Entity,
     EntityCategory,
@@ -27,12 +25,16 @@ from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.util.unit_conversion import TemperatureConverter
 
 from .const import (
+    ATTR_AIR_TEMPERATURE,
     ATTR_CONDUCTIVITY,
     ATTR_DLI,
+    ATTR_HUMIDITY,
+    ATTR_ILLUMINANCE,
     ATTR_MAX,
     ATTR_MIN,
     ATTR_MOISTURE,
     ATTR_PLANT,
+    ATTR_TEMPERATURE,
     ATTR_THRESHOLDS,
     CONF_MAX_CONDUCTIVITY,
     CONF_MAX_DLI,
@@ -48,7 +50,7 @@ from .const import (
     CONF_MIN_MOISTURE,
     CONF_MIN_TEMPERATURE,
     CONF_MIN_AIR_TEMPERATURE,
-    DATA_UPDATED,
+    DATA_THRESHOLDS,
     DEFAULT_MAX_CONDUCTIVITY,
     DEFAULT_MAX_DLI,
     DEFAULT_MAX_HUMIDITY,
@@ -83,9 +85,13 @@ from .const import (
     UNIT_CONDUCTIVITY,
     UNIT_DLI,
 )
+from .plant_instrumentation import METRIC_THRESHOLD_EVENT, instrumented
+from .plant_state import parse_value
 
 _LOGGER = logging.getLogger(__name__)
 
+TEMPERATURE_METRICS = (ATTR_TEMPERATURE, ATTR_AIR_TEMPERATURE)
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
@@ -154,9 +160,80 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
-class PlantMinMax(RestoreNumber):
+@callback
+def async_convert_temperature_thresholds(hass: HomeAssistant, unit: str) -> int:
+    """Convert the temperature thresholds of all plants to a new unit"""
+    converted = 0
+    for data in hass.data.get(DOMAIN, {}).values():
+        for threshold in data.get(ATTR_THRESHOLDS, []):
+            if threshold._metric not in TEMPERATURE_METRICS:
+                continue
+            if threshold.native_unit_of_measurement == unit:
+                continue
+            threshold.async_convert_temperature(unit)
+            converted += 1
+    return converted
+
+
+@callback
+def async_set_thresholds(
+    hass: HomeAssistant, changes: dict[Entity, dict[str, float]]
+) -> dict[str, int]:
+    """Set many thresholds of many plants at once
+
+    Everything is validated before anything is changed, and every plant is
+    evaluated only once, after all its thresholds are set.
+    """
+    errors = []
+    for plant, limits in changes.items():
+        for limit, value in limits.items():
+            threshold = getattr(plant, limit, None)
+            if threshold is None:
+                errors.append(f"{plant.entity_id} has no {limit} threshold")
+                continue
+            if not threshold.native_min_value <= value <= threshold.native_max_value:
+                errors.append(
+                    f"{limit} of {plant.entity_id} must be between "
+                    f"{threshold.native_min_value} and {threshold.native_max_value}"
+                )
+        # The min and max of a metric must still make sense afterwards
+        for metric in plant.metrics:
+            low = limits.get(f"{ATTR_MIN}_{metric}", plant.metrics[metric].min)
+            high = limits.get(f"{ATTR_MAX}_{metric}", plant.metrics[metric].max)
+            if low is not None and high is not None and low > high:
+                errors.append(
+                    f"{ATTR_MIN}_{metric} of {plant.entity_id} would be above "
+                    f"{ATTR_MAX}_{metric}"
+                )
+    if errors:
+        raise HomeAssistantError(f"Thresholds not changed: {'; '.join(errors)}")
+
+    thresholds = 0
+    changed_plants = 0
+    for plant, limits in changes.items():
+        for limit, value in limits.items():
+            if getattr(plant, limit).async_set_threshold(value):
+                thresholds += 1
+            plant.async_override_limit(limit)
+        if plant.async_evaluate() and plant.hass is not None:
+            plant.async_write_ha_state()
+            changed_plants += 1
+    _LOGGER.info(
+        "Changed %s thresholds of %s plants, %s plants changed state",
+        thresholds,
+        len(changes),
+        changed_plants,
+    )
+    return {"plants": len(changes), "thresholds": thresholds}
+
+
+class PlantMinMax(NumberEntity):
     """Parent class for the min/max classes below"""
 
+    # The metric of the plant, and whether this is the min or max threshold
+    _metric: str
+    _limit: str
+
     def __init__(
         self, hass: HomeAssistant, config: ConfigEntry, plantdevice: Entity
     ) -> None:
@@ -164,6 +241,9 @@ class PlantMinMax(RestoreNumber):
         self._config = config
         self._hass = hass
         self._plant = plantdevice
+        # The thresholds of all plants are stored together
+        self._thresholds = hass.data[DATA_THRESHOLDS]
+        self._restored = False
         self._attr_mode = NumberMode.BOX
         self.entity_id = async_generate_entity_id(
             f"{DOMAIN}.{{}}", self.name, current_ids={}
@@ -175,6 +255,52 @@ class PlantMinMax(RestoreNumber):
             or self._attr_native_value == STATE_UNKNOWN
         ):
             self._attr_native_value = self._default_value
+        self._apply_profile()
+        self._publish()
+
+    @property
+    def limit(self) -> str:
+        """The key of this threshold, e.g. max_moisture"""
+        return f"{self._limit}_{self._metric}"
+
+    def _apply_profile(self) -> bool:
+        """Take the value from the profile of the plant.  Returns if it changed."""
+        value = self._plant.profile_limit(self.limit)
+        if value is None or value == parse_value(self._attr_native_value):
+            return False
+        self._attr_native_value = value
+        return True
+
+    @callback
+    def async_apply_profile(self) -> bool:
+        """Update the threshold after the profile of the plant changed"""
+        value = self._plant.profile_limit(self.limit)
+        if value is None:
+            return False
+        return self.async_set_threshold(value)
+
+    @callback
+    def async_set_threshold(self, value: float) -> bool:
+        """Set the threshold without evaluating the plant.  Returns if it changed."""
+        if value == parse_value(self._attr_native_value):
+            return False
+        self._attr_native_value = value
+        self._publish()
+        if self.hass is not None:
+            self.async_write_ha_state()
+        return True
+
+    def _publish(self) -> None:
+        """Hand the current threshold over to the plant, and store it"""
+        value = parse_value(self._attr_native_value)
+        setattr(self._plant.metrics[self._metric], self._limit, value)
+        if self._restored and value is not None:
+            self._thresholds.async_set(
+                self._config.entry_id,
+                self.limit,
+                value,
+                self._attr_native_unit_of_measurement,
+            )
 
     @property
     def entity_category(self) -> str:
@@ -191,15 +317,16 @@ class PlantMinMax(RestoreNumber):
     async def async_set_native_value(self, value: float) -> None:
         _LOGGER.debug("Setting value of %s to %s", self.entity_id, value)
         self._attr_native_value = value
+        self._publish()
+        # Set on the plant itself, so it no longer follows the profile
+        self._plant.async_override_limit(self.limit)
 
+    @callback
+    @instrumented(METRIC_THRESHOLD_EVENT)
     def _state_changed_event(self, event: Event) -> None:
         if event.data.get("old_state") is None or event.data.get("new_state") is None:
             return
         if event.data.get("old_state").state == event.data.get("new_state").state:
-            self.state_attributes_changed(
-                old_attributes=event.data.get("old_state").attributes,
-                new_attributes=event.data.get("new_state").attributes,
-            )
             return
         self.state_changed(
             old_state=event.data.get("old_state").state,
@@ -216,9 +343,30 @@ class PlantMinMax(RestoreNumber):
             self._attr_native_value,
         )
         self._attr_native_value = new_state
+        self._publish()
 
-    def state_attributes_changed(self, old_attributes, new_attributes):
-        """Placeholder"""
+    @callback
+    def async_convert_temperature(self, unit: str) -> None:
+        """Convert the threshold to a new temperature unit"""
+        from_unit = self._attr_native_unit_of_measurement
+        if from_unit == unit:
+            return
+        value = parse_value(self._attr_native_value)
+        if value is not None:
+            convert = TemperatureConverter.converter_factory(from_unit, unit)
+            self._attr_native_value = round(convert(value))
+        _LOGGER.debug(
+            "Converted %s from %s %s to %s %s",
+            self.entity_id,
+            value,
+            from_unit,
+            self._attr_native_value,
+            unit,
+        )
+        self._attr_native_unit_of_measurement = unit
+        self._publish()
+        if self.hass is not None:
+            self.async_write_ha_state()
 
     def self_updated(self) -> None:
         """Allow the state to be changed from the UI and saved in restore_state."""
@@ -233,46 +381,34 @@ class PlantMinMax(RestoreNumber):
             self.async_write_ha_state()
 
     async def async_added_to_hass(self) -> None:
-        """Restore state of thresholds on startup."""
+        """Restore the threshold on startup"""
         await super().async_added_to_hass()
-        state = await self.async_get_last_number_data()
-        if not state:
-            return
-        self._attr_native_value = state.native_value
-        self._attr_native_unit_of_measurement = state.native_unit_of_measurement
+        stored = self._thresholds.get(self._config.entry_id, self.limit)
+        if stored is None:
+            # Stored as a restore state by older versions
+            stored = self._thresholds.async_migrate(self.entity_id)
+        if stored is not None:
+            self._attr_native_value, self._attr_native_unit_of_measurement = stored
+        # The profile may have changed while we were not running
+        self._apply_profile()
+        self._restored = True
+        self._publish()
         # We track changes to our own state so we can update ourselves if state si changed
         # from the UI or by other means
-        async_track_state_change_event(
-            self._hass,
-            list([self.entity_id]),
-            self._state_changed_event,
-        )
-
-    async def not_async_added_to_hass(self) -> None:
-        """Restore state of thresholds on startup."""
-        await super().async_added_to_hass()
-
-        # Restore state and attributes from DB
-        state = await self.async_get_last_state()
-        if not state:
-            return
-        self._attr_state = state.state
-        self._attr_native_unit_of_measurement = state.attributes.get(
-            ATTR_UNIT_OF_MEASUREMENT
-        )
-
-        async_dispatcher_connect(
-            self.hass, DATA_UPDATED, self._schedule_immediate_update
+        self.async_on_remove(
+            async_track_state_change_event(
+                self._hass,
+                list([self.entity_id]),
+                self._state_changed_event,
+            )
         )
 
-    @callback
-    def _schedule_immediate_update(self):
-        self.async_schedule_update_ha_state(True)
-
-
 class PlantMaxMoisture(PlantMinMax):
     """Entity class for max moisture threshold"""
 
+    _metric = ATTR_MOISTURE
+    _limit = ATTR_MAX
+
     def __init__(
         self, hass: HomeAssistant, config: ConfigEntry, plantdevice: Entity
     ) -> None:
@@ -299,6 +435,9 @@ class PlantMaxMoisture(PlantMinMax):
 class PlantMinMoisture(PlantMinMax):
     """Entity class for min moisture threshold"""
 
+    _metric = ATTR_MOISTURE
+    _limit = ATTR_MIN
+
     def __init__(
         self, hass: HomeAssistant, config: ConfigEntry, plantdevice: Entity
     ) -> None:
@@ -325,6 +464,9 @@ class PlantMinMoisture(PlantMinMax):
 class PlantMaxTemperature(PlantMinMax):
     """Entity class for max temperature threshold"""
 
+    _metric = ATTR_TEMPERATURE
+    _limit = ATTR_MAX
+
     def __init__(
         self, hass: HomeAssistant, config: ConfigEntry, plantdevice: Entity
     ) -> None:
@@ -346,57 +488,13 @@ class PlantMaxTemperature(PlantMinMax):
     def device_class(self):
         return NumberDeviceClass.TEMPERATURE
 
-    def state_attributes_changed(self, old_attributes, new_attributes):
-        """Calculate C or F"""
-        if new_attributes.get(ATTR_UNIT_OF_MEASUREMENT) is None:
-            return
-        if old_attributes.get(ATTR_UNIT_OF_MEASUREMENT) is None:
-            return
-        if new_attributes.get(ATTR_UNIT_OF_MEASUREMENT) == old_attributes.get(
-            ATTR_UNIT_OF_MEASUREMENT
-        ):
-            return
-        new_state = self._attr_state
-        if (
-            old_attributes.get(ATTR_UNIT_OF_MEASUREMENT) == "°F"
-            and new_attributes.get(ATTR_UNIT_OF_MEASUREMENT) == "°C"
-        ):
-            new_state = round(
-                TemperatureConverter.convert(
-                    temperature=float(self.state),
-                    from_unit=UnitOfTemperature.FAHRENHEIT,
-                    to_unit=UnitOfTemperature.CELSIUS,
-                )
-            )
-            _LOGGER.debug(
-                "Changing from F to C measurement is %s new is %s",
-                self.state,
-                new_state,
-            )
-
-        if (
-            old_attributes.get(ATTR_UNIT_OF_MEASUREMENT) == "°C"
-            and new_attributes.get(ATTR_UNIT_OF_MEASUREMENT) == "°F"
-        ):
-            new_state = round(
-                TemperatureConverter.convert(
-                    temperature=float(self.state),
-                    from_unit=UnitOfTemperature.CELSIUS,
-                    to_unit=UnitOfTemperature.FAHRENHEIT,
-                )
-            )
-            _LOGGER.debug(
-                "Changing from C to F measurement is %s new is %s",
-                self.state,
-                new_state,
-            )
-
-        self._hass.states.set(self.entity_id, new_state, new_attributes)
-
 
 class PlantMinTemperature(PlantMinMax):
     """Entity class for min temperature threshold"""
 
+    _metric = ATTR_TEMPERATURE
+    _limit = ATTR_MIN
+
     def __init__(
         self, hass: HomeAssistant, config: ConfigEntry, plantdevice: Entity
     ) -> None:
@@ -418,58 +516,14 @@ class PlantMinTemperature(PlantMinMax):
     def device_class(self):
         return NumberDeviceClass.TEMPERATURE
 
-    def state_attributes_changed(self, old_attributes, new_attributes):
-        """Calculate C or F"""
-        if new_attributes.get(ATTR_UNIT_OF_MEASUREMENT) is None:
-            return
-        if old_attributes.get(ATTR_UNIT_OF_MEASUREMENT) is None:
-            return
-        if new_attributes.get(ATTR_UNIT_OF_MEASUREMENT) == old_attributes.get(
-            ATTR_UNIT_OF_MEASUREMENT
-        ):
-            return
-        new_state = self._attr_state
-        if (
-            old_attributes.get(ATTR_UNIT_OF_MEASUREMENT) == "°F"
-            and new_attributes.get(ATTR_UNIT_OF_MEASUREMENT) == "°C"
-        ):
-            new_state = round(
-                TemperatureConverter.convert(
-                    temperature=float(self.state),
-                    from_unit=UnitOfTemperature.FAHRENHEIT,
-                    to_unit=UnitOfTemperature.CELSIUS,
-                )
-            )
-            _LOGGER.debug(
-                "Changing from F to C measurement is %s new is %s",
-                self.state,
-                new_state,
-            )
-
-            # new_state = int(round((int(self.state) - 32) * 0.5556, 0))
 
-        if (
-            old_attributes.get(ATTR_UNIT_OF_MEASUREMENT) == "°C"
-            and new_attributes.get(ATTR_UNIT_OF_MEASUREMENT) == "°F"
-        ):
-            new_state = round(
-                TemperatureConverter.convert(
-                    temperature=float(self.state),
-                    from_unit=UnitOfTemperature.CELSIUS,
-                    to_unit=UnitOfTemperature.FAHRENHEIT,
-                )
-            )
-            _LOGGER.debug(
-                "Changing from C to F measurement is %s new is %s",
-                self.state,
-                new_state,
-            )
-
-        self._hass.states.set(self.entity_id, new_state, new_attributes)
 ############################################################################
 class PlantMaxAirTemperature(PlantMinMax):
     """Entity class for max air temperature threshold."""
 
+    _metric = ATTR_AIR_TEMPERATURE
+    _limit = ATTR_MAX
+
     def __init__(self, hass: HomeAssistant, config: ConfigEntry, plantdevice: Entity) -> None:
         """Initialize the component."""
         self._attr_name = f"{config.data[FLOW_PLANT_INFO][ATTR_NAME]} {ATTR_MAX} {READING_AIR_TEMPERATURE}"
@@ -487,59 +541,14 @@ class PlantMaxAirTemperature(PlantMinMax):
     @property
     def device_class(self):
         return "air_temperature"
-    
-    def state_attributes_changed(self, old_attributes, new_attributes):
-        """Calculate C or F"""
-        if new_attributes.get(ATTR_UNIT_OF_MEASUREMENT) is None:
-            return
-        if old_attributes.get(ATTR_UNIT_OF_MEASUREMENT) is None:
-            return
-        if new_attributes.get(ATTR_UNIT_OF_MEASUREMENT) == old_attributes.get(
-            ATTR_UNIT_OF_MEASUREMENT
-        ):
-            return
-        new_state = self._attr_state
-        if (
-            old_attributes.get(ATTR_UNIT_OF_MEASUREMENT) == "°F"
-            and new_attributes.get(ATTR_UNIT_OF_MEASUREMENT) == "°C"
-        ):
-            new_state = round(
-                TemperatureConverter.convert(
-                    temperature=float(self.state),
-                    from_unit=UnitOfTemperature.FAHRENHEIT,
-                    to_unit=UnitOfTemperature.CELSIUS,
-                )
-            )
-            _LOGGER.debug(
-                "Changing from F to C measurement is %s new is %s",
-                self.state,
-                new_state,
-            )
-
-            # new_state = int(round((int(self.state) - 32) * 0.5556, 0))
-
-        if (
-            old_attributes.get(ATTR_UNIT_OF_MEASUREMENT) == "°C"
-            and new_attributes.get(ATTR_UNIT_OF_MEASUREMENT) == "°F"
-        ):
-            new_state = round(
-                TemperatureConverter.convert(
-                    temperature=float(self.state),
-                    from_unit=UnitOfTemperature.CELSIUS,
-                    to_unit=UnitOfTemperature.FAHRENHEIT,
-                )
-            )
-            _LOGGER.debug(
-                "Changing from C to F measurement is %s new is %s",
-                self.state,
-                new_state,
-            )
 
-        self._hass.states.set(self.entity_id, new_state, new_attributes)
 
 class PlantMinAirTemperature(PlantMinMax):
     """Entity class for min air temperature threshold."""
 
+    _metric = ATTR_AIR_TEMPERATURE
+    _limit = ATTR_MIN
+
     def __init__(self, hass: HomeAssistant, config: ConfigEntry, plantdevice: Entity) -> None:
         """Initialize the component."""
         self._attr_name = f"{config.data[FLOW_PLANT_INFO][ATTR_NAME]} {ATTR_MIN} {READING_AIR_TEMPERATURE}"
@@ -557,59 +566,15 @@ class PlantMinAirTemperature(PlantMinMax):
     @property
     def device_class(self):
         return "air_temperature"
-    
-    def state_attributes_changed(self, old_attributes, new_attributes):
-        """Calculate C or F"""
-        if new_attributes.get(ATTR_UNIT_OF_MEASUREMENT) is None:
-            return
-        if old_attributes.get(ATTR_UNIT_OF_MEASUREMENT) is None:
-            return
-        if new_attributes.get(ATTR_UNIT_OF_MEASUREMENT) == old_attributes.get(
-            ATTR_UNIT_OF_MEASUREMENT
-        ):
-            return
-        new_state = self._attr_state
-        if (
-            old_attributes.get(ATTR_UNIT_OF_MEASUREMENT) == "°F"
-            and new_attributes.get(ATTR_UNIT_OF_MEASUREMENT) == "°C"
-        ):
-            new_state = round(
-                TemperatureConverter.convert(
-                    temperature=float(self.state),
-                    from_unit=UnitOfTemperature.FAHRENHEIT,
-                    to_unit=UnitOfTemperature.CELSIUS,
-                )
-            )
-            _LOGGER.debug(
-                "Changing from F to C measurement is %s new is %s",
-                self.state,
-                new_state,
-            )
 
-            # new_state = int(round((int(self.state) - 32) * 0.5556, 0))
 
-        if (
-            old_attributes.get(ATTR_UNIT_OF_MEASUREMENT) == "°C"
-            and new_attributes.get(ATTR_UNIT_OF_MEASUREMENT) == "°F"
-        ):
-            new_state = round(
-                TemperatureConverter.convert(
-                    temperature=float(self.state),
-                    from_unit=UnitOfTemperature.CELSIUS,
-                    to_unit=UnitOfTemperature.FAHRENHEIT,
-                )
-            )
-            _LOGGER.debug(
-                "Changing from C to F measurement is %s new is %s",
-                self.state,
-                new_state,
-            )
-
-        self._hass.states.set(self.entity_id, new_state, new_attributes)
 ############################################################################
 class PlantMaxIlluminance(PlantMinMax):
     """Entity class for max illuminance threshold"""
 
+    _metric = ATTR_ILLUMINANCE
+    _limit = ATTR_MAX
+
     def __init__(
         self, hass: HomeAssistant, config: ConfigEntry, plantdevice: Entity
     ) -> None:
@@ -634,6 +599,9 @@ class PlantMaxIlluminance(PlantMinMax):
 class PlantMinIlluminance(PlantMinMax):
     """Entity class for min illuminance threshold"""
 
+    _metric = ATTR_ILLUMINANCE
+    _limit = ATTR_MIN
+
     def __init__(
         self, hass: HomeAssistant, config: ConfigEntry, plantdevice: Entity
     ) -> None:
@@ -658,6 +626,9 @@ class PlantMinIlluminance(PlantMinMax):
 class PlantMaxDli(PlantMinMax):
     """Entity class for max illuminance threshold"""
 
+    _metric = ATTR_DLI
+    _limit = ATTR_MAX
+
     def __init__(
         self, hass: HomeAssistant, config: ConfigEntry, plantdevice: Entity
     ) -> None:
@@ -684,6 +655,9 @@ class PlantMaxDli(PlantMinMax):
 class PlantMinDli(PlantMinMax):
     """Entity class for min illuminance threshold"""
 
+    _metric = ATTR_DLI
+    _limit = ATTR_MIN
+
     def __init__(
         self, hass: HomeAssistant, config: ConfigEntry, plantdevice: Entity
     ) -> None:
@@ -711,6 +685,9 @@ class PlantMinDli(PlantMinMax):
 class PlantMaxConductivity(PlantMinMax):
     """Entity class for max conductivity threshold"""
 
+    _metric = ATTR_CONDUCTIVITY
+    _limit = ATTR_MAX
+
     def __init__(
         self, hass: HomeAssistant, config: ConfigEntry, plantdevice: Entity
     ) -> None:
@@ -735,6 +712,9 @@ class PlantMaxConductivity(PlantMinMax):
 class PlantMinConductivity(PlantMinMax):
     """Entity class for min conductivity threshold"""
 
+    _metric = ATTR_CONDUCTIVITY
+    _limit = ATTR_MIN
+
     def __init__(
         self, hass: HomeAssistant, config: ConfigEntry, plantdevice: Entity
     ) -> None:
@@ -760,6 +740,9 @@ class PlantMinConductivity(PlantMinMax):
 class PlantMaxHumidity(PlantMinMax):
     """Entity class for max humidity threshold"""
 
+    _metric = ATTR_HUMIDITY
+    _limit = ATTR_MAX
+
     def __init__(
         self, hass: HomeAssistant, config: ConfigEntry, plantdevice: Entity
     ) -> None:
@@ -787,6 +770,9 @@ class PlantMaxHumidity(PlantMinMax):
 class PlantMinHumidity(PlantMinMax):
     """Entity class for min conductivity threshold"""
 
+    _metric = ATTR_HUMIDITY
+    _limit = ATTR_MIN
+
     def __init__(
         self, hass: HomeAssistant, config: ConfigEntry, plantdevice: Entity
     ) -> None:
@@ -0,0 +1,25 @@
+"""Diurnal curves for the dummy sensors and the load generator
+
+Kept free of other imports, so the sensor platform can use them without
+loading the load generator.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+import math
+import random
+
+# Illuminance at noon on a clear day
+PEAK_LUX = 50000
+
+
+def daylight(now: datetime) -> float:
+    """Relative amount of daylight, 0 at night and 1 at noon"""
+    hour = now.hour + now.minute / 60 + now.second / 3600
+    return max(0.0, math.sin(math.pi * (hour - 6) / 12))
+
+
+def dummy_illuminance(now: datetime, peak: int = PEAK_LUX) -> int:
+    """Illuminance following a diurnal curve, with some clouds"""
+    return round(daylight(now) * peak * random.uniform(0.6, 1) + random.randint(0, 50))
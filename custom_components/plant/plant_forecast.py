@@ -0,0 +1,121 @@
+"""Forecast of when a plant needs water
+
+The soil moisture since the last watering is fitted with an exponential
+decay, i.e. a linear regression of ln(moisture) over time, kept as running
+sums so every reading costs O(1) and no history has to be read back.  When
+a reading is not positive, a plain linear regression is used instead.  A
+sudden rise of the moisture is taken as a watering, and starts a new fit.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+
+from .const import DRYDOWN_MIN_HOURS, DRYDOWN_MIN_SAMPLES, WATERING_STEP
+
+SECONDS_PER_DAY = 24 * 60 * 60
+
+
+class DryDownModel:
+    """Online regression of the soil moisture since the last watering"""
+
+    __slots__ = (
+        "watered",
+        "last",
+        "_start",
+        "_latest",
+        "_n",
+        "_t",
+        "_tt",
+        "_y",
+        "_ty",
+        "_log_y",
+        "_t_log_y",
+        "_positive",
+    )
+
+    def __init__(self) -> None:
+        """Initialize an empty model"""
+        # Unix time of the last watering we detected
+        self.watered: float | None = None
+        self.last: float | None = None
+        self._reset(None)
+
+    def _reset(self, start: float | None) -> None:
+        """Start a new fit"""
+        self._start = start
+        self._latest = 0.0
+        self._n = 0
+        self._t = 0.0
+        self._tt = 0.0
+        self._y = 0.0
+        self._ty = 0.0
+        self._log_y = 0.0
+        self._t_log_y = 0.0
+        self._positive = True
+
+    def add(self, moisture: float, now: float | None = None) -> bool:
+        """Add a reading.  Returns whether it was detected as a watering."""
+        if now is None:
+            now = time.time()
+        watered = self.last is not None and moisture - self.last >= WATERING_STEP
+        self.last = moisture
+        if watered:
+            self.watered = now
+            self._reset(now)
+        elif self._start is None:
+            self._reset(now)
+        # Days since the start of the fit, so the sums stay small
+        t = (now - self._start) / SECONDS_PER_DAY
+        self._latest = t
+        self._n += 1
+        self._t += t
+        self._tt += t * t
+        self._y += moisture
+        self._ty += t * moisture
+        if moisture > 0:
+            log_y = math.log(moisture)
+            self._log_y += log_y
+            self._t_log_y += t * log_y
+        else:
+            self._positive = False
+        return watered
+
+    def _fit(self, sum_y: float, sum_ty: float) -> tuple[float, float] | None:
+        """Intercept and slope of a least squares fit"""
+        n = self._n
+        denominator = n * self._tt - self._t * self._t
+        if denominator <= 0:
+            return None
+        slope = (n * sum_ty - self._t * sum_y) / denominator
+        return (sum_y - slope * self._t) / n, slope
+
+    def days_until(self, moisture: float, now: float | None = None) -> float | None:
+        """Days until the moisture drops to a level, or None if unknown"""
+        if now is None:
+            now = time.time()
+        if self.last is None or moisture is None:
+            return None
+        if self.last <= moisture:
+            return 0.0
+        if self._n < DRYDOWN_MIN_SAMPLES:
+            return None
+        if self._latest * 24 < DRYDOWN_MIN_HOURS:
+            # Not enough time covered to tell a trend from noise
+            return None
+        if self._positive and moisture > 0:
+            fit = self._fit(self._log_y, self._t_log_y)
+            target = math.log(moisture)
+        else:
+            fit = self._fit(self._y, self._ty)
+            target = moisture
+        if fit is None:
+            return None
+        intercept, slope = fit
+        if slope >= 0:
+            # Not drying out
+            return None
+        crossing = (target - intercept) / slope
+        elapsed = (now - self._start) / SECONDS_PER_DAY
+        return max(0.0, crossing - elapsed)
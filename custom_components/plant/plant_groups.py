@@ -0,0 +1,296 @@
+"""Aggregate status of the plants per area and label
+
+Every plant belongs to the group of its area, and to a group per label of
+the plant entity.  A group keeps counts of its plants by status, and of its
+metrics that are low or high.  The counts are updated when a plant changes
+status, by taking out the old status and adding the new one, so the cost of
+a transition does not depend on the size of the group.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.const import STATE_OK, STATE_PROBLEM, STATE_UNKNOWN
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import (
+    area_registry as ar,
+    device_registry as dr,
+    entity_registry as er,
+    label_registry as lr,
+)
+from homeassistant.helpers.entity import Entity, async_generate_entity_id
+
+from .const import DATA_COMPONENT, DOMAIN, ICON_GROUP, STATE_HIGH, STATE_LOW
+from .plant_state import (
+    CODE_HIGH,
+    CODE_LOW,
+    CODE_OK,
+    CODE_PROBLEM,
+    CODE_UNKNOWN,
+    METRIC_COUNT,
+    PLANT_METRICS,
+)
+
+if TYPE_CHECKING:
+    from . import PlantDevice
+
+_LOGGER = logging.getLogger(__name__)
+
+GROUP_AREA = "area"
+GROUP_LABEL = "label"
+
+# The status of a plant, followed by the status of each of its metrics
+Snapshot = tuple[int, ...]
+
+
+class GroupStatus:
+    """Counts of the plants of a group by status"""
+
+    __slots__ = ("key", "kind", "plants", "states", "metrics", "entity")
+
+    def __init__(self, key: str, kind: str) -> None:
+        """Initialize an empty group"""
+        self.key = key
+        self.kind = kind
+        self.plants = 0
+        # Plants by plant code, and metrics by column * 4 + metric code
+        self.states = [0, 0, 0]
+        self.metrics = [0] * (METRIC_COUNT * 4)
+        self.entity: PlantGroupEntity | None = None
+
+    def add(self, snapshot: Snapshot, sign: int = 1) -> None:
+        """Count a plant, or take it out again with sign -1"""
+        self.plants += sign
+        self.states[snapshot[0]] += sign
+        metrics = self.metrics
+        for column in range(METRIC_COUNT):
+            metrics[column * 4 + snapshot[column + 1]] += sign
+
+    @property
+    def state(self) -> str:
+        """Problem if any plant is, ok if any plant is known"""
+        if self.states[CODE_PROBLEM]:
+            return STATE_PROBLEM
+        if self.states[CODE_OK]:
+            return STATE_OK
+        return STATE_UNKNOWN
+
+    def as_dict(self) -> dict[str, Any]:
+        """The counts as a dict"""
+        metrics = {}
+        for column, metric in enumerate(PLANT_METRICS):
+            low = self.metrics[column * 4 + CODE_LOW]
+            high = self.metrics[column * 4 + CODE_HIGH]
+            if low or high:
+                metrics[metric] = {STATE_LOW: low, STATE_HIGH: high}
+        return {
+            "plants": self.plants,
+            STATE_PROBLEM: self.states[CODE_PROBLEM],
+            STATE_OK: self.states[CODE_OK],
+            STATE_UNKNOWN: self.states[CODE_UNKNOWN],
+            "metrics": metrics,
+        }
+
+
+class PlantGroupEntity(Entity):
+    """The aggregate status of the plants of a group"""
+
+    _attr_should_poll = False
+    _attr_icon = ICON_GROUP
+
+    def __init__(self, hass: HomeAssistant, group: GroupStatus, name: str) -> None:
+        """Initialize the entity of a group"""
+        self._group = group
+        self._attr_name = f"{name} plants"
+        self._attr_unique_id = f"group-{group.key}"
+        self.entity_id = async_generate_entity_id(
+            f"{DOMAIN}.{{}}", self._attr_name, hass=hass
+        )
+
+    @property
+    def state(self) -> str:
+        """The aggregate status"""
+        return self._group.state
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """The counts of the group"""
+        return {"group": self._group.key, **self._group.as_dict()}
+
+
+class PlantGroups:
+    """The groups of all plants, and which plants are in them"""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize without any groups"""
+        self._hass = hass
+        self.groups: dict[str, GroupStatus] = {}
+        # Config entry -> the plant, its groups and its last snapshot
+        self._plants: dict[str, PlantDevice] = {}
+        self._members: dict[str, tuple[str, ...]] = {}
+        self._snapshots: dict[str, Snapshot] = {}
+        # Groups with an entity that has to be written
+        self._dirty: set[str] = set()
+        self._scheduled = False
+
+    @callback
+    def async_setup(self) -> None:
+        """Follow the plants when they are moved to another area or label"""
+        self._hass.bus.async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED, self._async_entity_registry_updated
+        )
+        self._hass.bus.async_listen(
+            dr.EVENT_DEVICE_REGISTRY_UPDATED, self._async_device_registry_updated
+        )
+
+    def _group_keys(self, plant: PlantDevice) -> tuple[str, ...]:
+        """The groups a plant belongs to, according to the registries"""
+        entity = er.async_get(self._hass).async_get(plant.entity_id)
+        if entity is None:
+            return ()
+        area_id = entity.area_id
+        if area_id is None and entity.device_id is not None:
+            device = dr.async_get(self._hass).async_get(entity.device_id)
+            area_id = device.area_id if device is not None else None
+        keys = [f"{GROUP_AREA}.{area_id}"] if area_id is not None else []
+        keys.extend(f"{GROUP_LABEL}.{label}" for label in sorted(entity.labels))
+        return tuple(keys)
+
+    def group_name(self, group: GroupStatus) -> str:
+        """The name of the area or label of a group"""
+        item_id = group.key.split(".", 1)[1]
+        if group.kind == GROUP_AREA:
+            item = ar.async_get(self._hass).async_get_area(item_id)
+        else:
+            item = lr.async_get(self._hass).async_get_label(item_id)
+        return item.name if item is not None else item_id
+
+    @callback
+    def async_add_plant(self, plant: PlantDevice, snapshot: Snapshot) -> None:
+        """Count a plant in the groups it belongs to"""
+        self._plants[plant.unique_id] = plant
+        self._snapshots[plant.unique_id] = snapshot
+        self._async_set_members(plant.unique_id, self._group_keys(plant))
+
+    @callback
+    def async_remove_plant(self, entry_id: str) -> None:
+        """Take a plant that is removed out of its groups"""
+        self._async_set_members(entry_id, ())
+        self._plants.pop(entry_id, None)
+        self._snapshots.pop(entry_id, None)
+
+    @callback
+    def async_update(self, entry_id: str, snapshot: Snapshot) -> None:
+        """Move a plant that changed status to its new counts"""
+        old = self._snapshots.get(entry_id)
+        if old is None or old == snapshot:
+            return
+        self._snapshots[entry_id] = snapshot
+        for key in self._members.get(entry_id, ()):
+            group = self.groups[key]
+            group.add(old, -1)
+            group.add(snapshot)
+            self._async_schedule_write(key)
+
+    @callback
+    def _async_set_members(self, entry_id: str, keys: tuple[str, ...]) -> None:
+        """Move a plant to other groups"""
+        old_keys = self._members.get(entry_id, ())
+        if keys == old_keys:
+            return
+        snapshot = self._snapshots[entry_id]
+        for key in old_keys:
+            if key in keys:
+                continue
+            group = self.groups[key]
+            group.add(snapshot, -1)
+            if group.plants:
+                self._async_schedule_write(key)
+            else:
+                self._async_remove_group(group)
+        for key in keys:
+            if key in old_keys:
+                continue
+            group = self.groups.get(key)
+            if group is None:
+                group = self._async_create_group(key)
+            group.add(snapshot)
+            self._async_schedule_write(key)
+        if keys:
+            self._members[entry_id] = keys
+        else:
+            self._members.pop(entry_id, None)
+
+    @callback
+    def _async_create_group(self, key: str) -> GroupStatus:
+        """Create a group and its entity"""
+        group = GroupStatus(key, key.split(".", 1)[0])
+        self.groups[key] = group
+        group.entity = PlantGroupEntity(self._hass, group, self.group_name(group))
+        self._hass.async_create_task(
+            self._hass.data[DATA_COMPONENT].async_add_entities([group.entity])
+        )
+        _LOGGER.debug("Created plant group %s", key)
+        return group
+
+    @callback
+    def _async_remove_group(self, group: GroupStatus) -> None:
+        """Remove a group without plants, and its entity"""
+        del self.groups[group.key]
+        self._dirty.discard(group.key)
+        if group.entity is not None and group.entity.hass is not None:
+            self._hass.async_create_task(group.entity.async_remove())
+        _LOGGER.debug("Removed plant group %s", group.key)
+
+    @callback
+    def _async_schedule_write(self, key: str) -> None:
+        """Write the entity of a group soon, once for all transitions"""
+        self._dirty.add(key)
+        if self._scheduled:
+            return
+        self._scheduled = True
+        self._hass.loop.call_soon(self._async_write)
+
+    @callback
+    def _async_write(self) -> None:
+        """Write the entities of the groups that changed"""
+        self._scheduled = False
+        dirty, self._dirty = self._dirty, set()
+        for key in dirty:
+            group = self.groups.get(key)
+            if group is not None and group.entity and group.entity.hass is not None:
+                group.entity.async_write_ha_state()
+
+    @callback
+    def _async_entity_registry_updated(self, event: Event) -> None:
+        """Follow a plant entity to another area or label"""
+        if event.data.get("action") != "update":
+            return
+        for entry_id, plant in self._plants.items():
+            if plant.entity_id == event.data.get("entity_id"):
+                self._async_set_members(entry_id, self._group_keys(plant))
+                return
+
+    @callback
+    def _async_device_registry_updated(self, event: Event) -> None:
+        """Follow a plant device to another area"""
+        if event.data.get("action") != "update":
+            return
+        for entry_id, plant in self._plants.items():
+            if plant.device_id == event.data.get("device_id"):
+                self._async_set_members(entry_id, self._group_keys(plant))
+                return
+
+    def as_dict(self) -> dict[str, Any]:
+        """The counts of all groups"""
+        return {
+            key: {
+                "kind": group.kind,
+                "name": self.group_name(group),
+                "entity_id": group.entity.entity_id if group.entity else None,
+                **group.as_dict(),
+            }
+            for key, group in self.groups.items()
+        }
@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from functools import lru_cache
+import hashlib
+import io
 import logging
+import os
 from typing import Any
+from urllib.parse import urlparse
 
+import aiohttp
 from async_timeout import timeout
 import voluptuous as vol
 
@@ -14,11 +21,14 @@ from homeassistant.components.persistent_notification import (
 from homeassistant.const import ATTR_ENTITY_PICTURE, ATTR_NAME, UnitOfTemperature
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import config_validation as cv
-from homeassistant.helpers.temperature import display_temp
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util import slugify
+from homeassistant.util.unit_conversion import TemperatureConverter
 
 from .const import (
     ATTR_BRIGHTNESS,
     ATTR_CONDUCTIVITY,
+    ATTR_HUMIDITY,
     ATTR_ILLUMINANCE,
     ATTR_IMAGE,
     ATTR_LIMITS,
@@ -46,6 +56,7 @@ from .const import (
     DATA_SOURCE,
     DATA_SOURCE_DEFAULT,
     DATA_SOURCE_PLANTBOOK,
+    DEFAULT_IMAGE_CACHE_DIR,
     DEFAULT_IMAGE_LOCAL_URL,
     DEFAULT_IMAGE_PATH,
     DEFAULT_MAX_CONDUCTIVITY,
@@ -60,11 +71,13 @@ from .const import (
     DEFAULT_MIN_ILLUMINANCE,
     DEFAULT_MIN_MOISTURE,
     DEFAULT_MIN_TEMPERATURE,
+    DEFAULT_THUMBNAIL_SIZE,
     DOMAIN_PLANTBOOK,
     FLOW_FORCE_SPECIES_UPDATE,
     FLOW_PLANT_IMAGE,
     FLOW_PLANT_INFO,
     FLOW_SENSOR_CONDUCTIVITY,
+    FLOW_SENSOR_HUMIDITY,
     FLOW_SENSOR_ILLUMINANCE,
     FLOW_SENSOR_MOISTURE,
     FLOW_SENSOR_TEMPERATURE,
@@ -80,15 +93,147 @@ from .const import (
     DEFAULT_MAX_AIR_TEMPERATURE,
     FLOW_SENSOR_AIR_TEMPERATURE,
 )
+from .plant_instrumentation import METRIC_OPB_CALL, instrumented
 
 _LOGGER = logging.getLogger(__name__)
 
+# Every limit stored in the config entry, in the order they are stored, together
+# with the OpenPlantbook attribute it is read from.  DLI is read from mmol.
+OPB_LIMITS = tuple(
+    (limit, CONF_PLANTBOOK_MAPPING[opb_limit])
+    for limit, opb_limit in (
+        (CONF_MAX_ILLUMINANCE, CONF_MAX_ILLUMINANCE),
+        (CONF_MIN_ILLUMINANCE, CONF_MIN_ILLUMINANCE),
+        (CONF_MAX_CONDUCTIVITY, CONF_MAX_CONDUCTIVITY),
+        (CONF_MIN_CONDUCTIVITY, CONF_MIN_CONDUCTIVITY),
+        (CONF_MAX_MOISTURE, CONF_MAX_MOISTURE),
+        (CONF_MIN_MOISTURE, CONF_MIN_MOISTURE),
+        (CONF_MAX_TEMPERATURE, CONF_MAX_TEMPERATURE),
+        (CONF_MIN_TEMPERATURE, CONF_MIN_TEMPERATURE),
+        (CONF_MAX_AIR_TEMPERATURE, CONF_MAX_AIR_TEMPERATURE),
+        (CONF_MIN_AIR_TEMPERATURE, CONF_MIN_AIR_TEMPERATURE),
+        (CONF_MAX_HUMIDITY, CONF_MAX_HUMIDITY),
+        (CONF_MIN_HUMIDITY, CONF_MIN_HUMIDITY),
+        (CONF_MAX_DLI, CONF_MAX_MMOL),
+        (CONF_MIN_DLI, CONF_MIN_MMOL),
+    )
+)
+DEFAULT_LIMITS = {
+    CONF_MAX_ILLUMINANCE: DEFAULT_MAX_ILLUMINANCE,
+    CONF_MIN_ILLUMINANCE: DEFAULT_MIN_ILLUMINANCE,
+    CONF_MAX_CONDUCTIVITY: DEFAULT_MAX_CONDUCTIVITY,
+    CONF_MIN_CONDUCTIVITY: DEFAULT_MIN_CONDUCTIVITY,
+    CONF_MAX_MOISTURE: DEFAULT_MAX_MOISTURE,
+    CONF_MIN_MOISTURE: DEFAULT_MIN_MOISTURE,
+    CONF_MAX_TEMPERATURE: DEFAULT_MAX_TEMPERATURE,
+    CONF_MIN_TEMPERATURE: DEFAULT_MIN_TEMPERATURE,
+    CONF_MAX_AIR_TEMPERATURE: DEFAULT_MAX_AIR_TEMPERATURE,
+    CONF_MIN_AIR_TEMPERATURE: DEFAULT_MIN_AIR_TEMPERATURE,
+    CONF_MAX_HUMIDITY: DEFAULT_MAX_HUMIDITY,
+    CONF_MIN_HUMIDITY: DEFAULT_MIN_HUMIDITY,
+    CONF_MAX_DLI: DEFAULT_MAX_DLI,
+    CONF_MIN_DLI: DEFAULT_MIN_DLI,
+}
+TEMPERATURE_LIMITS = frozenset(
+    {
+        CONF_MAX_TEMPERATURE,
+        CONF_MIN_TEMPERATURE,
+        CONF_MAX_AIR_TEMPERATURE,
+        CONF_MIN_AIR_TEMPERATURE,
+    }
+)
+DLI_LIMITS = frozenset({CONF_MAX_DLI, CONF_MIN_DLI})
+
+
+@lru_cache
+def _temperature_converter(temperature_unit: str) -> Callable[[float], int]:
+    """Convert from °C to the unit system, rounded the same way as display_temp()"""
+    if temperature_unit == UnitOfTemperature.CELSIUS:
+        return round
+    converter = TemperatureConverter.converter_factory(
+        UnitOfTemperature.CELSIUS, temperature_unit
+    )
+    return lambda value: round(converter(value))
+
+
+@lru_cache
+def _default_limits(temperature_unit: str) -> dict[str, int | float]:
+    """The default limits, converted to the unit system"""
+    convert_temperature = _temperature_converter(temperature_unit)
+    return {
+        limit: convert_temperature(DEFAULT_LIMITS[limit])
+        if limit in TEMPERATURE_LIMITS
+        else DEFAULT_LIMITS[limit]
+        for limit, _ in OPB_LIMITS
+    }
+
+
+def limits_from_openplantbook(
+    opb_plant: dict[str, Any], temperature_unit: str
+) -> dict[str, int | float]:
+    """The limits of an OpenPlantbook species, with defaults for missing ones"""
+    limits = dict(_default_limits(temperature_unit))
+    convert_temperature = _temperature_converter(temperature_unit)
+    for limit, opb_key in OPB_LIMITS:
+        value = opb_plant.get(opb_key)
+        if limit in DLI_LIMITS:
+            if value:
+                limits[limit] = round(value * PPFD_DLI_FACTOR)
+        elif limit in TEMPERATURE_LIMITS:
+            if value is not None:
+                limits[limit] = convert_temperature(value)
+        elif value is not None:
+            limits[limit] = value
+    return limits
+
+
+def _find_cached_image(path: str, filename: str) -> str | None:
+    """Return the name of an already cached image, if any"""
+    if not os.path.isdir(path):
+        return None
+    thumbnail = f"{filename}-{DEFAULT_THUMBNAIL_SIZE}.jpg"
+    if os.path.isfile(os.path.join(path, thumbnail)):
+        return thumbnail
+    for cached in os.listdir(path):
+        if os.path.splitext(cached)[0] == filename:
+            return cached
+    return None
+
+
+def _store_image(image: bytes, path: str, filename: str, extension: str) -> str:
+    """Store the original image and a thumbnail of it.  Runs in the executor."""
+    os.makedirs(path, exist_ok=True)
+    original = f"{filename}{extension}"
+    with open(os.path.join(path, original), "wb") as image_file:
+        image_file.write(image)
+
+    try:
+        # pylint: disable=import-outside-toplevel
+        from PIL import Image
+    except ImportError:
+        _LOGGER.debug("Pillow is not available. Using the original image")
+        return original
+
+    thumbnail = f"{filename}-{DEFAULT_THUMBNAIL_SIZE}.jpg"
+    try:
+        with Image.open(io.BytesIO(image)) as img:
+            img.thumbnail((DEFAULT_THUMBNAIL_SIZE, DEFAULT_THUMBNAIL_SIZE))
+            img.convert("RGB").save(
+                os.path.join(path, thumbnail), "JPEG", optimize=True, quality=85
+            )
+    except OSError as ex:
+        _LOGGER.warning("Unable to create thumbnail for %s: %s", original, ex)
+        return original
+    return thumbnail
+
 
 class PlantHelper:
     """Helper functions for the plant integration"""
 
     def __init__(self, hass: HomeAssistant) -> None:
         self.hass = hass
+        # Species already fetched from OpenPlantbook by this helper
+        self._opb_cache: dict[str, dict[str, Any] | None] = {}
 
     @property
     def has_openplantbook(self) -> bool:
@@ -129,12 +274,15 @@ class PlantHelper:
             return plant_search_result
         return None
 
+    @instrumented(METRIC_OPB_CALL)
     async def openplantbook_get(self, species: str) -> dict[str:Any] | None:
         """Get information about a plant species from OpenPlantbook"""
         if not self.has_openplantbook:
             return None
         if not species or species == "":
             return None
+        if species.lower() in self._opb_cache:
+            return self._opb_cache[species.lower()]
 
         try:
             async with timeout(REQUEST_TIMEOUT):
@@ -147,13 +295,16 @@ class PlantHelper:
                 )
         except TimeoutError:
             _LOGGER.warning("Openplantook request timed out")
+            return None
         except Exception as ex:
             _LOGGER.warning("Openplantook does not work, error: %s", ex)
             return None
         if bool(plant_get_result):
             _LOGGER.debug("Result for %s: %s", species, plant_get_result)
+            self._opb_cache[species.lower()] = plant_get_result
             return plant_get_result
 
+        self._opb_cache[species.lower()] = None
         _LOGGER.info("Did not find '%s' in OpenPlantbook", species)
         create_notification(
             hass=self.hass,
@@ -162,43 +313,48 @@ class PlantHelper:
         )
         return None
 
+    async def cache_image(self, image_url: str, species: str | None) -> str | None:
+        """Store a remote image locally and return the /local/ url of the thumbnail"""
+        if not image_url or not image_url.startswith("http"):
+            return None
+
+        image_path = f"{DEFAULT_IMAGE_PATH}{DEFAULT_IMAGE_CACHE_DIR}"
+        # Keyed by the url, so a new image for a species is downloaded again
+        url_hash = hashlib.sha256(image_url.encode()).hexdigest()[:16]
+        prefix = slugify(species or os.path.basename(urlparse(image_url).path))
+        filename = f"{prefix}-{url_hash}"
+        cached = await self.hass.async_add_executor_job(
+            _find_cached_image, image_path, filename
+        )
+        if cached is None:
+            _LOGGER.debug("Downloading %s to the image cache", image_url)
+            try:
+                async with timeout(REQUEST_TIMEOUT):
+                    response = await async_get_clientsession(self.hass).get(image_url)
+                    response.raise_for_status()
+                    image = await response.read()
+            except TimeoutError:
+                _LOGGER.warning("Timed out downloading image %s", image_url)
+                return None
+            except aiohttp.ClientError as ex:
+                _LOGGER.warning("Unable to download image %s: %s", image_url, ex)
+                return None
+            extension = os.path.splitext(urlparse(image_url).path)[1] or ".jpg"
+            try:
+                cached = await self.hass.async_add_executor_job(
+                    _store_image, image, image_path, filename, extension
+                )
+            except OSError as ex:
+                _LOGGER.warning("Unable to store image in %s: %s", image_path, ex)
+                return None
+
+        return f"{DEFAULT_IMAGE_LOCAL_URL}{DEFAULT_IMAGE_CACHE_DIR}{cached}"
+
     async def generate_configentry(self, config: dict) -> dict[str:Any]:
         """Generates a config-entry dict from current data and/or OPB"""
 
-        max_moisture = DEFAULT_MAX_MOISTURE
-        min_moisture = DEFAULT_MIN_MOISTURE
-        max_light_lx = DEFAULT_MAX_ILLUMINANCE
-        min_light_lx = DEFAULT_MIN_ILLUMINANCE
-        max_temp = display_temp(
-            self.hass,
-            DEFAULT_MAX_TEMPERATURE,
-            UnitOfTemperature.CELSIUS,
-            0,
-        )
-        min_temp = display_temp(
-            self.hass,
-            DEFAULT_MIN_TEMPERATURE,
-            UnitOfTemperature.CELSIUS,
-            0,
-        )
-        max_air_temp = display_temp(
-            self.hass,
-            DEFAULT_MAX_AIR_TEMPERATURE,
-            UnitOfTemperature.CELSIUS,
-            0,
-        )
-        min_air_temp = display_temp(
-            self.hass,
-            DEFAULT_MIN_AIR_TEMPERATURE,
-            UnitOfTemperature.CELSIUS,
-            0,
-        )
-        max_conductivity = DEFAULT_MAX_CONDUCTIVITY
-        min_conductivity = DEFAULT_MIN_CONDUCTIVITY
-        max_dli = DEFAULT_MAX_DLI
-        min_dli = DEFAULT_MIN_DLI
-        max_humidity = DEFAULT_MAX_HUMIDITY
-        min_humidity = DEFAULT_MIN_HUMIDITY
+        temperature_unit = self.hass.config.units.temperature_unit
+        limits = dict(_default_limits(temperature_unit))
         entity_picture = None
         display_species = None
         data_source = DATA_SOURCE_DEFAULT
@@ -239,78 +395,8 @@ class PlantHelper:
         opb_plant = await self.openplantbook_get(config.get(ATTR_SPECIES))
         if opb_plant:
             data_source = DATA_SOURCE_PLANTBOOK
-            max_moisture = opb_plant.get(
-                CONF_PLANTBOOK_MAPPING[CONF_MAX_MOISTURE], DEFAULT_MAX_MOISTURE
-            )
-            min_moisture = opb_plant.get(
-                CONF_PLANTBOOK_MAPPING[CONF_MIN_MOISTURE], DEFAULT_MIN_MOISTURE
-            )
-            max_light_lx = opb_plant.get(
-                CONF_PLANTBOOK_MAPPING[CONF_MAX_ILLUMINANCE],
-                DEFAULT_MAX_ILLUMINANCE,
-            )
-            min_light_lx = opb_plant.get(
-                CONF_PLANTBOOK_MAPPING[CONF_MIN_ILLUMINANCE],
-                DEFAULT_MIN_ILLUMINANCE,
-            )
-            max_temp = display_temp(
-                self.hass,
-                opb_plant.get(
-                    CONF_PLANTBOOK_MAPPING[CONF_MAX_TEMPERATURE],
-                    DEFAULT_MAX_TEMPERATURE,
-                ),
-                UnitOfTemperature.CELSIUS,
-                0,
-            )
-            min_temp = display_temp(
-                self.hass,
-                opb_plant.get(
-                    CONF_PLANTBOOK_MAPPING[CONF_MIN_TEMPERATURE],
-                    DEFAULT_MIN_TEMPERATURE,
-                ),
-                UnitOfTemperature.CELSIUS,
-                0,
-            )
-            max_air_temp = display_temp(
-        self.hass,
-        opb_plant.get(
-            CONF_PLANTBOOK_MAPPING.get("max_air_temp"), DEFAULT_MAX_AIR_TEMPERATURE
-                ),
-                UnitOfTemperature.CELSIUS,
-                0,
-            )
-            min_air_temp = display_temp(
-                self.hass,
-                opb_plant.get(
-                    CONF_PLANTBOOK_MAPPING.get("min_air_temp"), DEFAULT_MIN_AIR_TEMPERATURE
-                ),
-                UnitOfTemperature.CELSIUS,
-                0,
-            )
-            opb_mmol = opb_plant.get(CONF_PLANTBOOK_MAPPING[CONF_MAX_MMOL])
-            if opb_mmol:
-                max_dli = round(opb_mmol * PPFD_DLI_FACTOR)
-            else:
-                max_dli = DEFAULT_MAX_DLI
-            opb_mmol = opb_plant.get(CONF_PLANTBOOK_MAPPING[CONF_MIN_MMOL])
-            if opb_mmol:
-                min_dli = round(opb_mmol * PPFD_DLI_FACTOR)
-            else:
-                min_dli = DEFAULT_MIN_DLI
-            max_conductivity = opb_plant.get(
-                CONF_PLANTBOOK_MAPPING[CONF_MAX_CONDUCTIVITY],
-                DEFAULT_MAX_CONDUCTIVITY,
-            )
-            min_conductivity = opb_plant.get(
-                CONF_PLANTBOOK_MAPPING[CONF_MIN_CONDUCTIVITY],
-                DEFAULT_MIN_CONDUCTIVITY,
-            )
-            max_humidity = opb_plant.get(
-                CONF_PLANTBOOK_MAPPING[CONF_MAX_HUMIDITY], DEFAULT_MAX_HUMIDITY
-            )
-            min_humidity = opb_plant.get(
-                CONF_PLANTBOOK_MAPPING[CONF_MIN_HUMIDITY], DEFAULT_MIN_HUMIDITY
-            )
+            limits = limits_from_openplantbook(opb_plant, temperature_unit)
+
             _LOGGER.info("Picture: %s", entity_picture)
             if (
                 entity_picture is None
@@ -339,6 +425,15 @@ class PlantHelper:
         _LOGGER.debug("Parsing input config: %s", config)
         _LOGGER.debug("Display pid: %s", display_species)
 
+        # Values given in the config always win
+        for limit in limits:
+            if limit in config:
+                limits[limit] = config[limit]
+        if CONF_MAX_BRIGHTNESS in config:
+            limits[CONF_MAX_ILLUMINANCE] = config[CONF_MAX_BRIGHTNESS]
+        if CONF_MIN_BRIGHTNESS in config:
+            limits[CONF_MIN_ILLUMINANCE] = config[CONF_MIN_BRIGHTNESS]
+
         ret = {
             DATA_SOURCE: data_source,
             FLOW_PLANT_INFO: {
@@ -346,36 +441,12 @@ class PlantHelper:
                 ATTR_SPECIES: config.get(ATTR_SPECIES) or "",
                 ATTR_ENTITY_PICTURE: entity_picture or "",
                 OPB_DISPLAY_PID: display_species or "",
-                ATTR_LIMITS: {
-                    CONF_MAX_ILLUMINANCE: config.get(
-                        CONF_MAX_BRIGHTNESS,
-                        config.get(CONF_MAX_ILLUMINANCE, max_light_lx),
-                    ),
-                    CONF_MIN_ILLUMINANCE: config.get(
-                        CONF_MIN_BRIGHTNESS,
-                        config.get(CONF_MIN_ILLUMINANCE, min_light_lx),
-                    ),
-                    CONF_MAX_CONDUCTIVITY: config.get(
-                        CONF_MAX_CONDUCTIVITY, max_conductivity
-                    ),
-                    CONF_MIN_CONDUCTIVITY: config.get(
-                        CONF_MIN_CONDUCTIVITY, min_conductivity
-                    ),
-                    CONF_MAX_MOISTURE: config.get(CONF_MAX_MOISTURE, max_moisture),
-                    CONF_MIN_MOISTURE: config.get(CONF_MIN_MOISTURE, min_moisture),
-                    CONF_MAX_TEMPERATURE: config.get(CONF_MAX_TEMPERATURE, max_temp),
-                    CONF_MIN_TEMPERATURE: config.get(CONF_MIN_TEMPERATURE, min_temp),
-                    CONF_MAX_AIR_TEMPERATURE: config.get(CONF_MAX_AIR_TEMPERATURE, max_air_temp),
-                    CONF_MIN_AIR_TEMPERATURE: config.get(CONF_MIN_AIR_TEMPERATURE, min_air_temp),
-                    CONF_MAX_HUMIDITY: config.get(CONF_MAX_HUMIDITY, max_humidity),
-                    CONF_MIN_HUMIDITY: config.get(CONF_MIN_HUMIDITY, min_humidity),
-                    CONF_MAX_DLI: config.get(CONF_MAX_DLI, max_dli),
-                    CONF_MIN_DLI: config.get(CONF_MIN_DLI, min_dli),
-                },
+                ATTR_LIMITS: limits,
                 FLOW_SENSOR_TEMPERATURE: config[ATTR_SENSORS].get(ATTR_TEMPERATURE),
                 FLOW_SENSOR_AIR_TEMPERATURE: config[ATTR_SENSORS].get(ATTR_AIR_TEMPERATURE),
                 FLOW_SENSOR_MOISTURE: config[ATTR_SENSORS].get(ATTR_MOISTURE),
                 FLOW_SENSOR_CONDUCTIVITY: config[ATTR_SENSORS].get(ATTR_CONDUCTIVITY),
+                FLOW_SENSOR_HUMIDITY: config[ATTR_SENSORS].get(ATTR_HUMIDITY),
                 FLOW_SENSOR_ILLUMINANCE: config[ATTR_SENSORS].get(ATTR_ILLUMINANCE)
                 or config[ATTR_SENSORS].get(ATTR_BRIGHTNESS),
             },
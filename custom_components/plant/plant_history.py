@@ -0,0 +1,128 @@
+"""Rolling min, max and mean of the readings of a meter
+
+The readings are aggregated in buckets of HISTORY_BUCKET seconds, so the
+memory used by a window is bounded by the number of buckets, no matter how
+often the sensor reports.  The min and max of the window are kept in
+monotonic deques, and the mean in running sums, so adding a reading and
+reading the aggregates are both O(1) (amortized).
+"""
+
+from __future__ import annotations
+
+from collections import deque
+import time
+from typing import Any
+
+from .const import HISTORY_BUCKET, HISTORY_WINDOW
+
+
+class RollingWindow:
+    """Min, max and mean of the readings of the last window seconds"""
+
+    __slots__ = (
+        "window",
+        "bucket",
+        "_buckets",
+        "_mins",
+        "_maxs",
+        "_sum",
+        "_count",
+        "_start",
+        "_min",
+        "_max",
+        "_bucket_sum",
+        "_bucket_count",
+    )
+
+    def __init__(
+        self, window: float = HISTORY_WINDOW, bucket: float = HISTORY_BUCKET
+    ) -> None:
+        """Initialize an empty window"""
+        self.window = window
+        self.bucket = bucket
+        # Closed buckets: (start, sum, count)
+        self._buckets: deque[tuple[float, float, int]] = deque()
+        # (start, min) with increasing mins, and (start, max) with decreasing maxs
+        self._mins: deque[tuple[float, float]] = deque()
+        self._maxs: deque[tuple[float, float]] = deque()
+        self._sum = 0.0
+        self._count = 0
+        # The bucket that is currently being filled
+        self._start: float | None = None
+        self._min = 0.0
+        self._max = 0.0
+        self._bucket_sum = 0.0
+        self._bucket_count = 0
+
+    def add(self, value: float, now: float | None = None) -> None:
+        """Add a reading"""
+        if now is None:
+            now = time.monotonic()
+        if self._start is not None and now >= self._start + self.bucket:
+            self._close()
+        if self._start is None:
+            self._start = now - now % self.bucket
+            self._min = self._max = value
+        elif value < self._min:
+            self._min = value
+        elif value > self._max:
+            self._max = value
+        self._bucket_sum += value
+        self._bucket_count += 1
+        self._expire(now)
+
+    def _close(self) -> None:
+        """Move the current bucket to the closed buckets"""
+        start = self._start
+        self._buckets.append((start, self._bucket_sum, self._bucket_count))
+        self._sum += self._bucket_sum
+        self._count += self._bucket_count
+        mins = self._mins
+        while mins and mins[-1][1] >= self._min:
+            mins.pop()
+        mins.append((start, self._min))
+        maxs = self._maxs
+        while maxs and maxs[-1][1] <= self._max:
+            maxs.pop()
+        maxs.append((start, self._max))
+        self._start = None
+        self._bucket_sum = 0.0
+        self._bucket_count = 0
+
+    def _expire(self, now: float) -> None:
+        """Drop the buckets that are no longer in the window"""
+        oldest = now - self.window
+        buckets = self._buckets
+        while buckets and buckets[0][0] < oldest:
+            _, bucket_sum, bucket_count = buckets.popleft()
+            self._sum -= bucket_sum
+            self._count -= bucket_count
+        if not buckets:
+            # Do not let rounding errors pile up
+            self._sum = 0.0
+        while self._mins and self._mins[0][0] < oldest:
+            self._mins.popleft()
+        while self._maxs and self._maxs[0][0] < oldest:
+            self._maxs.popleft()
+        if self._start is not None and self._start < oldest:
+            self._start = None
+            self._bucket_sum = 0.0
+            self._bucket_count = 0
+
+    def stats(self, now: float | None = None) -> dict[str, Any]:
+        """The min, max, mean and number of readings in the window"""
+        self._expire(time.monotonic() if now is None else now)
+        lows = [self._mins[0][1]] if self._mins else []
+        highs = [self._maxs[0][1]] if self._maxs else []
+        if self._start is not None:
+            lows.append(self._min)
+            highs.append(self._max)
+        count = self._count + self._bucket_count
+        if not count:
+            return {"min": None, "max": None, "mean": None, "count": 0}
+        return {
+            "min": min(lows),
+            "max": max(highs),
+            "mean": round((self._sum + self._bucket_sum) / count, 2),
+            "count": count,
+        }
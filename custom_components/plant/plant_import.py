@@ -0,0 +1,191 @@
+"""Bulk import of plants from YAML or CSV files"""
+
+from __future__ import annotations
+
+import asyncio
+import csv
+import logging
+import os
+from typing import Any
+
+from homeassistant.components.persistent_notification import (
+    async_create as async_create_notification,
+)
+from homeassistant.config_entries import SOURCE_IMPORT
+from homeassistant.const import ATTR_NAME
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util.yaml import load_yaml
+
+from .const import (
+    ATTR_AIR_TEMPERATURE,
+    ATTR_BRIGHTNESS,
+    ATTR_CONDUCTIVITY,
+    ATTR_HUMIDITY,
+    ATTR_ILLUMINANCE,
+    ATTR_IMAGE,
+    ATTR_MOISTURE,
+    ATTR_SENSORS,
+    ATTR_SPECIES,
+    ATTR_TEMPERATURE,
+    DOMAIN,
+    FLOW_PLANT_INFO,
+    IMPORT_BATCH_SIZE,
+    IMPORT_CONCURRENCY,
+)
+from .plant_helpers import DEFAULT_LIMITS, PlantHelper
+
+_LOGGER = logging.getLogger(__name__)
+
+IMPORT_NOTIFICATION_ID = f"{DOMAIN}_import"
+
+# Columns in a CSV file that refer to sensors
+CSV_SENSOR_COLUMNS = (
+    ATTR_TEMPERATURE,
+    ATTR_AIR_TEMPERATURE,
+    ATTR_MOISTURE,
+    ATTR_CONDUCTIVITY,
+    ATTR_ILLUMINANCE,
+    ATTR_BRIGHTNESS,
+    ATTR_HUMIDITY,
+)
+
+
+def _read_csv(path: str) -> dict[str, dict[str, Any]]:
+    """Read plants from a CSV file with one plant per row"""
+    plants = {}
+    with open(path, encoding="utf-8", newline="") as csv_file:
+        for row_number, row in enumerate(csv.DictReader(csv_file), start=1):
+            plant = {ATTR_SENSORS: {}}
+            for column, value in row.items():
+                if column is None or value is None or value.strip() == "":
+                    continue
+                column = column.strip().lower()
+                value = value.strip()
+                if column in CSV_SENSOR_COLUMNS:
+                    plant[ATTR_SENSORS][column] = value
+                elif column in DEFAULT_LIMITS:
+                    plant[column] = float(value)
+                else:
+                    plant[column] = value
+            plants[plant.get("id", f"plant_{row_number}")] = plant
+    return plants
+
+
+def read_plants_file(path: str) -> dict[str, dict[str, Any]]:
+    """Read plants from a YAML or CSV file.  Runs in the executor."""
+    if os.path.splitext(path)[1].lower() == ".csv":
+        return _read_csv(path)
+    plants = load_yaml(path)
+    if isinstance(plants, dict) and isinstance(plants.get(DOMAIN), dict):
+        # Allow the old configuration.yaml format as well
+        plants = plants[DOMAIN]
+    if not isinstance(plants, dict):
+        raise HomeAssistantError(f"No plants found in {path}")
+    return plants
+
+
+async def async_import_plants(
+    hass: HomeAssistant, plants: dict[str, dict[str, Any]]
+) -> dict[str, int]:
+    """Create config entries for a number of plants"""
+
+    plant_helper = PlantHelper(hass)
+    existing = {entry.title for entry in hass.config_entries.async_entries(DOMAIN)}
+    result = {"imported": 0, "skipped": 0, "failed": 0}
+
+    to_import = {}
+    for plant_id, config in plants.items():
+        if not isinstance(config, dict):
+            _LOGGER.warning("Invalid config for %s: %s", plant_id, config)
+            result["failed"] += 1
+            continue
+        config = dict(config)
+        if ATTR_NAME not in config:
+            config[ATTR_NAME] = str(plant_id).replace("_", " ").capitalize()
+        if config[ATTR_NAME] in existing:
+            _LOGGER.info("Plant %s already exists. Skipping", config[ATTR_NAME])
+            result["skipped"] += 1
+            continue
+        if ATTR_IMAGE in config and config[ATTR_IMAGE] is None:
+            config.pop(ATTR_IMAGE)
+        existing.add(config[ATTR_NAME])
+        to_import[plant_id] = config
+
+    # Look up every species only once, and a few at a time.
+    # The helper caches the result, so generate_configentry will not
+    # call OpenPlantbook again.
+    semaphore = asyncio.Semaphore(IMPORT_CONCURRENCY)
+
+    async def _fetch_species(species: str) -> None:
+        async with semaphore:
+            await plant_helper.openplantbook_get(species)
+
+    species = {
+        str(config[ATTR_SPECIES]).lower()
+        for config in to_import.values()
+        if config.get(ATTR_SPECIES)
+    }
+    _LOGGER.debug("Looking up %s species in OpenPlantbook", len(species))
+    await asyncio.gather(*(_fetch_species(s) for s in species))
+
+    plant_configs = []
+    for config in to_import.values():
+        plant_configs.append(await plant_helper.generate_configentry(config=config))
+
+    total = len(plant_configs)
+    for start in range(0, total, IMPORT_BATCH_SIZE):
+        batch = plant_configs[start : start + IMPORT_BATCH_SIZE]
+        flows = await asyncio.gather(
+            *(
+                hass.config_entries.flow.async_init(
+                    DOMAIN, context={"source": SOURCE_IMPORT}, data=plant_config
+                )
+                for plant_config in batch
+            ),
+            return_exceptions=True,
+        )
+        for plant_config, flow in zip(batch, flows):
+            if isinstance(flow, Exception):
+                _LOGGER.error(
+                    "Unable to import %s: %s",
+                    plant_config[FLOW_PLANT_INFO][ATTR_NAME],
+                    flow,
+                )
+                result["failed"] += 1
+            else:
+                result["imported"] += 1
+
+        _LOGGER.info("Imported %s of %s plants", min(start + len(batch), total), total)
+        async_create_notification(
+            hass,
+            f"Imported {min(start + len(batch), total)} of {total} plants.",
+            title="Plant import",
+            notification_id=IMPORT_NOTIFICATION_ID,
+        )
+
+    _LOGGER.info("Plant import done: %s", result)
+    async_create_notification(
+        hass,
+        f"Imported {result['imported']} plants. "
+        f"{result['skipped']} already existed and {result['failed']} failed.",
+        title="Plant import",
+        notification_id=IMPORT_NOTIFICATION_ID,
+    )
+    return result
+
+
+async def async_import_plants_from_file(
+    hass: HomeAssistant, path: str
+) -> dict[str, int]:
+    """Import all plants from a YAML or CSV file"""
+    if not os.path.isabs(path):
+        path = hass.config.path(path)
+    if not hass.config.is_allowed_path(path):
+        raise HomeAssistantError(f"Access to {path} is not allowed")
+    try:
+        plants = await hass.async_add_executor_job(read_plants_file, path)
+    except (OSError, ValueError) as ex:
+        raise HomeAssistantError(f"Unable to read plants from {path}: {ex}") from ex
+    _LOGGER.info("Importing %s plants from %s", len(plants), path)
+    return await async_import_plants(hass, plants)
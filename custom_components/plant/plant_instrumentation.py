@@ -0,0 +1,349 @@
+"""Optional instrumentation of the plant integration
+
+Counts and times the code that runs most often, so it is possible to see if
+the plant integration is the reason Home Assistant is slow.  Everything is
+disabled by default, and then costs a single attribute lookup per call.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from bisect import bisect_left
+import cProfile
+import heapq
+from collections.abc import Callable
+import functools
+import logging
+import time
+from typing import Any
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+
+from .const import DATA_INSTRUMENTATION, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# Upper bounds of the latency buckets, in milliseconds
+LATENCY_BUCKETS = (0.01, 0.05, 0.1, 0.5, 1, 5, 10, 50, 100, 500, 1000)
+
+METRIC_METER_EVENT = "meter_event"
+METRIC_THRESHOLD_EVENT = "threshold_event"
+METRIC_EVALUATION = "evaluation"
+METRIC_STATE_WRITE = "state_write"
+METRIC_OPB_CALL = "opb_call"
+METRIC_WEBSOCKET = "websocket_request"
+
+# Number of slow calls we keep, and how often we log a warning about them
+SLOW_CALLS_KEPT = 25
+SLOW_CALL_LOG_INTERVAL = 60
+
+
+class LatencyHistogram:
+    """Number of calls, total and max time, and a histogram of the latency"""
+
+    __slots__ = ("count", "total", "max", "buckets")
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram"""
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def add(self, seconds: float) -> None:
+        """Add a measurement"""
+        milliseconds = seconds * 1000
+        self.count += 1
+        self.total += milliseconds
+        if milliseconds > self.max:
+            self.max = milliseconds
+        self.buckets[bisect_left(LATENCY_BUCKETS, milliseconds)] += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """The histogram as a dict"""
+        buckets = {
+            f"<={bound}ms": count
+            for bound, count in zip(LATENCY_BUCKETS, self.buckets)
+            if count
+        }
+        if self.buckets[-1]:
+            buckets[f">{LATENCY_BUCKETS[-1]}ms"] = self.buckets[-1]
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total / self.count, 3) if self.count else None,
+            "max_ms": round(self.max, 3),
+            "buckets": buckets,
+        }
+
+
+class PlantInstrumentation:
+    """Counters and latency histograms for the plant integration"""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the instrumentation, disabled"""
+        self._hass = hass
+        # Whether anything is timed at all. Checked on every call.
+        self.enabled = False
+        self.metrics_enabled = False
+        self.slow_call_threshold: float | None = None
+        self.since = None
+        self.metrics: dict[str, LatencyHistogram] = {}
+        self.counters: dict[str, int] = {}
+        # Per config entry: metric -> [count, total ms]
+        self.entries: dict[str, dict[str, list[float]]] = {}
+        self._unsub_state_writes: CALLBACK_TYPE | None = None
+        self._profiler: cProfile.Profile | None = None
+        # Min-heap of (ms, sequence, call), so the fastest of the slow calls
+        # is the one that is replaced
+        self._slow_calls: list[tuple[float, int, dict[str, Any]]] = []
+        self._slow_call_sequence = 0
+        self._slow_calls_suppressed = 0
+        self._last_slow_call_warning = 0.0
+
+    @callback
+    def async_enable(self, enabled: bool = True, reset: bool = False) -> None:
+        """Turn the instrumentation on or off"""
+        if reset or (enabled and not self.metrics_enabled):
+            self.reset()
+        self.metrics_enabled = enabled
+        self.enabled = enabled or self.slow_call_threshold is not None
+        if enabled and self._unsub_state_writes is None:
+            self._unsub_state_writes = self._hass.bus.async_listen(
+                EVENT_STATE_CHANGED,
+                self._async_state_written,
+                event_filter=self._is_plant_entity,
+            )
+        elif not enabled and self._unsub_state_writes is not None:
+            self._unsub_state_writes()
+            self._unsub_state_writes = None
+        _LOGGER.info("Plant instrumentation %s", "enabled" if enabled else "disabled")
+
+    def reset(self) -> None:
+        """Forget everything we have measured"""
+        self.since = dt_util.utcnow()
+        self.metrics = {}
+        self.counters = {}
+        self.entries = {}
+
+    @callback
+    def _is_plant_entity(self, event_data: dict[str, Any]) -> bool:
+        """Whether a state_changed event is for one of our entities"""
+        # Looked up for every event, so entities added later are counted too
+        entry = er.async_get(self._hass).async_get(event_data["entity_id"])
+        return entry is not None and entry.platform == DOMAIN
+
+    @callback
+    def _async_state_written(self, event: Event) -> None:
+        """Count the state writes of our entities"""
+        self.count(METRIC_STATE_WRITE)
+
+    def count(self, metric: str) -> None:
+        """Increase a counter"""
+        self.counters[metric] = self.counters.get(metric, 0) + 1
+
+    @callback
+    def async_detect_slow_calls(
+        self, threshold: float | None, reset: bool = False
+    ) -> None:
+        """Log calls that take longer than threshold seconds.  None turns it off"""
+        if reset:
+            self._slow_calls = []
+            self._slow_calls_suppressed = 0
+        self.slow_call_threshold = threshold or None
+        self.enabled = self.metrics_enabled or self.slow_call_threshold is not None
+        if self.slow_call_threshold is None:
+            _LOGGER.info("Detection of slow plant calls disabled")
+        else:
+            _LOGGER.info(
+                "Logging plant calls that take more than %.1fms",
+                self.slow_call_threshold * 1000,
+            )
+
+    def record(
+        self, metric: str, seconds: float, entity: Any = None, blocking: bool = True
+    ) -> None:
+        """Record the time spent in a call"""
+        if (
+            blocking
+            and self.slow_call_threshold is not None
+            and seconds > self.slow_call_threshold
+        ):
+            self._slow_call(metric, seconds, entity)
+        if not self.metrics_enabled:
+            return
+        if metric not in self.metrics:
+            self.metrics[metric] = LatencyHistogram()
+        self.metrics[metric].add(seconds)
+        entry_id = _entry_id(entity)
+        if entry_id is not None:
+            entry = self.entries.setdefault(entry_id, {})
+            if metric not in entry:
+                entry[metric] = [0, 0.0]
+            entry[metric][0] += 1
+            entry[metric][1] += seconds * 1000
+
+    def _slow_call(self, metric: str, seconds: float, entity: Any) -> None:
+        """Keep track of, and warn about, a call that blocked the event loop"""
+        milliseconds = round(seconds * 1000, 3)
+        entity_id = getattr(entity, "entity_id", None)
+        plant = getattr(entity, "_plant", entity)
+        call = {
+            "metric": metric,
+            "ms": milliseconds,
+            "entity_id": entity_id,
+            "plant": getattr(plant, "entity_id", None),
+            "time": dt_util.utcnow().isoformat(),
+        }
+        self._slow_call_sequence += 1
+        item = (milliseconds, self._slow_call_sequence, call)
+        if len(self._slow_calls) < SLOW_CALLS_KEPT:
+            heapq.heappush(self._slow_calls, item)
+        elif milliseconds > self._slow_calls[0][0]:
+            heapq.heapreplace(self._slow_calls, item)
+
+        now = time.monotonic()
+        if now - self._last_slow_call_warning < SLOW_CALL_LOG_INTERVAL:
+            self._slow_calls_suppressed += 1
+            return
+        self._last_slow_call_warning = now
+        _LOGGER.warning(
+            "%s for %s (%s) took %.1fms%s",
+            metric,
+            entity_id,
+            call["plant"],
+            milliseconds,
+            (
+                f". {self._slow_calls_suppressed} more slow calls since the last warning"
+                if self._slow_calls_suppressed
+                else ""
+            ),
+        )
+        self._slow_calls_suppressed = 0
+
+    @property
+    def slow_calls(self) -> list[dict[str, Any]]:
+        """The slowest calls, slowest first"""
+        return [call for _, _, call in sorted(self._slow_calls, reverse=True)]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Everything we have measured"""
+        return {
+            "enabled": self.metrics_enabled,
+            "slow_call_threshold_ms": (
+                self.slow_call_threshold * 1000
+                if self.slow_call_threshold is not None
+                else None
+            ),
+            "slow_calls": self.slow_calls,
+            "since": self.since.isoformat() if self.since else None,
+            "counters": dict(self.counters),
+            "metrics": {
+                metric: histogram.as_dict()
+                for metric, histogram in self.metrics.items()
+            },
+        }
+
+    def entry_as_dict(self, entry_id: str) -> dict[str, Any]:
+        """What we have measured for a single plant"""
+        return {
+            metric: {
+                "count": count,
+                "mean_ms": round(total / count, 3) if count else None,
+            }
+            for metric, (count, total) in self.entries.get(entry_id, {}).items()
+        }
+
+    async def async_profile(self, seconds: float, path: str) -> None:
+        """Run cProfile for a number of seconds and write the stats to a file"""
+        if self._profiler is not None:
+            raise HomeAssistantError("A profile is already running")
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError as ex:
+            # Only one profiler can be active at a time
+            raise HomeAssistantError(f"Unable to start profiling: {ex}") from ex
+        self._profiler = profiler
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            profiler.disable()
+            self._profiler = None
+        await self._hass.async_add_executor_job(profiler.dump_stats, path)
+        _LOGGER.info("Wrote %s seconds of profiling data to %s", seconds, path)
+
+
+def _get_instrumentation(entity: Any) -> PlantInstrumentation | None:
+    """The instrumentation, if it is enabled"""
+    hass = entity.hass
+    if hass is None:
+        return None
+    instrumentation = hass.data.get(DATA_INSTRUMENTATION)
+    if instrumentation is None or not instrumentation.enabled:
+        return None
+    return instrumentation
+
+
+def _entry_id(entity: Any) -> str | None:
+    """The config entry the entity belongs to"""
+    config = getattr(entity, "_config", None)
+    return getattr(config, "entry_id", None)
+
+
+def instrumented(metric: str) -> Callable:
+    """Decorator that times a method when the instrumentation is enabled"""
+
+    def decorator(func: Callable) -> Callable:
+        if asyncio.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(self, *args, **kwargs):
+                instrumentation = _get_instrumentation(self)
+                if instrumentation is None:
+                    return await func(self, *args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return await func(self, *args, **kwargs)
+                finally:
+                    # The time spent awaiting does not block anything
+                    instrumentation.record(
+                        metric, time.perf_counter() - start, self, blocking=False
+                    )
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            instrumentation = _get_instrumentation(self)
+            if instrumentation is None:
+                return func(self, *args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(self, *args, **kwargs)
+            finally:
+                instrumentation.record(metric, time.perf_counter() - start, self)
+
+        return wrapper
+
+    return decorator
+
+
+def instrumented_websocket(func: Callable) -> Callable:
+    """Decorator that times a websocket handler when the instrumentation is enabled"""
+
+    @functools.wraps(func)
+    def wrapper(hass: HomeAssistant, connection: Any, msg: dict) -> None:
+        instrumentation = hass.data.get(DATA_INSTRUMENTATION)
+        if instrumentation is None or not instrumentation.enabled:
+            return func(hass, connection, msg)
+        start = time.perf_counter()
+        try:
+            return func(hass, connection, msg)
+        finally:
+            instrumentation.record(METRIC_WEBSOCKET, time.perf_counter() - start)
+
+    return wrapper
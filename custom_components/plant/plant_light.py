@@ -0,0 +1,50 @@
+"""Integral of the light a plant gets, from its illuminance readings
+
+The illuminance is converted to PPFD and integrated trapezoidally between
+the readings, like the integration sensor that was used before.
+"""
+
+from __future__ import annotations
+
+from .const import DEFAULT_LUX_TO_PPFD
+
+
+def lux_to_ppfd(value: float) -> float:
+    """
+    Returns a calculated PPFD-value from the lx-value
+
+    See https://community.home-assistant.io/t/light-accumulation-for-xiaomi-flower-sensor/111180/3
+    https://www.apogeeinstruments.com/conversion-ppfd-to-lux/
+    mol/m²/s
+    """
+    return value * DEFAULT_LUX_TO_PPFD / 1000000
+
+
+class LightIntegral:
+    """The light of the current period, in mol/m²"""
+
+    __slots__ = ("total", "_ppfd", "_time")
+
+    def __init__(self, total: float = 0.0) -> None:
+        """Initialize a period"""
+        self.total = total
+        # The last reading, as PPFD, and the time it came in
+        self._ppfd = 0.0
+        self._time: float | None = None
+
+    def add(self, lux: float, now: float) -> None:
+        """Add the light since the previous reading"""
+        ppfd = lux_to_ppfd(lux)
+        if self._time is not None:
+            self.total += (self._ppfd + ppfd) / 2 * (now - self._time)
+        self._ppfd = ppfd
+        self._time = now
+
+    def close(self, now: float) -> float:
+        """End the period, and start the next one.  Returns the light of the period."""
+        if self._time is not None:
+            # The light between the last reading and the end of the period
+            self.total += self._ppfd * (now - self._time)
+            self._time = now
+        total, self.total = self.total, 0.0
+        return total
@@ -0,0 +1,228 @@
+"""Synthetic load generator for the plant integration
+
+Creates a number of virtual sensors, and optionally plants using them, and
+feeds them with readings at a configurable rate.  Used to reproduce the load
+of large installations without real hardware.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import heapq
+import logging
+import random
+import time
+from typing import Any
+
+from homeassistant.const import (
+    ATTR_DEVICE_CLASS,
+    ATTR_UNIT_OF_MEASUREMENT,
+    LIGHT_LUX,
+    PERCENTAGE,
+    STATE_UNAVAILABLE,
+    UnitOfTemperature,
+)
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    ATTR_AIR_TEMPERATURE,
+    ATTR_CONDUCTIVITY,
+    ATTR_HUMIDITY,
+    ATTR_ILLUMINANCE,
+    ATTR_MOISTURE,
+    ATTR_SENSORS,
+    ATTR_TEMPERATURE,
+    DOMAIN,
+    DOMAIN_SENSOR,
+    UNIT_CONDUCTIVITY,
+)
+from .plant_daylight import daylight, dummy_illuminance
+from .plant_import import async_import_plants
+
+_LOGGER = logging.getLogger(__name__)
+
+LOADGEN_TICK = timedelta(milliseconds=50)
+LOADGEN_NAME = "Loadgen plant"
+
+LOADGEN_SENSORS = {
+    ATTR_MOISTURE: (PERCENTAGE, ATTR_MOISTURE),
+    ATTR_TEMPERATURE: (UnitOfTemperature.CELSIUS, ATTR_TEMPERATURE),
+    ATTR_AIR_TEMPERATURE: (UnitOfTemperature.CELSIUS, ATTR_TEMPERATURE),
+    ATTR_CONDUCTIVITY: (UNIT_CONDUCTIVITY, None),
+    ATTR_ILLUMINANCE: (LIGHT_LUX, ATTR_ILLUMINANCE),
+    ATTR_HUMIDITY: (PERCENTAGE, ATTR_HUMIDITY),
+}
+
+
+def dummy_value(metric: str, now: datetime, previous: float | None) -> float:
+    """Return a plausible reading for a metric"""
+    if metric == ATTR_ILLUMINANCE:
+        return dummy_illuminance(now)
+    if metric in (ATTR_TEMPERATURE, ATTR_AIR_TEMPERATURE):
+        return round(15 + 10 * daylight(now) + random.uniform(-0.5, 0.5), 1)
+    if metric == ATTR_MOISTURE:
+        # Slowly drying out, until someone waters the plant
+        if previous is None or previous < 15:
+            return random.randint(55, 70)
+        return round(previous - random.uniform(0, 0.05), 2)
+    if metric == ATTR_CONDUCTIVITY:
+        return random.randint(40, 200) * 10
+    return random.randint(25, 90)
+
+
+class PlantLoadGenerator:
+    """Feeds a number of virtual sensors with readings"""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        plants: int,
+        rate: float,
+        jitter: float = 0,
+        dropout: float = 0,
+        time_scale: float = 1,
+    ) -> None:
+        """Initialize the load generator.
+
+        rate is the number of readings per second for each plant.
+        jitter is the relative random variation of the report interval.
+        dropout is the probability of a reading being unavailable.
+        time_scale speeds up the day, so the diurnal curves can be tested.
+        """
+        self._hass = hass
+        self._plants = plants
+        self._jitter = jitter
+        self._dropout = dropout
+        self._time_scale = time_scale
+        self._interval = len(LOADGEN_SENSORS) / rate
+        self._sensors = [
+            (self.sensor_entity_id(plant, metric), metric)
+            for plant in range(plants)
+            for metric in LOADGEN_SENSORS
+        ]
+        self._values: list[float | None] = [None] * len(self._sensors)
+        self._queue: list[tuple[float, int]] = []
+        self._unsub: CALLBACK_TYPE | None = None
+        self._started = 0.0
+        self._started_wall = dt_util.now()
+        self.events = 0
+        self.dropouts = 0
+        self.max_lag = 0.0
+
+    @staticmethod
+    def sensor_entity_id(plant: int, metric: str) -> str:
+        """The entity_id of a virtual sensor"""
+        return f"{DOMAIN_SENSOR}.{DOMAIN}_loadgen_{plant}_{metric}"
+
+    @property
+    def running(self) -> bool:
+        """Whether the generator is running"""
+        return self._unsub is not None
+
+    @property
+    def plant_names(self) -> list[str]:
+        """The names of the plants created by the generator"""
+        return [f"{LOADGEN_NAME} {plant}" for plant in range(self._plants)]
+
+    def simulated_now(self) -> datetime:
+        """The time used for the diurnal curves"""
+        elapsed = (time.monotonic() - self._started) * self._time_scale
+        return self._started_wall + timedelta(seconds=elapsed)
+
+    async def async_create_plants(self) -> dict[str, int]:
+        """Create plants that use the virtual sensors"""
+        plants = {}
+        for plant, name in enumerate(self.plant_names):
+            plants[f"loadgen_{plant}"] = {
+                "name": name,
+                ATTR_SENSORS: {
+                    metric: self.sensor_entity_id(plant, metric)
+                    for metric in LOADGEN_SENSORS
+                },
+            }
+        return await async_import_plants(self._hass, plants)
+
+    @callback
+    def async_start(self) -> None:
+        """Write the first readings and start the generator"""
+        self._started = time.monotonic()
+        self._started_wall = dt_util.now()
+        for index in range(len(self._sensors)):
+            self._async_report(index, self._started_wall)
+            # Spread the sensors evenly over the first interval
+            heapq.heappush(
+                self._queue,
+                (self._started + random.uniform(0, self._interval), index),
+            )
+        self._unsub = async_track_time_interval(self._hass, self._tick, LOADGEN_TICK)
+        _LOGGER.info(
+            "Load generator started with %s sensors, %.1f readings/s",
+            len(self._sensors),
+            len(self._sensors) / self._interval,
+        )
+
+    @callback
+    def async_stop(self) -> dict[str, Any]:
+        """Stop the generator and return the statistics"""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+        self._queue.clear()
+        return self.statistics
+
+    async def async_remove(self) -> None:
+        """Remove the virtual sensors and the plants using them"""
+        names = set(self.plant_names)
+        for entry in self._hass.config_entries.async_entries(DOMAIN):
+            if entry.title in names:
+                await self._hass.config_entries.async_remove(entry.entry_id)
+        for entity_id, _ in self._sensors:
+            self._hass.states.async_remove(entity_id)
+
+    @property
+    def statistics(self) -> dict[str, Any]:
+        """Statistics about the generated load"""
+        elapsed = time.monotonic() - self._started if self._started else 0
+        return {
+            "sensors": len(self._sensors),
+            "events": self.events,
+            "dropouts": self.dropouts,
+            "seconds": round(elapsed, 1),
+            "events_per_second": round(self.events / elapsed, 1) if elapsed else 0,
+            "max_lag": round(self.max_lag, 3),
+        }
+
+    @callback
+    def _async_report(self, index: int, now: datetime) -> None:
+        """Write a new reading for a sensor"""
+        entity_id, metric = self._sensors[index]
+        unit, device_class = LOADGEN_SENSORS[metric]
+        attributes = {ATTR_UNIT_OF_MEASUREMENT: unit}
+        if device_class is not None:
+            attributes[ATTR_DEVICE_CLASS] = device_class
+        self.events += 1
+        if self._dropout and random.random() < self._dropout:
+            self.dropouts += 1
+            self._hass.states.async_set(entity_id, STATE_UNAVAILABLE, attributes)
+            return
+        value = dummy_value(metric, now, self._values[index])
+        self._values[index] = value
+        self._hass.states.async_set(entity_id, str(value), attributes)
+
+    @callback
+    def _tick(self, _: datetime) -> None:
+        """Send all readings that are due"""
+        current = time.monotonic()
+        now = self.simulated_now()
+        queue = self._queue
+        while queue and queue[0][0] <= current:
+            due, index = heapq.heappop(queue)
+            self.max_lag = max(self.max_lag, current - due)
+            self._async_report(index, now)
+            interval = self._interval
+            if self._jitter:
+                interval *= 1 + random.uniform(-self._jitter, self._jitter)
+            # Do not try to catch up if we are falling behind
+            heapq.heappush(queue, (max(due + interval, current + interval), index))
@@ -0,0 +1,215 @@
+"""Threshold profiles shared by the plants of the same species
+
+A profile is a named set of thresholds.  Plants linked to a profile take
+their thresholds from it, except for the thresholds that were changed on the
+plant itself, which are kept as overrides.  Changing a profile updates all
+the linked plants at once, followed by a single evaluation of all plants.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.storage import Store
+from homeassistant.util.unit_conversion import TemperatureConverter
+
+from .const import (
+    ATTR_OVERRIDES,
+    ATTR_PLANT,
+    ATTR_PROFILE,
+    CONF_MAX_AIR_TEMPERATURE,
+    CONF_MAX_TEMPERATURE,
+    CONF_MIN_AIR_TEMPERATURE,
+    CONF_MIN_TEMPERATURE,
+    DATA_ENGINE,
+    DOMAIN,
+    PLANT_LIMITS,
+    STORAGE_PROFILES,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
+)
+from .plant_state import parse_value
+
+if TYPE_CHECKING:
+    from . import PlantDevice
+
+_LOGGER = logging.getLogger(__name__)
+
+TEMPERATURE_LIMITS = (
+    CONF_MIN_TEMPERATURE,
+    CONF_MAX_TEMPERATURE,
+    CONF_MIN_AIR_TEMPERATURE,
+    CONF_MAX_AIR_TEMPERATURE,
+)
+
+
+class PlantProfiles:
+    """The threshold profiles, and which plants are linked to them"""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the profiles"""
+        self._hass = hass
+        self._store = Store(hass, STORAGE_VERSION, STORAGE_PROFILES)
+        # Profile name -> limit -> value
+        self.profiles: dict[str, dict[str, float]] = {}
+        # Config entry -> {"profile": name, "overrides": [limit, ...]}
+        self.links: dict[str, dict[str, Any]] = {}
+        # The unit of the temperature thresholds in the profiles
+        self.temperature_unit = hass.config.units.temperature_unit
+
+    async def async_load(self) -> None:
+        """Read the profiles from the storage"""
+        data = await self._store.async_load()
+        if data is None:
+            return
+        self.profiles = data.get("profiles", {})
+        self.links = data.get("links", {})
+        self.temperature_unit = data.get("temperature_unit", self.temperature_unit)
+        _LOGGER.debug(
+            "Loaded %s threshold profiles used by %s plants",
+            len(self.profiles),
+            len(self.links),
+        )
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """The data to write to the storage"""
+        return {
+            "profiles": self.profiles,
+            "links": self.links,
+            "temperature_unit": self.temperature_unit,
+        }
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Write the profiles to the storage, a bit later"""
+        self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+
+    def plant_profile(self, entry_id: str) -> str | None:
+        """The name of the profile a plant is linked to"""
+        link = self.links.get(entry_id)
+        return link[ATTR_PROFILE] if link is not None else None
+
+    def overrides(self, entry_id: str) -> list[str]:
+        """The thresholds of a plant that do not come from its profile"""
+        link = self.links.get(entry_id)
+        return link[ATTR_OVERRIDES] if link is not None else []
+
+    def limit(self, entry_id: str, limit: str) -> float | None:
+        """The value of a threshold of a plant according to its profile"""
+        link = self.links.get(entry_id)
+        if link is None or limit in link[ATTR_OVERRIDES]:
+            return None
+        return self.profiles.get(link[ATTR_PROFILE], {}).get(limit)
+
+    def linked_plants(self, name: str) -> list[PlantDevice]:
+        """The plants that are linked to a profile"""
+        return [
+            data[ATTR_PLANT]
+            for entry_id, data in self._hass.data.get(DOMAIN, {}).items()
+            if ATTR_PLANT in data and self.plant_profile(entry_id) == name
+        ]
+
+    @callback
+    def _async_apply(self, plants: list[PlantDevice]) -> int:
+        """Apply the profiles to the plants and evaluate them once"""
+        changed = sum(plant.async_apply_profile() for plant in plants)
+        if changed:
+            self._hass.data[DATA_ENGINE].async_evaluate_all()
+        return changed
+
+    @callback
+    def async_set_profile(
+        self,
+        name: str,
+        limits: dict[str, float],
+        replace: bool = False,
+        plant: PlantDevice | None = None,
+    ) -> dict[str, Any]:
+        """Create or change a profile, and update the plants that use it"""
+        if replace or name not in self.profiles:
+            profile = {}
+        else:
+            profile = dict(self.profiles[name])
+        if plant is not None:
+            # Start from the current thresholds of a plant
+            for limit in PLANT_LIMITS:
+                threshold = getattr(plant, limit)
+                value = parse_value(threshold.native_value) if threshold else None
+                if value is not None:
+                    profile[limit] = value
+        profile.update(limits)
+        self.profiles[name] = profile
+        self._async_schedule_save()
+
+        plants = self.linked_plants(name)
+        changed = self._async_apply(plants)
+        _LOGGER.info(
+            "Profile %s changed %s thresholds of %s plants", name, changed, len(plants)
+        )
+        return {ATTR_PROFILE: name, "limits": profile, "plants": len(plants)}
+
+    @callback
+    def async_delete_profile(self, name: str) -> None:
+        """Remove a profile.  The linked plants keep their current thresholds."""
+        if name not in self.profiles:
+            raise HomeAssistantError(f"Profile {name} not found")
+        del self.profiles[name]
+        self.links = {
+            entry_id: link
+            for entry_id, link in self.links.items()
+            if link[ATTR_PROFILE] != name
+        }
+        self._async_schedule_save()
+
+    @callback
+    def async_link(
+        self,
+        plants: list[PlantDevice],
+        name: str | None,
+        keep_overrides: bool = False,
+    ) -> int:
+        """Link plants to a profile, or unlink them if name is None"""
+        if name is not None and name not in self.profiles:
+            raise HomeAssistantError(f"Profile {name} not found")
+        for plant in plants:
+            entry_id = plant.unique_id
+            if name is None:
+                self.links.pop(entry_id, None)
+                continue
+            overrides = self.overrides(entry_id) if keep_overrides else []
+            self.links[entry_id] = {ATTR_PROFILE: name, ATTR_OVERRIDES: overrides}
+        self._async_schedule_save()
+        return self._async_apply(plants)
+
+    @callback
+    def async_override(self, entry_id: str, limit: str) -> None:
+        """Keep a threshold that was changed on the plant itself"""
+        link = self.links.get(entry_id)
+        if link is None or limit in link[ATTR_OVERRIDES]:
+            return
+        link[ATTR_OVERRIDES].append(limit)
+        _LOGGER.debug("%s of %s now overrides its profile", limit, entry_id)
+        self._async_schedule_save()
+
+    @callback
+    def async_convert_temperature(self, unit: str) -> None:
+        """Convert the temperature thresholds of all profiles to a new unit"""
+        if unit == self.temperature_unit:
+            return
+        convert = TemperatureConverter.converter_factory(self.temperature_unit, unit)
+        for profile in self.profiles.values():
+            for limit in TEMPERATURE_LIMITS:
+                if limit in profile:
+                    profile[limit] = round(convert(profile[limit]))
+        self.temperature_unit = unit
+        self._async_schedule_save()
+
+    @callback
+    def async_remove_plant(self, entry_id: str) -> None:
+        """Forget a plant that is removed"""
+        if self.links.pop(entry_id, None) is not None:
+            self._async_schedule_save()
@@ -0,0 +1,468 @@
+"""Compact runtime state of the metrics of all plants
+
+The meter and threshold entities push their values here, and the plants are
+evaluated from these values instead of looking up the states of 20 other
+entities per plant.
+
+The values of all plants are kept in a few contiguous arrays, one row of
+PLANT_METRICS columns per plant, so all plants can be evaluated in a single
+pass.  With numpy available, that pass is vectorized.
+
+A plant can require a metric to be out of range for a while before it
+becomes a problem, and back in range for a while before it is ok again.
+The time a metric has been waiting for its new status is kept per cell, and
+the plant is evaluated again by the shared timer when the wait is over.
+"""
+
+from __future__ import annotations
+
+from array import array
+from functools import partial
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.const import (
+    STATE_OK,
+    STATE_PROBLEM,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
+)
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    ATTR_AIR_TEMPERATURE,
+    ATTR_CONDUCTIVITY,
+    ATTR_DLI,
+    ATTR_HUMIDITY,
+    ATTR_ILLUMINANCE,
+    ATTR_MOISTURE,
+    ATTR_TEMPERATURE,
+    DATA_ENGINE,
+    DATA_TIMERS,
+    STATE_HIGH,
+    STATE_LOW,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if TYPE_CHECKING:
+    from . import PlantDevice
+
+_LOGGER = logging.getLogger(__name__)
+
+# The metrics a plant is evaluated on, in the order they are evaluated
+PLANT_METRICS = (
+    ATTR_MOISTURE,
+    ATTR_CONDUCTIVITY,
+    ATTR_TEMPERATURE,
+    ATTR_HUMIDITY,
+    ATTR_AIR_TEMPERATURE,
+    ATTR_ILLUMINANCE,
+    ATTR_DLI,
+)
+METRIC_COUNT = len(PLANT_METRICS)
+
+# A low illuminance would be a problem every night
+NO_MIN_CHECK = (ATTR_ILLUMINANCE,)
+# A DLI of 0 means nothing was measured the previous day
+ZERO_IS_OK = (ATTR_DLI,)
+
+NAN = float("nan")
+
+# Status of a metric, and of a plant, as stored in the arrays
+CODE_UNKNOWN = 0
+CODE_OK = 1
+CODE_LOW = 2
+CODE_HIGH = 3
+CODE_PROBLEM = 2
+METRIC_STATUS = (None, STATE_OK, STATE_LOW, STATE_HIGH)
+PLANT_STATUS = (STATE_UNKNOWN, STATE_OK, STATE_PROBLEM)
+
+
+def parse_value(value: Any) -> float | None:
+    """A reading or threshold as a float, or None if it is not known"""
+    if value is None or value == STATE_UNKNOWN or value == STATE_UNAVAILABLE:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def snapshot_status(
+    snapshot: tuple[int, ...],
+) -> tuple[str, dict[str, str | None]]:
+    """The state of a plant, and the status of its metrics, in a snapshot"""
+    return PLANT_STATUS[snapshot[0]], {
+        metric: METRIC_STATUS[code] for metric, code in zip(PLANT_METRICS, snapshot[1:])
+    }
+
+
+class MetricState:
+    """View of the value, thresholds and status of one metric of a plant"""
+
+    __slots__ = ("_engine", "_index", "unit", "updated")
+
+    def __init__(self, engine: PlantStatusEngine, index: int) -> None:
+        """Initialize the view of a cell in the arrays of the engine"""
+        self._engine = engine
+        self._index = index
+        self.unit: str | None = None
+        self.updated: float | None = None
+
+    @property
+    def value(self) -> float | None:
+        """The current reading"""
+        value = self._engine.values[self._index]
+        return None if value != value else value
+
+    @property
+    def min(self) -> float | None:
+        """The min threshold"""
+        value = self._engine.mins[self._index]
+        return None if value != value else value
+
+    @min.setter
+    def min(self, value: float | None) -> None:
+        self._engine.mins[self._index] = NAN if value is None else value
+
+    @property
+    def max(self) -> float | None:
+        """The max threshold"""
+        value = self._engine.maxs[self._index]
+        return None if value != value else value
+
+    @max.setter
+    def max(self, value: float | None) -> None:
+        self._engine.maxs[self._index] = NAN if value is None else value
+
+    @property
+    def trigger(self) -> bool:
+        """Whether the status of this metric can make the plant a problem"""
+        return bool(self._engine.triggers[self._index])
+
+    @trigger.setter
+    def trigger(self, trigger: bool) -> None:
+        self._engine.triggers[self._index] = int(trigger)
+
+    @property
+    def status(self) -> str | None:
+        """The status from the last evaluation"""
+        return METRIC_STATUS[self._engine.codes[self._index]]
+
+    def set_value(self, value: Any, unit: str | None = None) -> None:
+        """Store a new reading"""
+        value = parse_value(value)
+        self._engine.values[self._index] = NAN if value is None else value
+        if unit is not None:
+            self.unit = unit
+        self.updated = time.time()
+
+    def set_stale(self) -> None:
+        """Forget the reading and status of a sensor that stopped reporting"""
+        self._engine.values[self._index] = NAN
+        self._engine.codes[self._index] = CODE_UNKNOWN
+        # Make sure the status change of the metric is reported
+        self._engine.dirty[self._index // METRIC_COUNT] = 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """The view as a dict"""
+        return {
+            "value": self.value,
+            "unit": self.unit,
+            "min": self.min,
+            "max": self.max,
+            "trigger": self.trigger,
+            "status": self.status,
+            "updated": self.updated,
+        }
+
+
+class PlantStatusEngine:
+    """Values, thresholds and status of all plants, and their evaluation"""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize an empty engine"""
+        self._hass = hass
+        self.values = array("d")
+        self.mins = array("d")
+        self.maxs = array("d")
+        self.triggers = array("b")
+        self.codes = array("b")
+        self.plant_codes = array("b")
+        # Plants to report as changed after the next evaluation
+        self.dirty = array("b")
+        # The status a metric is waiting for, and since when (loop time)
+        self.pending_codes = array("b")
+        self.pending_since = array("d")
+        # Seconds a plant waits before a metric becomes a problem, or ok again
+        self.problem_delays = array("d")
+        self.recovery_delays = array("d")
+        self.plants: list[PlantDevice | None] = []
+        self._free_rows: list[int] = []
+        self._check_min = array(
+            "b", [metric not in NO_MIN_CHECK for metric in PLANT_METRICS]
+        )
+        self._zero_is_ok = array(
+            "b", [metric in ZERO_IS_OK for metric in PLANT_METRICS]
+        )
+        self._scheduled = False
+        # Whether any plant waits before a metric changes status
+        self._delays = False
+
+    def allocate(self, plant: PlantDevice) -> tuple[int, dict[str, MetricState]]:
+        """Reserve a row for a plant, and return it with views of the metrics"""
+        if self._free_rows:
+            row = self._free_rows.pop()
+            self.plants[row] = plant
+        else:
+            row = len(self.plants)
+            self.plants.append(plant)
+            self.values.extend([NAN] * METRIC_COUNT)
+            self.mins.extend([NAN] * METRIC_COUNT)
+            self.maxs.extend([NAN] * METRIC_COUNT)
+            self.triggers.extend([1] * METRIC_COUNT)
+            self.codes.extend([CODE_UNKNOWN] * METRIC_COUNT)
+            self.pending_codes.extend([CODE_UNKNOWN] * METRIC_COUNT)
+            self.pending_since.extend([NAN] * METRIC_COUNT)
+            self.plant_codes.append(CODE_UNKNOWN)
+            self.dirty.append(0)
+            self.problem_delays.append(0)
+            self.recovery_delays.append(0)
+        start = row * METRIC_COUNT
+        return row, {
+            metric: MetricState(self, start + column)
+            for column, metric in enumerate(PLANT_METRICS)
+        }
+
+    def release(self, row: int) -> None:
+        """Free the row of a plant that is removed"""
+        start = row * METRIC_COUNT
+        for index in range(start, start + METRIC_COUNT):
+            self.values[index] = NAN
+            self.mins[index] = NAN
+            self.maxs[index] = NAN
+            self.triggers[index] = 1
+            self.codes[index] = CODE_UNKNOWN
+            self.pending_codes[index] = CODE_UNKNOWN
+        self.plant_codes[row] = CODE_UNKNOWN
+        self.dirty[row] = 0
+        self.problem_delays[row] = 0
+        self.recovery_delays[row] = 0
+        self.plants[row] = None
+        self._free_rows.append(row)
+        self._hass.data[DATA_TIMERS].async_cancel((DATA_ENGINE, row))
+
+    def set_delays(self, row: int, problem: float, recovery: float) -> None:
+        """Set the seconds a plant waits before a status change of a metric"""
+        self.problem_delays[row] = problem
+        self.recovery_delays[row] = recovery
+        start = row * METRIC_COUNT
+        for index in range(start, start + METRIC_COUNT):
+            self.pending_codes[index] = CODE_UNKNOWN
+        self._delays = any(self.problem_delays) or any(self.recovery_delays)
+
+    def _qualify(
+        self, row: int, index: int, code: int, now: float
+    ) -> tuple[int, float | None]:
+        """The status of a metric that wants to change to code.
+
+        Returns the status, and when to look again if it has to wait.
+        """
+        current = self.codes[index]
+        if current == CODE_UNKNOWN:
+            # Nothing to flap from
+            delay = 0
+        elif code == CODE_OK:
+            delay = self.recovery_delays[row]
+        else:
+            delay = self.problem_delays[row]
+        if delay:
+            if self.pending_codes[index] != code:
+                self.pending_codes[index] = code
+                self.pending_since[index] = now
+            due = self.pending_since[index] + delay
+            if now < due:
+                return current, due
+        self.pending_codes[index] = CODE_UNKNOWN
+        return code, None
+
+    @callback
+    def _async_schedule_row(self, row: int, when: float) -> None:
+        """Evaluate a plant again when a metric is done waiting"""
+        self._hass.data[DATA_TIMERS].async_schedule(
+            (DATA_ENGINE, row), when, partial(self._async_evaluate_waiting, row)
+        )
+
+    @callback
+    def _async_evaluate_waiting(self, row: int, now: float) -> None:
+        """Evaluate a plant that had a metric waiting for its new status"""
+        plant = self.plants[row]
+        if plant is not None and self.evaluate_row(row, now):
+            plant.async_status_changed(self.plant_state(row))
+
+    def evaluate_row(self, row: int, now: float | None = None) -> bool:
+        """Evaluate a single plant.  Returns whether anything changed."""
+        if now is None:
+            now = self._hass.loop.time()
+        values = self.values
+        codes = self.codes
+        start = row * METRIC_COUNT
+        changed = False
+        known = False
+        problem = False
+        wait = None
+        for column in range(METRIC_COUNT):
+            index = start + column
+            value = values[index]
+            if value != value:
+                # Unknown value, keep the status we had
+                continue
+            known = True
+            if self._zero_is_ok[column] and value <= 0:
+                code = CODE_OK
+            elif self._check_min[column] and value < self.mins[index]:
+                code = CODE_LOW
+            elif value > self.maxs[index]:
+                code = CODE_HIGH
+            else:
+                code = CODE_OK
+            if code != codes[index]:
+                code, due = self._qualify(row, index, code, now)
+                if due is not None and (wait is None or due < wait):
+                    wait = due
+            else:
+                self.pending_codes[index] = CODE_UNKNOWN
+            if code != CODE_OK and self.triggers[index]:
+                problem = True
+            if code != codes[index]:
+                codes[index] = code
+                changed = True
+        if not known:
+            plant_code = CODE_UNKNOWN
+        elif problem:
+            plant_code = CODE_PROBLEM
+        else:
+            plant_code = CODE_OK
+        if plant_code != self.plant_codes[row]:
+            self.plant_codes[row] = plant_code
+            changed = True
+        if self.dirty[row]:
+            self.dirty[row] = 0
+            changed = True
+        if wait is not None:
+            self._async_schedule_row(row, wait)
+        return changed
+
+    def plant_state(self, row: int) -> str:
+        """The state of a plant from the last evaluation"""
+        return PLANT_STATUS[self.plant_codes[row]]
+
+    def snapshot(self, row: int) -> tuple[int, ...]:
+        """The status of a plant followed by the status of its metrics"""
+        start = row * METRIC_COUNT
+        return (self.plant_codes[row], *self.codes[start : start + METRIC_COUNT])
+
+    def _evaluate_vectorized(self) -> list[int]:
+        """Evaluate all plants at once with numpy.  Returns the changed rows."""
+        rows = len(self.plants)
+        shape = (rows, METRIC_COUNT)
+        values = np.frombuffer(self.values, dtype=np.float64).reshape(shape)
+        mins = np.frombuffer(self.mins, dtype=np.float64).reshape(shape)
+        maxs = np.frombuffer(self.maxs, dtype=np.float64).reshape(shape)
+        triggers = np.frombuffer(self.triggers, dtype=np.int8).reshape(shape)
+        codes = np.frombuffer(self.codes, dtype=np.int8).reshape(shape)
+        pending = np.frombuffer(self.pending_codes, dtype=np.int8).reshape(shape)
+        plant_codes = np.frombuffer(self.plant_codes, dtype=np.int8)
+        dirty = np.frombuffer(self.dirty, dtype=np.int8)
+        check_min = np.frombuffer(self._check_min, dtype=np.int8).astype(bool)
+        zero_is_ok = np.frombuffer(self._zero_is_ok, dtype=np.int8).astype(bool)
+
+        # Comparisons with NaN are False, so missing thresholds are never
+        # exceeded, and unknown values are masked out below
+        known = ~np.isnan(values)
+        zero = zero_is_ok & (values <= 0)
+        low = check_min & (values < mins) & ~zero
+        high = (values > maxs) & ~low & ~zero
+        new_codes = np.where(
+            known,
+            np.where(low, CODE_LOW, np.where(high, CODE_HIGH, CODE_OK)),
+            codes,
+        ).astype(np.int8)
+        differs = new_codes != codes
+        # Metrics back at the status they had stop waiting
+        pending[known & ~differs] = CODE_UNKNOWN
+
+        if self._delays:
+            # Only the few metrics that change status can have to wait
+            now = self._hass.loop.time()
+            waits: dict[int, float] = {}
+            flat_codes = new_codes.reshape(-1)
+            for index in np.flatnonzero(differs).tolist():
+                row = index // METRIC_COUNT
+                code, due = self._qualify(row, index, int(flat_codes[index]), now)
+                flat_codes[index] = code
+                if due is not None and (row not in waits or due < waits[row]):
+                    waits[row] = due
+            for row, due in waits.items():
+                self._async_schedule_row(row, due)
+
+        problem = (
+            known
+            & (new_codes != CODE_OK)
+            & (new_codes != CODE_UNKNOWN)
+            & (triggers != 0)
+        ).any(axis=1)
+        new_plant_codes = np.where(
+            known.any(axis=1),
+            np.where(problem, CODE_PROBLEM, CODE_OK),
+            CODE_UNKNOWN,
+        ).astype(np.int8)
+
+        changed = (
+            (new_codes != codes).any(axis=1)
+            | (new_plant_codes != plant_codes)
+            | (dirty != 0)
+        )
+        codes[:] = new_codes
+        plant_codes[:] = new_plant_codes
+        dirty[:] = 0
+        return np.flatnonzero(changed).tolist()
+
+    @callback
+    def async_evaluate_all(self, *_: Any) -> list[PlantDevice]:
+        """Evaluate all plants, and write the state of the ones that changed"""
+        self._scheduled = False
+        if not self.plants:
+            return []
+        start = time.perf_counter()
+        if np is not None:
+            rows = self._evaluate_vectorized()
+        else:
+            rows = [row for row in range(len(self.plants)) if self.evaluate_row(row)]
+        changed = []
+        for row in rows:
+            plant = self.plants[row]
+            if plant is None:
+                continue
+            plant.async_status_changed(self.plant_state(row))
+            changed.append(plant)
+        _LOGGER.debug(
+            "Evaluated %s plants in %.2fms, %s changed",
+            len(self.plants) - len(self._free_rows),
+            (time.perf_counter() - start) * 1000,
+            len(changed),
+        )
+        return changed
+
+    @callback
+    def async_schedule_evaluation(self) -> None:
+        """Evaluate all plants soon, once, no matter how often this is called"""
+        if self._scheduled:
+            return
+        self._scheduled = True
+        self._hass.loop.call_soon(self.async_evaluate_all)
@@ -0,0 +1,128 @@
+"""Hourly long-term statistics of the readings of all plants
+
+The readings of the meters are aggregated in memory, and at the end of every
+hour the mean, min and max of every metric of every plant are imported into
+the recorder as external statistics.  These do not depend on the states of
+the meters, so the meters can be excluded from the recorder, or purged
+aggressively, while the history graphs over months keep working.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import logging
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from .const import ATTR_PLANT, DATA_STATISTICS, DATA_TIMERS, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# Seconds after the hour to import the statistics of the hour that ended, so
+# a timer that fires a little early does not end up in the wrong hour
+IMPORT_MARGIN = 5
+
+
+def statistic_id(entry_id: str, metric: str) -> str:
+    """The id of the external statistic of a metric of a plant"""
+    return f"{DOMAIN}:{entry_id.lower()}_{metric}"
+
+
+class PlantStatistics:
+    """Min, max and mean of the readings of the current hour"""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize without any readings"""
+        self._hass = hass
+        self._timers = hass.data[DATA_TIMERS]
+        # (config entry, metric) -> [min, max, sum, count]
+        self._hour: dict[tuple[str, str], list[float]] = {}
+
+    @callback
+    def async_start(self) -> None:
+        """Import the statistics at the end of every hour"""
+        self._timers.async_schedule_in(
+            (DATA_STATISTICS,), self._seconds_until_import(), self._async_import
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop importing the statistics"""
+        self._timers.async_cancel((DATA_STATISTICS,))
+
+    @staticmethod
+    def _seconds_until_import() -> float:
+        """Seconds until just after the next hour"""
+        now = dt_util.utcnow()
+        hour = now.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+        return (hour - now).total_seconds() + IMPORT_MARGIN
+
+    @callback
+    def async_add(self, entry_id: str, metric: str, value: float) -> None:
+        """Add a reading to the current hour"""
+        aggregate = self._hour.get((entry_id, metric))
+        if aggregate is None:
+            self._hour[(entry_id, metric)] = [value, value, value, 1]
+            return
+        if value < aggregate[0]:
+            aggregate[0] = value
+        elif value > aggregate[1]:
+            aggregate[1] = value
+        aggregate[2] += value
+        aggregate[3] += 1
+
+    @callback
+    def _async_import(self, now: float) -> float:
+        """Import the statistics of the hour that ended"""
+        hour, self._hour = self._hour, {}
+        if "recorder" not in self._hass.config.components:
+            return now + self._seconds_until_import()
+        start = dt_util.utcnow().replace(minute=0, second=0, microsecond=0) - timedelta(
+            hours=1
+        )
+        imported = 0
+        for (entry_id, metric), aggregate in hour.items():
+            if self._async_import_metric(entry_id, metric, aggregate, start):
+                imported += 1
+        _LOGGER.debug("Imported %s hourly statistics for %s", imported, start)
+        return now + self._seconds_until_import()
+
+    @callback
+    def _async_import_metric(
+        self, entry_id: str, metric: str, aggregate: list[float], start: datetime
+    ) -> bool:
+        """Import the statistics of one metric of a plant"""
+        # The recorder pulls in SQLAlchemy, so only import it once it is
+        # loaded anyway, and not when the integration is imported
+        # pylint: disable=import-outside-toplevel
+        from homeassistant.components.recorder.models import (
+            StatisticData,
+            StatisticMetaData,
+        )
+        from homeassistant.components.recorder.statistics import (
+            async_add_external_statistics,
+        )
+
+        plant = self._hass.data.get(DOMAIN, {}).get(entry_id, {}).get(ATTR_PLANT)
+        if plant is None:
+            # Removed during the hour
+            return False
+        metadata = StatisticMetaData(
+            has_mean=True,
+            has_sum=False,
+            name=f"{plant.name} {metric}",
+            source=DOMAIN,
+            statistic_id=statistic_id(entry_id, metric),
+            unit_of_measurement=plant.metrics[metric].unit,
+        )
+        statistics = [
+            StatisticData(
+                start=start,
+                mean=aggregate[2] / aggregate[3],
+                min=aggregate[0],
+                max=aggregate[1],
+            )
+        ]
+        async_add_external_statistics(self._hass, metadata, statistics)
+        return True
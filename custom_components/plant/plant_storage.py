@@ -0,0 +1,78 @@
+"""The thresholds of all plants, stored in a single document
+
+Writing a single document, at most once every STORAGE_SAVE_DELAY seconds,
+is a lot cheaper than keeping 14 restore states per plant, and the
+thresholds of all plants are read at once during startup.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from homeassistant.components.number import NumberExtraStoredData
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.restore_state import async_get as async_get_restore_state
+from homeassistant.helpers.storage import Store
+
+from .const import STORAGE_SAVE_DELAY, STORAGE_THRESHOLDS, STORAGE_VERSION
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class PlantThresholdStore:
+    """The value and unit of every threshold of every plant"""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize an empty store"""
+        self._hass = hass
+        self._store = Store(hass, STORAGE_VERSION, STORAGE_THRESHOLDS)
+        # Config entry -> limit -> [value, unit]
+        self._thresholds: dict[str, dict[str, list[Any]]] = {}
+
+    async def async_load(self) -> None:
+        """Read the thresholds of all plants"""
+        data = await self._store.async_load()
+        if data is None:
+            return
+        self._thresholds = data
+        _LOGGER.debug("Loaded the thresholds of %s plants", len(data))
+
+    @callback
+    def _data_to_save(self) -> dict[str, dict[str, list[Any]]]:
+        """The data to write to the storage"""
+        return self._thresholds
+
+    def get(self, entry_id: str, limit: str) -> tuple[Any, str | None] | None:
+        """The stored value and unit of a threshold"""
+        stored = self._thresholds.get(entry_id, {}).get(limit)
+        return tuple(stored) if stored is not None else None
+
+    @callback
+    def async_set(
+        self, entry_id: str, limit: str, value: Any, unit: str | None
+    ) -> None:
+        """Store the value and unit of a threshold, and save them a bit later"""
+        thresholds = self._thresholds.setdefault(entry_id, {})
+        if thresholds.get(limit) == [value, unit]:
+            return
+        thresholds[limit] = [value, unit]
+        self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+
+    @callback
+    def async_migrate(self, entity_id: str) -> tuple[Any, str | None] | None:
+        """The value and unit of a threshold from its old restore state"""
+        stored = async_get_restore_state(self._hass).last_states.get(entity_id)
+        if stored is None or stored.extra_data is None:
+            return None
+        data = NumberExtraStoredData.from_dict(stored.extra_data.as_dict())
+        if data is None:
+            return None
+        _LOGGER.debug("Migrated %s from the restore state", entity_id)
+        return data.native_value, data.native_unit_of_measurement
+
+    @callback
+    def async_remove_plant(self, entry_id: str) -> None:
+        """Forget the thresholds of a plant that is removed"""
+        if self._thresholds.pop(entry_id, None) is not None:
+            self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
@@ -0,0 +1,129 @@
+"""One timer for all the delayed work of all plants
+
+Instead of an async_call_later per meter, all timers are kept in a single
+heap, and only the one that is due first is scheduled on the event loop.
+With 5000 meters, that is still one scheduled callback.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable
+import heapq
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+_LOGGER = logging.getLogger(__name__)
+
+# A timer action gets the current loop time, and returns the loop time it
+# wants to run again, or None
+TimerAction = Callable[[float], "float | None"]
+
+
+class PlantTimers:
+    """Timers of all plants in a single heap"""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize without any timers"""
+        self._hass = hass
+        self._loop = hass.loop
+        # (when, sequence, key).  Cancelled and rescheduled timers are left in
+        # the heap, and skipped when they come up.
+        self._heap: list[tuple[float, int, Hashable]] = []
+        # key -> (sequence, action) of the timers that are still active
+        self._timers: dict[Hashable, tuple[int, TimerAction]] = {}
+        self._sequence = 0
+        self._handle: Any = None
+        self._handle_when: float | None = None
+
+    def __len__(self) -> int:
+        """The number of active timers"""
+        return len(self._timers)
+
+    def time(self) -> float:
+        """The current time, in the clock used by the timers"""
+        return self._loop.time()
+
+    @callback
+    def async_schedule(self, key: Hashable, when: float, action: TimerAction) -> None:
+        """Run action at loop time when, replacing any timer with the same key"""
+        self._sequence += 1
+        self._timers[key] = (self._sequence, action)
+        heapq.heappush(self._heap, (when, self._sequence, key))
+        if len(self._heap) > 2 * len(self._timers) + 64:
+            self._compact()
+        self._async_arm()
+
+    @callback
+    def async_schedule_in(
+        self, key: Hashable, delay: float, action: TimerAction
+    ) -> None:
+        """Run action in delay seconds, replacing any timer with the same key"""
+        self.async_schedule(key, self._loop.time() + delay, action)
+
+    @callback
+    def async_cancel(self, key: Hashable) -> None:
+        """Cancel a timer.  Its heap entry is dropped when it comes up."""
+        self._timers.pop(key, None)
+
+    def scheduled(self, key: Hashable) -> bool:
+        """Whether a timer is active"""
+        return key in self._timers
+
+    def _compact(self) -> None:
+        """Drop the entries of cancelled and rescheduled timers"""
+        # In place, as _async_run holds on to the list while actions run
+        self._heap[:] = [
+            item
+            for item in self._heap
+            if item[2] in self._timers and self._timers[item[2]][0] == item[1]
+        ]
+        heapq.heapify(self._heap)
+
+    @callback
+    def _async_arm(self) -> None:
+        """Make sure we run when the first timer is due"""
+        if not self._heap:
+            return
+        when = self._heap[0][0]
+        if self._handle_when is not None and self._handle_when <= when:
+            return
+        if self._handle is not None:
+            self._handle.cancel()
+        self._handle_when = when
+        self._handle = self._loop.call_at(when, self._async_run)
+
+    @callback
+    def _async_run(self) -> None:
+        """Run all the timers that are due"""
+        self._handle = None
+        self._handle_when = None
+        now = self._loop.time()
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            _, sequence, key = heapq.heappop(heap)
+            timer = self._timers.get(key)
+            if timer is None or timer[0] != sequence:
+                continue
+            del self._timers[key]
+            try:
+                when = timer[1](now)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error running plant timer %s", key)
+                continue
+            if when is not None:
+                self._sequence += 1
+                self._timers[key] = (self._sequence, timer[1])
+                heapq.heappush(heap, (when, self._sequence, key))
+        self._async_arm()
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel all timers"""
+        if self._handle is not None:
+            self._handle.cancel()
+        self._handle = None
+        self._handle_when = None
+        self._heap.clear()
+        self._timers.clear()
@@ -0,0 +1,127 @@
+"""Websocket commands of the plant integration"""
+
+from __future__ import annotations
+
+import logging
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    ATTR_PLANT,
+    DATA_GROUPS,
+    DATA_INSTRUMENTATION,
+    DOMAIN,
+    HISTORY_WINDOW,
+)
+from .plant_instrumentation import instrumented_websocket
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@callback
+def async_setup_websocket(hass: HomeAssistant) -> None:
+    """Register the websocket commands, once for all plants"""
+    websocket_api.async_register_command(hass, ws_get_info)
+    websocket_api.async_register_command(hass, ws_get_history)
+    websocket_api.async_register_command(hass, ws_get_groups)
+    websocket_api.async_register_command(hass, ws_slow_calls)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "plant/get_info",
+        vol.Required("entity_id"): str,
+    }
+)
+@callback
+@instrumented_websocket
+def ws_get_info(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Handle the websocket command."""
+    # _LOGGER.debug("Got websocket request: %s", msg)
+
+    if DOMAIN not in hass.data:
+        connection.send_error(
+            msg["id"], "domain_not_found", f"Domain {DOMAIN} not found"
+        )
+        return
+
+    for key in hass.data[DOMAIN]:
+        if not ATTR_PLANT in hass.data[DOMAIN][key]:
+            continue
+        plant_entity = hass.data[DOMAIN][key][ATTR_PLANT]
+        if plant_entity.entity_id == msg["entity_id"]:
+            # _LOGGER.debug("Sending websocket response: %s", plant_entity.websocket_info)
+            try:
+                connection.send_result(
+                    msg["id"], {"result": plant_entity.websocket_info}
+                )
+            except ValueError as e:
+                _LOGGER.warning(e)
+            return
+    connection.send_error(
+        msg["id"], "entity_not_found", f"Entity {msg['entity_id']} not found"
+    )
+    return
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "plant/get_history",
+        vol.Required("entity_id"): str,
+    }
+)
+@callback
+@instrumented_websocket
+def ws_get_history(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Send the rolling min/max/mean of the meters of a plant"""
+    for data in hass.data.get(DOMAIN, {}).values():
+        plant_entity = data.get(ATTR_PLANT)
+        if plant_entity is None or plant_entity.entity_id != msg["entity_id"]:
+            continue
+        connection.send_result(
+            msg["id"],
+            {
+                "window": HISTORY_WINDOW,
+                "history": plant_entity.history,
+            },
+        )
+        return
+    connection.send_error(
+        msg["id"], "entity_not_found", f"Entity {msg['entity_id']} not found"
+    )
+
+
+@websocket_api.websocket_command({vol.Required("type"): "plant/get_groups"})
+@callback
+def ws_get_groups(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Send the aggregate status of all groups of plants"""
+    connection.send_result(msg["id"], {"groups": hass.data[DATA_GROUPS].as_dict()})
+
+
+@websocket_api.websocket_command({vol.Required("type"): "plant/slow_calls"})
+@callback
+def ws_slow_calls(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Send the slowest plant callbacks"""
+    instrumentation = hass.data[DATA_INSTRUMENTATION]
+    connection.send_result(
+        msg["id"],
+        {
+            "threshold_ms": (
+                instrumentation.slow_call_threshold * 1000
+                if instrumentation.slow_call_threshold is not None
+                else None
+            ),
+            "slow_calls": instrumentation.slow_calls,
+        },
+    )
@@ -5,17 +5,14 @@ from __future__ import annotations
 from datetime import datetime, timedelta
 import logging
 import random
+import time
 
-from homeassistant.components.integration.const import METHOD_TRAPEZOIDAL
-from homeassistant.components.integration.sensor import IntegrationSensor
 from homeassistant.components.sensor import (
     RestoreSensor,
     SensorDeviceClass,
     SensorEntity,
     SensorStateClass,
 )
-from homeassistant.components.utility_meter.const import DAILY
-from homeassistant.components.utility_meter.sensor import UtilityMeterSensor
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     ATTR_ICON,
@@ -27,9 +24,9 @@ from homeassistant.const import (
     STATE_UNKNOWN,
     UnitOfConductivity,
     UnitOfTemperature,
-    UnitOfTime,
 )
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import (
     Entity,
@@ -38,16 +35,29 @@ from homeassistant.helpers.entity import (
 )
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.util import dt as dt_util
 
 from . import SETUP_DUMMY_SENSORS
 from .const import (
+    ATTR_AIR_TEMPERATURE,
     ATTR_CONDUCTIVITY,
     ATTR_DLI,
+    ATTR_HISTORY_MAX,
+    ATTR_HISTORY_MEAN,
+    ATTR_HISTORY_MIN,
+    ATTR_HUMIDITY,
+    ATTR_ILLUMINANCE,
+    ATTR_LAST_PERIOD,
+    ATTR_LAST_RESET,
     ATTR_MOISTURE,
     ATTR_PLANT,
     ATTR_SENSORS,
+    ATTR_TEMPERATURE,
+    DATA_ENGINE,
+    DATA_INSTRUMENTATION,
+    DATA_TIMERS,
     DATA_UPDATED,
-    DEFAULT_LUX_TO_PPFD,
+    DLI_WRITE_INTERVAL,
     DOMAIN,
     DOMAIN_SENSOR,
     FLOW_PLANT_INFO,
@@ -62,21 +72,26 @@ from .const import (
     ICON_DLI,
     ICON_HUMIDITY,
     ICON_ILLUMINANCE,
+    ICON_INSTRUMENTATION,
     ICON_MOISTURE,
-    ICON_PPFD,
     ICON_TEMPERATURE,
     READING_AIR_TEMPERATURE,  # New reading type for air temperature
     READING_CONDUCTIVITY,
     READING_DLI,
     READING_HUMIDITY,
     READING_ILLUMINANCE,
+    READING_INSTRUMENTATION,
     READING_MOISTURE,
-    READING_PPFD,
     READING_TEMPERATURE,
+    STALE_RECHECK,
     UNIT_CONDUCTIVITY,
     UNIT_DLI,
-    UNIT_PPFD,
 )
+from .plant_daylight import dummy_illuminance
+from .plant_history import RollingWindow
+from .plant_instrumentation import METRIC_EVALUATION, METRIC_METER_EVENT, instrumented
+from .plant_light import LightIntegral
+from .plant_state import parse_value
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -124,22 +139,28 @@ async def async_setup_entry(
         humidity=pcurh,
     )
 
-    # Create and add the integral-entities
-    # Must be run after the sensors are added to the plant
-
-    pcurppfd = PlantCurrentPpfd(hass, entry, plant)
-    async_add_entities([pcurppfd])
-
-    pintegral = PlantTotalLightIntegral(hass, entry, pcurppfd, plant)
-    async_add_entities([pintegral], update_before_add=True)
-
-    plant.add_calculations(pcurppfd, pintegral)
+    # The PPFD and its integral used to be separate entities.  They are now
+    # calculated by the DLI sensor itself, so remove them from the registry.
+    entity_registry = er.async_get(hass)
+    for unique_id in (
+        f"{entry.entry_id}-current-ppfd",
+        f"{entry.entry_id}-ppfd-integral",
+    ):
+        entity_id = entity_registry.async_get_entity_id(
+            DOMAIN_SENSOR, DOMAIN, unique_id
+        )
+        if entity_id is not None:
+            _LOGGER.info("Removing %s, it is no longer needed", entity_id)
+            entity_registry.async_remove(entity_id)
 
-    pdli = PlantDailyLightIntegral(hass, entry, pintegral, plant)
-    async_add_entities(new_entities=[pdli], update_before_add=True)
+    # Must be run after the sensors are added to the plant
+    pdli = PlantDailyLightIntegral(hass, entry, plant)
+    async_add_entities([pdli])
 
     plant.add_dli(dli=pdli)
 
+    async_add_entities([PlantInstrumentationSensor(hass, entry, plant)])
+
     return True
 
 
@@ -151,6 +172,13 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 class PlantCurrentStatus(RestoreSensor):
     """Parent class for the meter classes below"""
 
+    # The metric of the plant this meter provides the readings for
+    _metric: str | None = None
+    # Change with almost every reading, and can be computed from the history
+    _unrecorded_attributes = frozenset(
+        {ATTR_HISTORY_MAX, ATTR_HISTORY_MIN, ATTR_HISTORY_MEAN}
+    )
+
     def __init__(
         self, hass: HomeAssistant, config: ConfigEntry, plantdevice: Entity
     ) -> None:
@@ -161,6 +189,13 @@ class PlantCurrentStatus(RestoreSensor):
         self._plant = plantdevice
         self._tracker = []
         self._follow_external = True
+        # Rolling min/max/mean of the readings of the external sensor
+        self._history = RollingWindow()
+        # Whether the external sensor stopped reporting
+        self._stale = False
+        # The timeout the stale timer was armed with
+        self._stale_timeout = None
+        self._timers = hass.data[DATA_TIMERS]
         # self._conf_check_days = self._plant.check_days
         self.entity_id = async_generate_entity_id(
             f"{DOMAIN}.{{}}", self.name, current_ids={}
@@ -193,23 +228,103 @@ class PlantCurrentStatus(RestoreSensor):
         if self._external_sensor:
             attributes = {
                 "external_sensor": self.external_sensor,
-                # "history_max": self._history.max,
-                # "history_min": self._history.min,
             }
+            if self._metric is not None:
+                history = self.history
+                attributes[ATTR_HISTORY_MAX] = history["max"]
+                attributes[ATTR_HISTORY_MIN] = history["min"]
+                attributes[ATTR_HISTORY_MEAN] = history["mean"]
             return attributes
 
+    @property
+    def history(self) -> dict:
+        """Min, max and mean of the readings of the last HISTORY_WINDOW seconds"""
+        return self._history.stats()
+
     @property
     def external_sensor(self) -> str:
         """The external sensor we are tracking"""
         return self._external_sensor
 
+    @property
+    def available(self) -> bool:
+        """Unavailable when the external sensor has not reported for too long"""
+        return not self._stale
+
+    @callback
+    def async_arm_stale_timer(self) -> None:
+        """Start watching the external sensor for silence"""
+        key = (DATA_TIMERS, self.unique_id)
+        timeout = self._plant.stale_timeout
+        if self._metric is None or not self.external_sensor or not timeout:
+            self._timers.async_cancel(key)
+            if self._stale:
+                self._async_set_stale(False)
+            return
+        if self._timers.scheduled(key) and timeout == self._stale_timeout:
+            return
+        # A new timeout counts from the last report, not from now
+        self._stale_timeout = timeout
+        state = self._hass.states.get(self.external_sensor)
+        age = time.time() - state.last_reported_timestamp if state else 0
+        self._timers.async_schedule_in(
+            key, max(timeout - age, 0), self._async_check_stale
+        )
+
+    @callback
+    def _async_check_stale(self, now: float) -> float | None:
+        """Check if the external sensor is silent, and when to check again"""
+        timeout = self._plant.stale_timeout
+        if not timeout or not self.external_sensor or self.hass is None:
+            if self._stale:
+                self._async_set_stale(False)
+            return None
+        state = self._hass.states.get(self.external_sensor)
+        age = time.time() - state.last_reported_timestamp if state else timeout
+        if age < timeout:
+            if self._stale:
+                self._async_set_stale(False)
+            return now + timeout - age
+        if not self._stale:
+            self._async_set_stale(True)
+        return now + STALE_RECHECK
+
+    @callback
+    def _async_set_stale(self, stale: bool) -> None:
+        """Mark the meter as stale, or as reporting again"""
+        self._stale = stale
+        if stale:
+            _LOGGER.info(
+                "%s has not reported for %s hours",
+                self.external_sensor,
+                round(self._plant.stale_timeout / 3600, 1),
+            )
+            self._attr_native_value = self._default_state
+            self._plant.metrics[self._metric].set_stale()
+            self._hass.data[DATA_ENGINE].async_schedule_evaluation()
+        elif self.external_sensor:
+            _LOGGER.info("%s is reporting again", self.external_sensor)
+            self.state_changed(
+                self.external_sensor, self._hass.states.get(self.external_sensor)
+            )
+        if self.hass is not None:
+            self.async_write_ha_state()
+
     def replace_external_sensor(self, new_sensor: str | None) -> None:
         """Modify the external sensor"""
         _LOGGER.info("Setting %s external sensor to %s", self.entity_id, new_sensor)
         # pylint: disable=attribute-defined-outside-init
+        if new_sensor != getattr(self, "_external_sensor", None):
+            # The readings of the old sensor say nothing about the new one
+            self._history = RollingWindow()
+            self._stale = False
         self._external_sensor = new_sensor
+        if new_sensor is None:
+            self._attr_native_value = self._default_state
+            self._publish()
         self.async_track_entity(self.entity_id)
         self.async_track_entity(self.external_sensor)
+        self.async_arm_stale_timer()
 
         self.async_write_ha_state()
 
@@ -241,9 +356,17 @@ class PlantCurrentStatus(RestoreSensor):
         async_dispatcher_connect(
             self._hass, DATA_UPDATED, self._schedule_immediate_update
         )
+        self.async_arm_stale_timer()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop watching the external sensor"""
+        self._timers.async_cancel((DATA_TIMERS, self.unique_id))
 
     async def async_update(self) -> None:
         """Set state and unit to the parent sensor state and unit"""
+        if self._stale:
+            # Keep the reading unknown until the sensor reports again
+            return
         if self.external_sensor:
             try:
                 self._attr_native_value = float(
@@ -281,12 +404,21 @@ class PlantCurrentStatus(RestoreSensor):
                 self._default_state,
             )
             self._attr_native_value = self._default_state
+        self._publish()
+
+    def _publish(self) -> None:
+        """Hand the current reading over to the plant"""
+        if self._metric is not None:
+            self._plant.metrics[self._metric].set_value(
+                self._attr_native_value, self._attr_native_unit_of_measurement
+            )
 
     @callback
     def _schedule_immediate_update(self):
         self.async_schedule_update_ha_state(True)
 
     @callback
+    @instrumented(METRIC_METER_EVENT)
     def _state_changed_event(self, event):
         """Sensor state change event."""
         self.state_changed(event.data.get("entity_id"), event.data.get("new_state"))
@@ -314,17 +446,28 @@ class PlantCurrentStatus(RestoreSensor):
             and new_state.state != STATE_UNAVAILABLE
         ):
             self._attr_native_value = new_state.state
+            if entity_id == self.external_sensor and self._stale:
+                self._stale = False
+            if entity_id == self.external_sensor:
+                value = parse_value(new_state.state)
+                if value is not None:
+                    self._history.add(value)
+                    if self._metric is not None:
+                        self._plant.async_reading(self._metric, value)
             if ATTR_UNIT_OF_MEASUREMENT in new_state.attributes:
                 self._attr_native_unit_of_measurement = new_state.attributes[
                     ATTR_UNIT_OF_MEASUREMENT
                 ]
         else:
             self._attr_native_value = self._default_state
+        self._publish()
 
 
 class PlantCurrentIlluminance(PlantCurrentStatus):
     """Entity class for the current illuminance meter"""
 
+    _metric = ATTR_ILLUMINANCE
+
     def __init__(
         self, hass: HomeAssistant, config: ConfigEntry, plantdevice: Entity
     ) -> None:
@@ -349,6 +492,8 @@ class PlantCurrentIlluminance(PlantCurrentStatus):
 class PlantCurrentConductivity(PlantCurrentStatus):
     """Entity class for the current conductivity meter"""
 
+    _metric = ATTR_CONDUCTIVITY
+
     def __init__(
         self, hass: HomeAssistant, config: ConfigEntry, plantdevice: Entity
     ) -> None:
@@ -374,6 +519,8 @@ class PlantCurrentConductivity(PlantCurrentStatus):
 class PlantCurrentMoisture(PlantCurrentStatus):
     """Entity class for the current moisture meter"""
 
+    _metric = ATTR_MOISTURE
+
     def __init__(
         self, hass: HomeAssistant, config: ConfigEntry, plantdevice: Entity
     ) -> None:
@@ -397,6 +544,8 @@ class PlantCurrentMoisture(PlantCurrentStatus):
 class PlantCurrentTemperature(PlantCurrentStatus):
     """Entity class for the current temperature meter"""
 
+    _metric = ATTR_TEMPERATURE
+
     def __init__(
         self, hass: HomeAssistant, config: ConfigEntry, plantdevice: Entity
     ) -> None:
@@ -420,6 +569,8 @@ class PlantCurrentTemperature(PlantCurrentStatus):
 class PlantCurrentAirTemperature(PlantCurrentStatus):
     """Entity class for the current air temperature meter"""
 
+    _metric = ATTR_AIR_TEMPERATURE
+
     def __init__(self, hass: HomeAssistant, config: ConfigEntry, plantdevice: Entity) -> None:
         """Initialize the sensor"""
         self._attr_name = (
@@ -441,6 +592,8 @@ class PlantCurrentAirTemperature(PlantCurrentStatus):
 class PlantCurrentHumidity(PlantCurrentStatus):
     """Entity class for the current humidity meter"""
 
+    _metric = ATTR_HUMIDITY
+
     def __init__(
         self, hass: HomeAssistant, config: ConfigEntry, plantdevice: Entity
     ) -> None:
@@ -460,179 +613,145 @@ class PlantCurrentHumidity(PlantCurrentStatus):
         return SensorDeviceClass.HUMIDITY
 
 
-class PlantCurrentPpfd(PlantCurrentStatus):
-    """Entity reporting current PPFD calculated from LX"""
+class PlantDailyLightIntegral(RestoreSensor):
+    """Entity class to calculate Daily Light Integral from the illuminance
+
+    The illuminance readings are converted to PPFD and integrated in memory,
+    instead of through separate PPFD and integral entities, so only the DLI
+    itself ends up in the recorder.  Its state is written at most once every
+    DLI_WRITE_INTERVAL seconds, and when the day ends.
+    """
+
+    _attr_icon = ICON_DLI
+    _attr_native_unit_of_measurement = UNIT_DLI
+    _attr_state_class = SensorStateClass.TOTAL
 
     def __init__(
         self, hass: HomeAssistant, config: ConfigEntry, plantdevice: Entity
     ) -> None:
         """Initialize the sensor"""
-        self._attr_name = f"{config.data[FLOW_PLANT_INFO][ATTR_NAME]} {READING_PPFD}"
-
-        self._attr_unique_id = f"{config.entry_id}-current-ppfd"
-        self._attr_unit_of_measurement = UNIT_PPFD
-        self._attr_native_unit_of_measurement = UNIT_PPFD
-
+        self._hass = hass
+        self._config = config
         self._plant = plantdevice
-
-        self._external_sensor = self._plant.sensor_illuminance.entity_id
-        self._attr_icon = ICON_PPFD
-        super().__init__(hass, config, plantdevice)
-        self._follow_unit = False
+        self._timers = hass.data[DATA_TIMERS]
+        self._attr_name = f"{config.data[FLOW_PLANT_INFO][ATTR_NAME]} {READING_DLI}"
+        self._attr_unique_id = f"{config.entry_id}-dli"
         self.entity_id = async_generate_entity_id(
             f"{DOMAIN_SENSOR}.{{}}", self.name, current_ids={}
         )
+        # The light of today so far, and of the day before, in mol/m²
+        self._integral = LightIntegral()
+        self._last_period: float | None = None
+        self._attr_last_reset = dt_util.start_of_local_day()
+        self._written: float | None = None
 
     @property
     def device_class(self) -> str:
-        """Device class"""
-        return None
+        return ATTR_DLI
 
     @property
-    def entity_category(self) -> str:
-        """The entity category"""
-        return EntityCategory.DIAGNOSTIC
+    def device_info(self) -> dict:
+        """Device info for devices"""
+        return {
+            "identifiers": {(DOMAIN, self._plant.unique_id)},
+        }
 
     @property
-    def entity_registry_visible_default(self) -> str:
-        return False
-
-    def ppfd(self, value: float | int | str) -> float | str:
-        """
-        Returns a calculated PPFD-value from the lx-value
-
-        See https://community.home-assistant.io/t/light-accumulation-for-xiaomi-flower-sensor/111180/3
-        https://www.apogeeinstruments.com/conversion-ppfd-to-lux/
-        μmol/m²/s
-        """
-        if value is not None and value != STATE_UNAVAILABLE and value != STATE_UNKNOWN:
-            value = float(value) * DEFAULT_LUX_TO_PPFD / 1000000
-        else:
-            value = None
+    def native_value(self) -> float:
+        """The light of today so far"""
+        return round(self._integral.total, 2)
 
-        return value
-
-    async def async_update(self) -> None:
-        """Run on every update to allow for changes from the GUI and service call"""
-        if not self.hass.states.get(self.entity_id):
-            return
-        if self.external_sensor != self._plant.sensor_illuminance.entity_id:
-            self.replace_external_sensor(self._plant.sensor_illuminance.entity_id)
-        if self.external_sensor:
-            external_sensor = self.hass.states.get(self.external_sensor)
-            if external_sensor:
-                self._attr_native_value = self.ppfd(external_sensor.state)
-            else:
-                self._attr_native_value = None
-        else:
-            self._attr_native_value = None
-
-    @callback
-    def state_changed(self, entity_id: str, new_state: str) -> None:
-        """Run on every update to allow for changes from the GUI and service call"""
-        if not self.hass.states.get(self.entity_id):
-            return
-        if self._external_sensor != self._plant.sensor_illuminance.entity_id:
-            self.replace_external_sensor(self._plant.sensor_illuminance.entity_id)
-        if self.external_sensor:
-            external_sensor = self.hass.states.get(self.external_sensor)
-            if external_sensor:
-                self._attr_native_value = self.ppfd(external_sensor.state)
-            else:
-                self._attr_native_value = None
-        else:
-            self._attr_native_value = None
+    @property
+    def extra_state_attributes(self) -> dict:
+        """The same attributes the utility meter used to have"""
+        return {
+            ATTR_LAST_PERIOD: self._last_period,
+            ATTR_LAST_RESET: self._attr_last_reset.isoformat(),
+        }
 
+    async def async_added_to_hass(self) -> None:
+        """Restore the light of today, also from the old utility meter"""
+        await super().async_added_to_hass()
+        state = await self.async_get_last_state()
+        if state is not None:
+            total = parse_value(state.state)
+            last_period = parse_value(state.attributes.get(ATTR_LAST_PERIOD))
+            last_reset = dt_util.parse_datetime(
+                str(state.attributes.get(ATTR_LAST_RESET))
+            )
+            if last_reset is not None and last_reset < self._attr_last_reset:
+                # The day ended while we were not running
+                last_period = total
+                total = None
+            self._integral.total = total or 0.0
+            self._last_period = last_period
+        self._publish()
+        self._timers.async_schedule_in(
+            (DATA_TIMERS, self.unique_id),
+            self._seconds_until_reset(),
+            self._async_reset,
+        )
 
-class PlantTotalLightIntegral(IntegrationSensor):
-    """Entity class to calculate PPFD from LX"""
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop the daily reset"""
+        self._timers.async_cancel((DATA_TIMERS, self.unique_id))
 
-    def __init__(
-        self,
-        hass: HomeAssistant,
-        config: ConfigEntry,
-        illuminance_ppfd_sensor: Entity,
-        plantdevice: Entity,
-    ) -> None:
-        """Initialize the sensor"""
-        super().__init__(
-            integration_method=METHOD_TRAPEZOIDAL,
-            name=f"{config.data[FLOW_PLANT_INFO][ATTR_NAME]} Total {READING_PPFD} Integral",
-            round_digits=2,
-            source_entity=illuminance_ppfd_sensor.entity_id,
-            unique_id=f"{config.entry_id}-ppfd-integral",
-            unit_prefix=None,
-            unit_time=UnitOfTime.SECONDS,
-            max_sub_interval=None,
-        )
-        self._unit_of_measurement = UNIT_DLI
-        self._attr_icon = ICON_DLI
-        self.entity_id = async_generate_entity_id(
-            f"{DOMAIN_SENSOR}.{{}}", self.name, current_ids={}
-        )
-        self._plant = plantdevice
+    @staticmethod
+    def _seconds_until_reset() -> float:
+        """Seconds until the next local midnight"""
+        now = dt_util.now()
+        midnight = dt_util.start_of_local_day(now.date() + timedelta(days=1))
+        return max(1.0, (midnight - now).total_seconds())
 
-    @property
-    def entity_category(self) -> str:
-        """The entity category"""
-        return EntityCategory.DIAGNOSTIC
+    @callback
+    def async_add_illuminance(self, value: float) -> None:
+        """Add the light since the previous illuminance reading"""
+        now = self._timers.time()
+        self._integral.add(value, now)
+        if self.hass is None:
+            return
+        if self._written is None or now - self._written >= DLI_WRITE_INTERVAL:
+            self._written = now
+            self.async_write_ha_state()
 
-    @property
-    def device_info(self) -> dict:
-        """Device info for devices"""
-        return {
-            "identifiers": {(DOMAIN, self._plant.unique_id)},
-        }
+    @callback
+    def _async_reset(self, now: float) -> float:
+        """Hand the light of the day that ended over to the plant"""
+        self._last_period = round(self._integral.close(now), 2)
+        self._attr_last_reset = dt_util.start_of_local_day()
+        self._publish()
+        self._hass.data[DATA_ENGINE].async_schedule_evaluation()
+        if self.hass is not None:
+            self._written = now
+            self.async_write_ha_state()
+        return now + self._seconds_until_reset()
 
-    @property
-    def entity_registry_visible_default(self) -> str:
-        return False
+    def _publish(self) -> None:
+        """Hand the DLI of the previous day over to the plant"""
+        self._plant.metrics[ATTR_DLI].set_value(self._last_period)
 
-    def _unit(self, source_unit: str) -> str:
-        """Override unit"""
-        return self._unit_of_measurement
 
+class PlantInstrumentationSensor(SensorEntity):
+    """Number of evaluations of the plant, with timing details as attributes"""
 
-class PlantDailyLightIntegral(UtilityMeterSensor):
-    """Entity class to calculate Daily Light Integral from PPDF"""
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_icon = ICON_INSTRUMENTATION
 
     def __init__(
-        self,
-        hass: HomeAssistant,
-        config: ConfigEntry,
-        illuminance_integration_sensor: Entity,
-        plantdevice: Entity,
+        self, hass: HomeAssistant, config: ConfigEntry, plantdevice: Entity
     ) -> None:
         """Initialize the sensor"""
-
-        super().__init__(
-            cron_pattern=None,
-            delta_values=None,
-            meter_offset=timedelta(seconds=0),
-            meter_type=DAILY,
-            name=f"{config.data[FLOW_PLANT_INFO][ATTR_NAME]} {READING_DLI}",
-            net_consumption=None,
-            parent_meter=config.entry_id,
-            source_entity=illuminance_integration_sensor.entity_id,
-            tariff_entity=None,
-            tariff=None,
-            unique_id=f"{config.entry_id}-dli",
-            sensor_always_available=True,
-            suggested_entity_id=None,
-            periodically_resetting=True,
+        self._config = config
+        self._plant = plantdevice
+        self._attr_name = (
+            f"{config.data[FLOW_PLANT_INFO][ATTR_NAME]} {READING_INSTRUMENTATION}"
         )
+        self._attr_unique_id = f"{config.entry_id}-instrumentation"
         self.entity_id = async_generate_entity_id(
             f"{DOMAIN_SENSOR}.{{}}", self.name, current_ids={}
         )
 
-        self._unit_of_measurement = UNIT_DLI
-        self._attr_icon = ICON_DLI
-        self._plant = plantdevice
-
-    @property
-    def device_class(self) -> str:
-        return ATTR_DLI
-
     @property
     def device_info(self) -> dict:
         """Device info for devices"""
@@ -640,6 +759,16 @@ class PlantDailyLightIntegral(UtilityMeterSensor):
             "identifiers": {(DOMAIN, self._plant.unique_id)},
         }
 
+    async def async_update(self) -> None:
+        """Read the numbers from the instrumentation"""
+        instrumentation = self.hass.data[DATA_INSTRUMENTATION]
+        metrics = instrumentation.entry_as_dict(self._config.entry_id)
+        self._attr_native_value = metrics.get(METRIC_EVALUATION, {}).get("count", 0)
+        self._attr_extra_state_attributes = {
+            "enabled": instrumentation.enabled,
+            **metrics,
+        }
+
 
 class PlantDummyStatus(SensorEntity):
     """Simple dummy sensors. Parent class"""
@@ -685,12 +814,7 @@ class PlantDummyIlluminance(PlantDummyStatus):
 
     async def async_update(self) -> int:
         """Give out a dummy value"""
-        if datetime.now().hour < 5:
-            self._attr_native_value = random.randint(1, 10) * 100
-        elif datetime.now().hour < 15:
-            self._attr_native_value = random.randint(20, 50) * 1000
-        else:
-            self._attr_native_value = random.randint(1, 10) * 100
+        self._attr_native_value = dummy_illuminance(datetime.now())
 
     @property
     def device_class(self) -> str:
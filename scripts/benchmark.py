@@ -0,0 +1,140 @@
+"""Benchmark the plant integration against a real Home Assistant core
+
+Needs pytest-homeassistant-custom-component, which installs a matching
+version of Home Assistant:
+
+    pip install pytest-homeassistant-custom-component
+    python scripts/benchmark.py --plants 1 100 1000
+
+For every number of plants a new Home Assistant is started in a temporary
+config directory.  The plants are created by the load generator through the
+import flow and async_setup_entry, reloaded once, and then the virtual
+moisture sensors are fed readings, which goes through the state_changed
+listener of the meters, the plant and the evaluation of the status.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Callable
+import itertools
+import json
+import os
+import sys
+import tempfile
+import time
+from typing import Any
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Readings that cross the default moisture limits now and then
+MOISTURE_READINGS = ("41.5", "40", "39.75", "unavailable", "18.2", "unknown", "65")
+
+
+def _measure(func: Callable[[], Any], iterations: int) -> dict[str, float]:
+    """Call func a number of times and return the timing in µs per call"""
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return {
+        "calls": iterations,
+        "mean_us": round(sum(timings) / iterations * 1e6, 2),
+        "median_us": round(timings[iterations // 2] * 1e6, 2),
+        "p95_us": round(timings[int(iterations * 0.95)] * 1e6, 2),
+        "max_us": round(timings[-1] * 1e6, 2),
+    }
+
+
+async def _async_benchmark(plants: int, readings: int) -> dict[str, Any]:
+    """Set up a number of plants in a new Home Assistant and measure it"""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant import loader
+    from homeassistant.setup import async_setup_component
+    from pytest_homeassistant_custom_component.common import (
+        async_test_home_assistant,
+    )
+
+    from custom_components.plant.const import ATTR_MOISTURE, ATTR_PLANT, DOMAIN
+    from custom_components.plant.plant_loadgen import PlantLoadGenerator
+
+    results: dict[str, Any] = {"plants": plants}
+    with tempfile.TemporaryDirectory() as config_dir:
+        async with async_test_home_assistant(config_dir=config_dir) as hass:
+            hass.data.pop(loader.DATA_CUSTOM_COMPONENTS, None)
+            assert await async_setup_component(hass, DOMAIN, {})
+
+            generator = PlantLoadGenerator(hass, plants, rate=1)
+            generator.async_start()
+            generator.async_stop()
+
+            start = time.perf_counter()
+            await generator.async_create_plants()
+            await hass.async_block_till_done()
+            results["setup_s"] = round(time.perf_counter() - start, 3)
+            loaded = [
+                data[ATTR_PLANT]
+                for data in hass.data[DOMAIN].values()
+                if ATTR_PLANT in data
+            ]
+            if len(loaded) != plants:
+                raise RuntimeError(f"Set up {len(loaded)} of {plants} plants")
+
+            entries = hass.config_entries.async_entries(DOMAIN)
+            start = time.perf_counter()
+            for entry in entries:
+                await hass.config_entries.async_reload(entry.entry_id)
+            await hass.async_block_till_done()
+            results["reload_s"] = round(time.perf_counter() - start, 3)
+
+            sensors = itertools.cycle(
+                generator.sensor_entity_id(plant, ATTR_MOISTURE)
+                for plant in range(plants)
+            )
+            values = itertools.cycle(MOISTURE_READINGS)
+
+            def _reading() -> None:
+                entity_id = next(sensors)
+                state = hass.states.get(entity_id)
+                hass.states.async_set(entity_id, next(values), state.attributes)
+
+            start = time.perf_counter()
+            results["state_changed"] = _measure(_reading, readings)
+            # The evaluation and the state writes coalesced by the readings
+            await hass.async_block_till_done()
+            results["state_changed_total_us"] = round(
+                (time.perf_counter() - start) / readings * 1e6, 2
+            )
+    return results
+
+
+def main() -> None:
+    """Run the benchmark and print, or store, the results"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--plants", type=int, nargs="+", default=[1, 100, 1000])
+    parser.add_argument("--readings", type=int, default=10000)
+    parser.add_argument("--output", help="append the run to this JSON file")
+    args = parser.parse_args()
+
+    sys.path.insert(0, REPO)
+    results = [
+        asyncio.run(_async_benchmark(plants, args.readings))
+        for plants in sorted(set(args.plants))
+    ]
+    print(json.dumps(results, indent=2))
+
+    if args.output:
+        runs = []
+        if os.path.exists(args.output):
+            with open(args.output, encoding="utf-8") as results_file:
+                runs = json.load(results_file)
+        runs.append({"time": time.strftime("%Y-%m-%dT%H:%M:%S"), "runs": results})
+        with open(args.output, "w", encoding="utf-8") as results_file:
+            json.dump(runs, results_file, indent=2)
+
+
+if __name__ == "__main__":
+    main()